@@ -3,7 +3,7 @@ from .models import (
     Watch, Music, FilmCollection, BookCollection, GameCollection,
     Wardrobe, Art, ExtrasCategory, 
     Extra, Film, Book,
-    Instrument, List, LivePerformance
+    Instrument, List, LivePerformance, Job
 )
 
 # Register your models here.
@@ -96,4 +96,9 @@ class ListAdmin(admin.ModelAdmin):
 @admin.register(LivePerformance)
 class LivePerformanceAdmin(admin.ModelAdmin):
     list_display = ("title", "creator", "performance_type")
-    search_fields = ("title", "creator", "performance_type", "original_language", "locatio_seen")
\ No newline at end of file
+    search_fields = ("title", "creator", "performance_type", "original_language", "locatio_seen")
+
+@admin.register(Job)
+class JobAdmin(admin.ModelAdmin):
+    list_display = ("id", "kind", "status", "processed", "total", "worker", "created_at", "finished_at")
+    list_filter = ("kind", "status")
@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class CollectionsSiteConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'collections_site'
+
+    def ready(self):
+        from . import signals  # noqa: F401
@@ -0,0 +1,30 @@
+import asyncio
+from asgiref.sync import sync_to_async
+from django.db import close_old_connections
+
+
+def _run_in_worker(func, args, kwargs):
+    # Worker threads don't see request_started/finished, which is where
+    # Django normally recycles expired or broken connections
+    close_old_connections()
+    try:
+        return func(*args, **kwargs)
+    finally:
+        close_old_connections()
+
+
+async def run_query(func, *args, **kwargs):
+    """
+    Runs a synchronous ORM function in a worker thread with its own
+    database connection, so independent queries can overlap. The request's
+    context (replica routing, instrumentation) is carried into the thread.
+    """
+    return await sync_to_async(_run_in_worker, thread_sensitive=False)(func, args, kwargs)
+
+
+async def gather_queries(*calls):
+    """
+    Runs (func, *args) calls concurrently with run_query and returns their
+    results in order.
+    """
+    return await asyncio.gather(*(run_query(func, *args) for func, *args in calls))
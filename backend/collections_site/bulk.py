@@ -0,0 +1,181 @@
+from collections import defaultdict
+from django.db import IntegrityError, models, transaction
+from rest_framework.exceptions import ValidationError
+from .caching import invalidate
+
+BULK_MAX_ITEMS = 1000
+DUPLICATE_ERROR = "Duplicate value within this request."
+
+
+def parse_bulk_payload(data):
+    """
+    Checks the shape of a bulk request body:
+    {"create": [{...}], "update": [{"id": 1, ...}], "delete": [1, 2]}
+    """
+    if not isinstance(data, dict):
+        raise ValidationError({"detail": "Expected an object with create/update/delete arrays."})
+    creates = data.get("create") or []
+    updates = data.get("update") or []
+    deletes = data.get("delete") or []
+    for key, value in (("create", creates), ("update", updates), ("delete", deletes)):
+        if not isinstance(value, list):
+            raise ValidationError({key: "Expected an array."})
+    if len(creates) + len(updates) + len(deletes) > BULK_MAX_ITEMS:
+        raise ValidationError({"detail": f"At most {BULK_MAX_ITEMS} items per request."})
+    if any(not isinstance(item, dict) for item in creates + updates):
+        raise ValidationError({"detail": "create and update items must be objects."})
+    ids = [item.get("id") for item in updates] + deletes
+    if any(not isinstance(pk, int) or isinstance(pk, bool) for pk in ids):
+        raise ValidationError({"detail": "update items need an integer id and delete takes integer ids."})
+    return creates, updates, deletes
+
+
+def unique_field_sets(model):
+    """
+    Returns the field-name tuples that must be unique across rows: unique
+    fields other than the primary key and unconditional UniqueConstraints.
+    """
+    sets = [(field.name,) for field in model._meta.concrete_fields if field.unique and not field.primary_key]
+    for constraint in model._meta.constraints:
+        if isinstance(constraint, models.UniqueConstraint) and constraint.fields and constraint.condition is None:
+            sets.append(tuple(constraint.fields))
+    sets.extend(tuple(fields) for fields in model._meta.unique_together)
+    return sets
+
+
+def find_duplicates(model, rows):
+    """
+    Checks rows that are each valid on their own against each other.
+    `rows` is a list of (key, values) where values maps field names to the
+    values the row will have once written. Returns {key: errors} for rows
+    that share a unique value with another row; NULLs never collide.
+    """
+    errors = {}
+    for fields in unique_field_sets(model):
+        seen = defaultdict(list)
+        for key, values in rows:
+            value = tuple(values.get(field) for field in fields)
+            if None not in value:
+                seen[value].append(key)
+        for keys in seen.values():
+            if len(keys) > 1:
+                for key in keys:
+                    errors.setdefault(key, {})[fields[0] if len(fields) == 1 else "non_field_errors"] = [DUPLICATE_ERROR]
+    return errors
+
+
+def bulk_write(view, data):
+    """
+    Validates every create/update/delete in `data` with the view's serializer
+    and, if all of them are valid, applies them in one transaction: one
+    bulk_create, one bulk_update and one DELETE ... IN. Nothing is written
+    when any item is invalid, items clash with each other on a unique field
+    or the database rejects the batch.
+
+    Returns (ok, results) where results holds a per-item status for each
+    section, in request order.
+    """
+    creates, updates, deletes = parse_bulk_payload(data)
+    # The view's base queryset, without the filters get_queryset applies
+    # from query params
+    queryset = view.queryset.all()
+    model = queryset.model
+    ok = True
+
+    create_results, new_objects = [], []
+    for index, item in enumerate(creates):
+        serializer = view.get_serializer(data=item)
+        if serializer.is_valid():
+            new_objects.append(model(**serializer.validated_data))
+            create_results.append({"index": index, "status": "valid"})
+        else:
+            ok = False
+            create_results.append({"index": index, "status": "invalid", "errors": serializer.errors})
+
+    existing = queryset.in_bulk([item["id"] for item in updates])
+    update_results, changed, update_fields = [], [], set()
+    update_ids = set()
+    for item in updates:
+        pk = item["id"]
+        instance = existing.get(pk)
+        if pk in update_ids:
+            ok = False
+            update_results.append({"id": pk, "status": "invalid", "errors": {"id": ["Updated more than once in this request."]}})
+            continue
+        update_ids.add(pk)
+        if instance is None:
+            ok = False
+            update_results.append({"id": pk, "status": "not found"})
+            continue
+        data = {key: value for key, value in item.items() if key != "id"}
+        serializer = view.get_serializer(instance, data=data, partial=True)
+        if not serializer.is_valid():
+            ok = False
+            update_results.append({"id": pk, "status": "invalid", "errors": serializer.errors})
+            continue
+        for attr, value in serializer.validated_data.items():
+            setattr(instance, attr, value)
+        update_fields.update(serializer.validated_data)
+        changed.append(instance)
+        update_results.append({"id": pk, "status": "valid"})
+
+    found_deletes = set(queryset.filter(pk__in=deletes).values_list("pk", flat=True)) if deletes else set()
+    delete_results = []
+    for pk in deletes:
+        if pk in found_deletes:
+            delete_results.append({"id": pk, "status": "valid"})
+        else:
+            ok = False
+            delete_results.append({"id": pk, "status": "not found"})
+
+    # Each item was only validated against the database; two items of the
+    # same request can still claim the same unique value
+    fields = {name for field_set in unique_field_sets(model) for name in field_set}
+    valid_creates = [result for result in create_results if result["status"] == "valid"]
+    rows = [
+        (("create", result["index"]), {name: getattr(obj, name) for name in fields})
+        for result, obj in zip(valid_creates, new_objects)
+    ]
+    rows += [
+        (("update", obj.pk), {name: getattr(obj, name) for name in fields})
+        for obj in changed
+    ]
+    duplicates = find_duplicates(model, rows)
+    for result in valid_creates:
+        if ("create", result["index"]) in duplicates:
+            ok = False
+            result.update(status="invalid", errors=duplicates[("create", result["index"])])
+    for result in update_results:
+        if result["status"] == "valid" and ("update", result["id"]) in duplicates:
+            ok = False
+            result.update(status="invalid", errors=duplicates[("update", result["id"])])
+
+    results = {"create": create_results, "update": update_results, "delete": delete_results}
+    if not ok:
+        return False, results
+
+    try:
+        with transaction.atomic():
+            created = model.objects.bulk_create(new_objects) if new_objects else []
+            if changed and update_fields:
+                model.objects.bulk_update(changed, sorted(update_fields))
+            if found_deletes:
+                # Goes through the delete collector, so cascades and the
+                # post_delete signals still run
+                queryset.filter(pk__in=found_deletes).delete()
+            view.after_bulk_write(created, changed, update_fields)
+    except IntegrityError as e:
+        # e.g. a row written by another request since validation
+        results["detail"] = f"Rejected by the database, nothing was written: {e}"
+        return False, results
+
+    # bulk_create/bulk_update skip the post_save signals
+    invalidate(model)
+
+    for result, obj in zip(create_results, created):
+        result.update(status="created", id=obj.pk)
+    for result in update_results:
+        result["status"] = "updated"
+    for result in delete_results:
+        result["status"] = "deleted"
+    return True, results
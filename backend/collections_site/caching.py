@@ -0,0 +1,145 @@
+import functools
+import hashlib
+import secrets
+import time
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.http import HttpResponse
+from django.utils.cache import get_conditional_response, patch_vary_headers
+from django.utils.http import http_date
+from .db_routers import consistent_reads
+from .diagnostics import diagnostics_mode
+
+VERSION_KEY_PREFIX = "model-version"
+RESPONSE_KEY_PREFIX = "response"
+
+
+def version_key(model):
+    return f"{VERSION_KEY_PREFIX}:{model._meta.label_lower}"
+
+
+def new_version():
+    # "<nanosecond timestamp>.<random>": unique across processes, and the
+    # timestamp doubles as the Last-Modified time
+    return f"{time.time_ns()}.{secrets.token_hex(4)}"
+
+
+def invalidate(*models):
+    """
+    Bumps the version of each model, which orphans every cached response
+    built from it. Signals call this on save/delete; bulk writes that skip
+    signals (bulk_create, bulk_update, queryset.update) must call it too.
+    The bump waits for the surrounding transaction to commit; bumping
+    earlier would let a concurrent GET cache the old rows under the new
+    version. Outside a transaction it happens immediately.
+    """
+    transaction.on_commit(
+        lambda: cache.set_many({version_key(model): new_version() for model in models}, None)
+    )
+
+
+def get_versions(models):
+    """
+    Returns {model: version} for `models`, creating versions that are
+    missing (e.g. after the cache was cleared).
+    """
+    keys = {version_key(model): model for model in models}
+    found = cache.get_many(list(keys))
+    for key in set(keys) - set(found):
+        cache.add(key, new_version(), None)
+        found[key] = cache.get(key) or new_version()
+    return {model: found[key] for key, model in keys.items()}
+
+
+def last_modified(versions):
+    # Whole seconds, the resolution of HTTP dates
+    return max(int(version.split(".")[0]) for version in versions.values()) // 10**9
+
+
+def response_cache_key(request, versions):
+    params = sorted(request.query_params.lists())
+    raw = "|".join([
+        request.path,
+        repr(params),
+        request.accepted_media_type or "",
+        *sorted(f"{model._meta.label_lower}={version}" for model, version in versions.items()),
+    ])
+    return f"{RESPONSE_KEY_PREFIX}:{hashlib.sha1(raw.encode('utf-8')).hexdigest()}"
+
+
+def etag_for(content):
+    return f'"{hashlib.sha1(content).hexdigest()}"'
+
+
+def set_cache_headers(response, etag, modified):
+    response["ETag"] = etag
+    response["Last-Modified"] = http_date(modified)
+    response["Cache-Control"] = "no-cache"
+    patch_vary_headers(response, ["Accept"])
+
+
+def cache_response(method):
+    """
+    Decorates a GET ViewSet handler with conditional requests and a shared
+    cache of rendered bodies. The cache key covers the path, query params,
+    media type and the versions of the view's `get_cache_models()`, so any
+    write to those models invalidates it. Cached and fresh responses carry
+    a strong ETag and Last-Modified, and matching If-None-Match /
+    If-Modified-Since requests get 304 Not Modified.
+    The view must call `finalize_cached_response` from finalize_response.
+    """
+    @functools.wraps(method)
+    def wrapper(self, request, *args, **kwargs):
+        if request.method not in ("GET", "HEAD"):
+            return method(self, request, *args, **kwargs)
+
+        versions = get_versions(self.get_cache_models())
+        key = response_cache_key(request, versions)
+        modified = last_modified(versions)
+        cached = cache.get(key)
+        if cached is not None:
+            if diagnostics_mode(request):
+                # A hit skips the handler, so log the queryset it would have run
+                self.filter_queryset(self.get_queryset())
+            content, content_type, etag = cached
+            not_modified = get_conditional_response(request, etag=etag, last_modified=modified)
+            if not_modified is not None:
+                set_cache_headers(not_modified, etag, modified)
+                return not_modified
+            response = HttpResponse(content, content_type=content_type)
+            set_cache_headers(response, etag, modified)
+            response["X-Response-Cache"] = "hit"
+            return response
+
+        with consistent_reads(modified):
+            response = method(self, request, *args, **kwargs)
+        response.response_cache_key = key
+        response.response_last_modified = modified
+        return response
+    return wrapper
+
+
+def finalize_cached_response(request, response):
+    """
+    Renders a fresh response produced by a `cache_response` handler, stores
+    it and adds its validators. Returns the response to send (a 304 when the
+    client's copy is current).
+    """
+    key = getattr(response, "response_cache_key", None)
+    if key is None or response.status_code != 200:
+        return response
+
+    response.render()
+    etag = etag_for(response.content)
+    modified = response.response_last_modified
+    timeout = settings.CONFIG.get("RESPONSE_CACHE_TIMEOUT")
+    if timeout:
+        cache.set(key, (response.content, response["Content-Type"], etag), timeout)
+
+    not_modified = get_conditional_response(request, etag=etag, last_modified=modified)
+    if not_modified is not None:
+        response = not_modified
+    set_cache_headers(response, etag, modified)
+    response["X-Response-Cache"] = "miss"
+    return response
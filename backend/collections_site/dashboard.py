@@ -0,0 +1,91 @@
+import hashlib
+from django.core.cache import cache
+from django.db.models import Count, Q, Sum
+from .caching import get_versions, last_modified
+from .db_routers import consistent_reads
+from .models import (
+    Watch, Music, FilmCollection, BookCollection,
+    Wardrobe, GameCollection, Art, Extra, Film, Book,
+    Instrument, List, LivePerformance
+)
+
+DASHBOARD_KEY_PREFIX = "dashboard"
+DASHBOARD_CACHE_TIMEOUT = 60 * 60 * 24
+
+# Owned collections: counts are split into owned and wishlist (not owned)
+# and prices are summed for each side
+OWNED_COLLECTIONS = {
+    "watches": Watch,
+    "music": Music,
+    "film-collections": FilmCollection,
+    "book-collections": BookCollection,
+    "wardrobe": Wardrobe,
+    "games": GameCollection,
+    "art": Art,
+    "extra": Extra,
+    "instruments": Instrument,
+}
+
+# Tracked collections: counts per boolean status field
+TRACKED_COLLECTIONS = {
+    "films": (Film, ["seen", "watchlist", "favourite"]),
+    "books": (Book, ["read", "readlist", "favourite"]),
+    "performances": (LivePerformance, ["seen"]),
+    "lists": (List, []),
+}
+
+DASHBOARD_MODELS = list(OWNED_COLLECTIONS.values()) + [
+    model for model, _ in TRACKED_COLLECTIONS.values()
+]
+
+
+def owned_summary(model):
+    totals = model.objects.order_by().aggregate(
+        total=Count("id"),
+        owned_count=Count("id", filter=Q(owned=True)),
+        wishlist_count=Count("id", filter=Q(owned=False)),
+        owned_value=Sum("price", filter=Q(owned=True)),
+        wishlist_value=Sum("price", filter=Q(owned=False)),
+    )
+    for key in ("owned_value", "wishlist_value"):
+        totals[key] = str(totals[key] or 0)
+    return totals
+
+
+def tracked_summary(model, flags):
+    return model.objects.order_by().aggregate(
+        total=Count("id"),
+        **{f"{flag}_count": Count("id", filter=Q(**{flag: True})) for flag in flags},
+    )
+
+
+def build_dashboard():
+    """
+    Per-collection totals for the home page: one aggregate query per model,
+    each returning every count and price sum for that collection.
+    """
+    collections = {key: owned_summary(model) for key, model in OWNED_COLLECTIONS.items()}
+    collections.update(
+        {key: tracked_summary(model, flags) for key, (model, flags) in TRACKED_COLLECTIONS.items()}
+    )
+    return {
+        "total": sum(summary["total"] for summary in collections.values()),
+        "collections": collections,
+    }
+
+
+def get_dashboard():
+    """
+    Returns the dashboard payload, cached under the current versions of the
+    models it covers so any write to them (see caching.invalidate) rebuilds it.
+    """
+    versions = get_versions(DASHBOARD_MODELS)
+    raw = "|".join(sorted(f"{model._meta.label_lower}={version}" for model, version in versions.items()))
+    key = f"{DASHBOARD_KEY_PREFIX}:{hashlib.sha1(raw.encode('utf-8')).hexdigest()}"
+
+    dashboard = cache.get(key)
+    if dashboard is None:
+        with consistent_reads(last_modified(versions)):
+            dashboard = build_dashboard()
+        cache.set(key, dashboard, DASHBOARD_CACHE_TIMEOUT)
+    return dashboard
@@ -0,0 +1,171 @@
+import hashlib
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.core.cache import cache
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import DEFAULT_DB_ALIAS, connections
+
+PRIMARY_DB = DEFAULT_DB_ALIAS
+REPLICA_DB = "replica"
+STICKY_KEY_PREFIX = "db-primary"
+SAFE_METHODS = ("GET", "HEAD", "OPTIONS")
+# The DatabaseCache table holds model versions and must never be read stale
+CACHE_APP_LABEL = "django_cache"
+
+_state = ContextVar("db_routing", default=None)
+
+
+class RoutingState:
+    """
+    Where the current request reads from, and whether it has written
+    anything. Outside of requests (management commands, the jobs worker)
+    there is no state and everything uses the primary.
+    """
+
+    def __init__(self, read_db):
+        self.read_db = read_db
+        self.wrote = False
+
+
+def replica_configured():
+    return REPLICA_DB in settings.DATABASES
+
+
+@contextmanager
+def use_primary():
+    """
+    Sends every read in the block to the primary, e.g. for results that go
+    into the shared cache. A no-op outside of replica-routed requests.
+    """
+    state = _state.get()
+    if state is None:
+        yield
+        return
+    previous = state.read_db
+    state.read_db = PRIMARY_DB
+    try:
+        yield
+    finally:
+        if not state.wrote:
+            state.read_db = previous
+
+
+@contextmanager
+def consistent_reads(changed_at):
+    """
+    Uses the primary in the block if the data changed (`changed_at`, epoch
+    seconds) within the stickiness window, when the replica may not have
+    the change yet. Wraps anything cached under model versions, so a lagging
+    replica can't store stale data under a current version.
+    """
+    window = settings.CONFIG.get("DATABASE_REPLICA_STICKY_SECONDS", 0)
+    if time.time() - changed_at <= window:
+        with use_primary():
+            yield
+    else:
+        yield
+
+
+class ReplicaRouter:
+    """
+    Sends reads made while handling safe (GET/HEAD/OPTIONS) requests to the
+    replica and everything else to the primary: writes, reads in unsafe
+    requests, reads inside a transaction and reads after the request has
+    written. Clients that wrote recently are pinned to the primary by
+    ReplicaRoutingMiddleware, so they read their own writes.
+    """
+
+    def db_for_read(self, model, **hints):
+        state = _state.get()
+        if state is None or model._meta.app_label == CACHE_APP_LABEL:
+            return PRIMARY_DB
+        if state.read_db != PRIMARY_DB and connections[PRIMARY_DB].in_atomic_block:
+            return PRIMARY_DB
+        return state.read_db
+
+    def db_for_write(self, model, **hints):
+        state = _state.get()
+        if state is not None and model._meta.app_label != CACHE_APP_LABEL:
+            state.wrote = True
+            state.read_db = PRIMARY_DB
+        return PRIMARY_DB
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # Both aliases hold the same data
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        # The replica gets its schema through replication
+        return db == PRIMARY_DB
+
+
+def client_key(request, user):
+    """
+    Identifies the client for stickiness: the user when logged in,
+    otherwise the address the request came from.
+    """
+    if user is not None and user.is_authenticated:
+        client = f"user:{user.pk}"
+    else:
+        forwarded = request.headers.get("X-Forwarded-For", "")
+        client = f"ip:{forwarded.split(',')[0].strip() or request.META.get('REMOTE_ADDR', '')}"
+    return f"{STICKY_KEY_PREFIX}:{hashlib.sha1(client.encode('utf-8')).hexdigest()}"
+
+
+class ReplicaRoutingMiddleware:
+    """
+    Active only when a replica database is configured. Safe requests read
+    from the replica unless the client wrote within the last
+    DATABASE_REPLICA_STICKY_SECONDS; any request that writes pins its client
+    to the primary for that long. The marker lives in the shared cache so
+    it holds across workers, and works without cookies for the
+    cross-origin frontend. Works under WSGI and ASGI.
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        if not replica_configured():
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        self.sticky_seconds = settings.CONFIG["DATABASE_REPLICA_STICKY_SECONDS"]
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        key = client_key(request, getattr(request, "user", None))
+        state = RoutingState(self.read_db(request, cache.get(key)))
+        token = _state.set(state)
+        try:
+            response = self.get_response(request)
+        finally:
+            _state.reset(token)
+        if self.should_stick(request, state):
+            cache.set(key, True, self.sticky_seconds)
+        return response
+
+    async def __acall__(self, request):
+        user = await request.auser() if hasattr(request, "auser") else None
+        key = client_key(request, user)
+        state = RoutingState(self.read_db(request, await cache.aget(key)))
+        token = _state.set(state)
+        try:
+            response = await self.get_response(request)
+        finally:
+            _state.reset(token)
+        if self.should_stick(request, state):
+            await cache.aset(key, True, self.sticky_seconds)
+        return response
+
+    def read_db(self, request, sticky):
+        if request.method in SAFE_METHODS and not sticky:
+            return REPLICA_DB
+        return PRIMARY_DB
+
+    def should_stick(self, request, state):
+        return bool(self.sticky_seconds) and (state.wrote or request.method not in SAFE_METHODS)
@@ -0,0 +1,48 @@
+import logging
+from django.conf import settings
+from django.db import connections
+
+logger = logging.getLogger(__name__)
+
+DIAGNOSTICS_HEADER = "X-Query-Diagnostics"
+SAMPLE_SIZE = 5
+
+
+def diagnostics_mode(request):
+    """
+    Returns the diagnostics mode for a request: None (off, the default),
+    "on" or "analyze". CONFIG["QUERY_DIAGNOSTICS"] turns them on for every
+    request; staff users can ask for them per request with the
+    X-Query-Diagnostics header ("1" or "analyze").
+    """
+    header = request.headers.get(DIAGNOSTICS_HEADER, "").strip().lower()
+    if header and getattr(request.user, "is_staff", False):
+        return "analyze" if header == "analyze" else "on"
+    if settings.CONFIG.get("QUERY_DIAGNOSTICS"):
+        return "on"
+    return None
+
+
+def diagnose_queryset(request, queryset, label=None):
+    """
+    Logs the row count, query plan and a sample of primary keys for
+    `queryset` when diagnostics are on for `request`. Otherwise it does
+    nothing, so callers never pay for the extra queries.
+    """
+    mode = diagnostics_mode(request)
+    if mode is None:
+        return
+
+    label = label or f"{request.method} {request.path}"
+    options = {}
+    if mode == "analyze" and connections[queryset.db].vendor == "postgresql":
+        options = {"analyze": True, "buffers": True}
+    try:
+        count = queryset.count()
+        plan = queryset.explain(**options)
+        sample = list(queryset.values_list("pk", flat=True)[:SAMPLE_SIZE])
+    except Exception as e:
+        logger.warning(f"Diagnostics failed for {label}: {e}")
+        return
+
+    logger.info(f"{label}: {count} rows, sample pks {sample}\nSQL: {queryset.query}\nPlan:\n{plan}")
@@ -0,0 +1,94 @@
+from django.db import connections
+from django.db.models import Q
+from django.db.models.expressions import RawSQL
+from rest_framework.filters import BaseFilterBackend, SearchFilter
+from .search import search_queryset, uses_postgres_search
+
+
+def json_array_contains(queryset, field_name, value):
+    """
+    Returns a Q matching rows whose JSON array field contains `value`.
+    Postgres uses jsonb containment (@>), which is served by the GIN
+    jsonb_path_ops indexes. SQLite has no JSON containment lookup, so the
+    array is expanded with json_each instead.
+    """
+    connection = connections[queryset.db]
+    if connection.vendor == "postgresql":
+        return Q(**{f"{field_name}__contains": [value]})
+
+    opts = queryset.model._meta
+    qn = connection.ops.quote_name
+    table = qn(opts.db_table)
+    pk = qn(opts.pk.column)
+    column = qn(opts.get_field(field_name).column)
+    return Q(pk__in=RawSQL(
+        f"SELECT {table}.{pk} FROM {table}, json_each({table}.{column}) "
+        f"WHERE json_each.value = %s",
+        (value,),
+    ))
+
+
+def json_array_filter(queryset, field_name, any_of=(), all_of=(), exclude=()):
+    """
+    Filters a JSON array field (e.g. genre or tags) with any-of, all-of and
+    exclude semantics. Empty arguments are ignored.
+    """
+    if any_of:
+        condition = Q()
+        for value in any_of:
+            condition |= json_array_contains(queryset, field_name, value)
+        queryset = queryset.filter(condition)
+
+    if all_of:
+        if connections[queryset.db].vendor == "postgresql":
+            queryset = queryset.filter(**{f"{field_name}__contains": list(all_of)})
+        else:
+            for value in all_of:
+                queryset = queryset.filter(json_array_contains(queryset, field_name, value))
+
+    for value in exclude:
+        queryset = queryset.exclude(json_array_contains(queryset, field_name, value))
+
+    return queryset
+
+
+class JSONArrayFilter(BaseFilterBackend):
+    """
+    Filters the JSON array fields named in `view.json_array_fields`.
+    For a field such as `genre`:
+        ?genre=Drama&genre=Comedy    any of (also ?genre=Drama,Comedy)
+        ?genre__all=Drama,Comedy     all of
+        ?genre__exclude=Horror       none of
+    Matching is exact on array elements.
+    """
+
+    def get_values(self, request, param):
+        values = []
+        for raw in request.query_params.getlist(param):
+            values.extend(v.strip() for v in raw.split(",") if v.strip())
+        return values
+
+    def filter_queryset(self, request, queryset, view):
+        for field_name in getattr(view, "json_array_fields", ()):
+            queryset = json_array_filter(
+                queryset,
+                field_name,
+                any_of=self.get_values(request, field_name) + self.get_values(request, f"{field_name}__any"),
+                all_of=self.get_values(request, f"{field_name}__all"),
+                exclude=self.get_values(request, f"{field_name}__exclude"),
+            )
+        return queryset
+
+
+class RankedSearchFilter(SearchFilter):
+    """
+    SearchFilter that uses ranked full-text/trigram search on Postgres
+    (see search.search_queryset) and the stock icontains search elsewhere.
+    """
+
+    def filter_queryset(self, request, queryset, view):
+        query = request.query_params.get(self.search_param, "")
+        search_fields = self.get_search_fields(view, request)
+        if not query.strip() or not search_fields or not uses_postgres_search(queryset):
+            return super().filter_queryset(request, queryset, view)
+        return search_queryset(queryset, query, search_fields)
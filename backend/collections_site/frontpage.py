@@ -0,0 +1,116 @@
+import random
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Count, Max, Min
+from .asyncdb import gather_queries, run_query
+from .db_routers import use_primary
+from .models import Film
+from .serializers import FilmSerializer
+
+FRONTPAGE_CACHE_KEY = "films:frontpage"
+FRONTPAGE_CACHE_TIMEOUT = 60 * 60  # Reshuffle the random pools at least hourly
+FRONTPAGE_SIZE = 5
+POOL_SIZE = 40
+SCAN_LIMIT = 5000
+
+# Fields shown on the films dashboard; a change to any of them invalidates it
+FRONTPAGE_FIELDS = FilmSerializer.Meta.summary_fields
+
+
+def sample_ids(queryset, k):
+    """
+    Picks up to `k` random ids from `queryset` without ORDER BY RANDOM().
+    Small sets are read from the index in full and sampled in Python. Large
+    sets are probed at random points of the id range, each probe being a
+    single indexed `id >= x` lookup.
+    """
+    stats = queryset.aggregate(low=Min("id"), high=Max("id"), total=Count("id"))
+    if not stats["total"]:
+        return []
+    if stats["total"] <= SCAN_LIMIT:
+        ids = list(queryset.values_list("id", flat=True))
+        return random.sample(ids, min(k, len(ids)))
+
+    picked = set()
+    for _ in range(k * 2):
+        pivot = random.randint(stats["low"], stats["high"])
+        found = queryset.filter(id__gte=pivot).order_by("id").values_list("id", flat=True).first()
+        if found is not None:
+            picked.add(found)
+        if len(picked) >= k:
+            break
+    return list(picked)
+
+
+def recent_ids():
+    return list(
+        Film.objects.filter(date_watched__isnull=False)
+        .order_by("-date_watched")
+        .values_list("id", flat=True)[:FRONTPAGE_SIZE]
+    )
+
+
+def serialize_pools(pools):
+    pools = {key: ids for key, ids in pools.items() if ids}
+    wanted = {film_id for ids in pools.values() for film_id in ids}
+    films = Film.objects.filter(id__in=wanted).only(*FRONTPAGE_FIELDS)
+    serialized = {
+        row["id"]: row for row in FilmSerializer(films, many=True, fields=FRONTPAGE_FIELDS).data
+    }
+    return {
+        key: [serialized[film_id] for film_id in ids if film_id in serialized]
+        for key, ids in pools.items()
+    }
+
+
+async def abuild_frontpage_pools():
+    """
+    Builds the cached candidate pools for the films dashboard: random samples
+    of the watchlist and favourites, the most recently watched films and, if
+    all of those are empty, a random sample of the whole library. The three
+    pool queries run concurrently.
+    """
+    watchlist, favourites, recent = await gather_queries(
+        (sample_ids, Film.objects.filter(watchlist=True), POOL_SIZE),
+        (sample_ids, Film.objects.filter(favourite=True), POOL_SIZE),
+        (recent_ids,),
+    )
+    pools = {"watchlist": watchlist, "favourites": favourites, "recent": recent}
+    if not any(pools.values()):
+        pools = {"fallback": await run_query(sample_ids, Film.objects.all(), POOL_SIZE)}
+    return await run_query(serialize_pools, pools)
+
+
+def pick_frontpage(pools):
+    result = {}
+    for key, films in pools.items():
+        if key == "recent":
+            result[key] = films
+        else:
+            result[key] = random.sample(films, min(FRONTPAGE_SIZE, len(films)))
+    return result
+
+
+async def aget_frontpage():
+    """
+    Returns the films dashboard payload. The pools come from the cache (no
+    queries on a hit); watchlist, favourites and fallback are re-sampled
+    from their pools on every call.
+    """
+    pools = await cache.aget(FRONTPAGE_CACHE_KEY)
+    if pools is None:
+        # Rebuilt after every film write, so read it from the primary
+        with use_primary():
+            pools = await abuild_frontpage_pools()
+        await cache.aset(FRONTPAGE_CACHE_KEY, pools, FRONTPAGE_CACHE_TIMEOUT)
+    return pick_frontpage(pools)
+
+
+def invalidate_frontpage():
+    """
+    Drops the cached pools once the surrounding transaction commits, like
+    caching.invalidate(); dropping them earlier would let a concurrent
+    request rebuild them from the rows before the write. Outside a
+    transaction it happens immediately.
+    """
+    transaction.on_commit(lambda: cache.delete(FRONTPAGE_CACHE_KEY))
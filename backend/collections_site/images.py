@@ -0,0 +1,360 @@
+import functools
+import hashlib
+import io
+import ipaddress
+import logging
+import os
+import re
+import socket
+import tempfile
+import threading
+import time
+from pathlib import Path
+from urllib.parse import urljoin, urlsplit
+import requests
+from requests.adapters import HTTPAdapter
+from django.conf import settings
+from django.core import signing
+from django.urls import reverse
+
+try:
+    from PIL import Image, ImageOps
+except ImportError:  # Pillow is optional; without it only TMDb's own sizes are served locally
+    Image = ImageOps = None
+
+logger = logging.getLogger(__name__)
+
+# Variant name -> maximum width in pixels
+VARIANTS = {"thumb": 185, "card": 342, "full": 1280}
+# The closest size TMDb publishes for each variant
+TMDB_SIZES = {"thumb": "w185", "card": "w342", "full": "w1280"}
+FORMATS = {"webp": "image/webp", "jpg": "image/jpeg"}
+DEFAULT_FORMAT = "webp"
+QUALITY = 80
+
+TOKEN_SALT = "collections_site.images"
+FETCH_TIMEOUT = 15
+MAX_SOURCE_BYTES = 30 * 1024 * 1024
+MAX_REDIRECTS = 3
+# Sources that failed to download are not retried for this long (per process)
+FAILURE_TTL = 10 * 60
+MAX_FAILURES = 1000
+TMDB_IMAGE_PATH = re.compile(r"^/t/p/[^/]+/(?P<file>[^/]+)$")
+
+
+@functools.lru_cache(maxsize=4096)
+def source_token(url):
+    """
+    Signs a source URL so the image endpoint only fetches URLs the API
+    handed out, rather than acting as an open proxy. Sources are still
+    user-supplied, so download() also refuses internal hosts.
+    """
+    # Not timestamped, so a source always maps to the same URL
+    return signing.Signer(salt=TOKEN_SALT).sign_object(url, compress=True)
+
+
+def source_from_token(token):
+    # Raises signing.BadSignature for tampered or foreign tokens
+    return signing.Signer(salt=TOKEN_SALT).unsign_object(token)
+
+
+@functools.lru_cache(maxsize=None)
+def variant_url_prefix():
+    # "/api/images/", reversed once rather than for every row
+    return reverse("image_variant", args=["thumb", DEFAULT_FORMAT]).rsplit("/", 1)[0] + "/"
+
+
+def variant_url_template(url, image_format=DEFAULT_FORMAT):
+    """
+    Returns the URL of an image's resized copies with a `{variant}`
+    placeholder for thumb, card or full, e.g.
+    "/api/images/{variant}.webp?s=<token>". One template (and one signed
+    token) covers every variant. The URL embeds the signed source, so it
+    changes whenever the source does and can be cached by browsers forever.
+    None when the image cache is disabled.
+    """
+    if not url or not settings.CONFIG.get("IMAGE_CACHE_DIR"):
+        return None
+    return f"{variant_url_prefix()}{{variant}}.{image_format}?s={source_token(url)}"
+
+
+def tmdb_sized_url(url, variant):
+    """
+    Rewrites an image.tmdb.org URL (usually /t/p/original/...) to TMDb's
+    own resized copy for the variant, or returns None for other hosts.
+    """
+    parts = urlsplit(url)
+    if parts.hostname != "image.tmdb.org":
+        return None
+    match = TMDB_IMAGE_PATH.match(parts.path)
+    if not match:
+        return None
+    return f"https://image.tmdb.org/t/p/{TMDB_SIZES[variant]}/{match['file']}"
+
+
+def public_address(hostname):
+    """
+    Returns an address `hostname` resolves to, provided every address it
+    resolves to is publicly routable, and None otherwise. Image sources are
+    user-supplied, so private, loopback, link-local and other internal
+    addresses must never be fetched.
+    """
+    if not hostname:
+        return None
+    try:
+        # Scope ids ("fe80::1%eth0") aren't part of the address
+        addresses = [info[4][0].split("%")[0] for info in socket.getaddrinfo(hostname, None)]
+    except (socket.gaierror, UnicodeError):
+        return None
+    if not addresses or not all(ipaddress.ip_address(address).is_global for address in addresses):
+        return None
+    return addresses[0]
+
+
+class PinnedAddressAdapter(HTTPAdapter):
+    """
+    Connects to an address that was already checked instead of resolving
+    the hostname again, which a DNS rebinding attack could answer with an
+    internal address. TLS still uses the hostname for SNI and certificate
+    checks.
+    """
+
+    def __init__(self, hostname, address, **kwargs):
+        self.hostname = hostname
+        self.address = address
+        super().__init__(**kwargs)
+
+    def build_connection_pool_key_attributes(self, request, verify, cert=None):
+        host_params, pool_kwargs = super().build_connection_pool_key_attributes(request, verify, cert)
+        host_params["host"] = self.address
+        if host_params["scheme"] == "https":
+            pool_kwargs["server_hostname"] = self.hostname
+            pool_kwargs["assert_hostname"] = self.hostname
+        return host_params, pool_kwargs
+
+
+def download(url):
+    """
+    Fetches an image, refusing non-HTTP URLs, hosts that resolve to
+    non-public addresses, non-image responses and bodies larger than
+    MAX_SOURCE_BYTES. Each request goes to the address that was checked.
+    Redirects are followed by hand (at most MAX_REDIRECTS) so every hop
+    gets the same checks. Returns the bytes or None.
+    """
+    try:
+        for _ in range(MAX_REDIRECTS + 1):
+            parts = urlsplit(url)
+            if parts.scheme not in ("http", "https"):
+                return None
+            address = public_address(parts.hostname)
+            if address is None:
+                logger.warning(f"Image fetch {url} refused: host is not public")
+                return None
+            host = f"[{parts.hostname}]" if ":" in parts.hostname else parts.hostname
+            if parts.port is not None:
+                host = f"{host}:{parts.port}"
+            with requests.Session() as session:
+                # Proxies from the environment would resolve the host themselves
+                session.trust_env = False
+                session.mount(f"{parts.scheme}://", PinnedAddressAdapter(parts.hostname, address))
+                with session.get(
+                    url, headers={"Host": host}, stream=True, timeout=FETCH_TIMEOUT, allow_redirects=False
+                ) as response:
+                    if response.is_redirect:
+                        url = urljoin(url, response.headers["Location"])
+                        continue
+                    if response.status_code != 200:
+                        logger.warning(f"Image fetch {url} failed: {response.status_code}")
+                        return None
+                    if not response.headers.get("Content-Type", "").startswith("image/"):
+                        logger.warning(f"Image fetch {url} returned {response.headers.get('Content-Type')}")
+                        return None
+                    chunks, size = [], 0
+                    for chunk in response.iter_content(64 * 1024):
+                        size += len(chunk)
+                        if size > MAX_SOURCE_BYTES:
+                            logger.warning(f"Image {url} is larger than {MAX_SOURCE_BYTES} bytes")
+                            return None
+                        chunks.append(chunk)
+                    return b"".join(chunks)
+        logger.warning(f"Image fetch {url} failed: too many redirects")
+        return None
+    except requests.RequestException as e:
+        logger.warning(f"Image fetch {url} failed: {e}")
+        return None
+
+
+def resize(data, width, image_format):
+    """
+    Scales image bytes down to `width` (never up) and encodes them as
+    WebP or JPEG. Returns None if Pillow is missing or can't read the data.
+    """
+    if Image is None:
+        return None
+    try:
+        with Image.open(io.BytesIO(data)) as image:
+            image = ImageOps.exif_transpose(image)
+            if image.width > width:
+                image = image.resize((width, max(1, round(image.height * width / image.width))), Image.LANCZOS)
+            if image_format == "jpg" or image.mode not in ("RGB", "RGBA"):
+                image = image.convert("RGB")
+            output = io.BytesIO()
+            image.save(output, "WEBP" if image_format == "webp" else "JPEG", quality=QUALITY, optimize=True)
+            return output.getvalue()
+    except Exception as e:
+        logger.warning(f"Could not resize image: {e}")
+        return None
+
+
+class ImageCache:
+    """
+    On-disk store of resized image variants under <root>/<variant>/.
+    Each source is downloaded once (kept under <root>/source/ until
+    evicted) and every variant is derived from it; TMDb images are fetched
+    at TMDb's nearest size instead of the original. The store is bounded
+    by `max_bytes`, evicting the least recently used files (by mtime,
+    refreshed on every hit).
+    """
+
+    def __init__(self, root, max_bytes=512 * 1024 * 1024):
+        self.root = Path(root)
+        self.max_bytes = max_bytes
+        self.lock = threading.Lock()
+        self._bytes = None
+        self.failures = {}
+
+    def _path(self, folder, url, suffix):
+        digest = hashlib.sha1(url.encode("utf-8")).hexdigest()
+        return self.root / folder / f"{digest}.{suffix}"
+
+    def _read(self, path):
+        try:
+            data = path.read_bytes()
+            os.utime(path)  # Mark as recently used
+            return data
+        except OSError:
+            return None
+
+    def _write(self, path, data):
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"Could not write image cache entry {path}: {e}")
+            return
+        with self.lock:
+            self._bytes = self.size() if self._bytes is None else self._bytes + len(data)
+            over = self._bytes > self.max_bytes
+        if over:
+            self.evict()
+
+    def _record_failure(self, url):
+        now = time.monotonic()
+        with self.lock:
+            self.failures.pop(url, None)
+            self.failures[url] = now
+            if len(self.failures) > MAX_FAILURES:
+                # Drop expired entries, then the oldest (dicts keep insertion order)
+                for key in [key for key, failed in self.failures.items() if now - failed >= FAILURE_TTL]:
+                    del self.failures[key]
+                while len(self.failures) > MAX_FAILURES:
+                    del self.failures[next(iter(self.failures))]
+
+    def source(self, url, variant):
+        tmdb_url = tmdb_sized_url(url, variant)
+        if tmdb_url:
+            fetch_url, path = tmdb_url, self._path("source", tmdb_url, "img")
+        else:
+            fetch_url, path = url, self._path("source", url, "img")
+        data = self._read(path)
+        if data is None:
+            if time.monotonic() - self.failures.get(fetch_url, -FAILURE_TTL) < FAILURE_TTL:
+                return None, bool(tmdb_url)
+            data = download(fetch_url)
+            if data is None:
+                self._record_failure(fetch_url)
+            else:
+                with self.lock:
+                    self.failures.pop(fetch_url, None)
+                self._write(path, data)
+        return data, bool(tmdb_url)
+
+    def get(self, url, variant, image_format=DEFAULT_FORMAT):
+        """
+        Returns (path, content type) of the variant, creating it on first
+        use, or None when it can't be produced (the caller should fall back
+        to the source URL).
+        """
+        path = self._path(variant, url, image_format)
+        if path.exists():
+            try:
+                os.utime(path)
+            except OSError:
+                pass
+            return path, FORMATS[image_format]
+
+        data, from_tmdb = self.source(url, variant)
+        if data is None:
+            return None
+        resized = resize(data, VARIANTS[variant], image_format)
+        if resized is None:
+            if not from_tmdb:
+                return None
+            # No Pillow: TMDb's pre-sized JPEG is still far smaller than the original
+            path = self._path(variant, url, "jpg")
+            if not path.exists():
+                self._write(path, data)
+            return path, FORMATS["jpg"]
+        self._write(path, resized)
+        return path, FORMATS[image_format]
+
+    def _entries(self):
+        for file_path in self.root.glob("*/*"):
+            if file_path.suffix == ".tmp":
+                continue
+            try:
+                stat = file_path.stat()
+            except OSError:
+                continue
+            yield file_path, stat.st_mtime, stat.st_size
+
+    def size(self):
+        return sum(size for _, _, size in self._entries())
+
+    def evict(self, target_ratio=0.9):
+        """
+        Removes least recently used files until the store is below
+        `target_ratio` of max_bytes. Returns the number of files removed.
+        """
+        entries = sorted(self._entries(), key=lambda e: e[1])
+        total = sum(size for _, _, size in entries)
+        target = self.max_bytes * target_ratio
+        removed = 0
+        for file_path, _, size in entries:
+            if total <= target:
+                break
+            try:
+                file_path.unlink()
+            except OSError:
+                continue
+            total -= size
+            removed += 1
+        with self.lock:
+            self._bytes = total
+        return removed
+
+
+_cache = None
+
+
+def get_image_cache():
+    global _cache
+    if _cache is None:
+        _cache = ImageCache(
+            settings.CONFIG["IMAGE_CACHE_DIR"],
+            max_bytes=settings.CONFIG["IMAGE_CACHE_MAX_MB"] * 1024 * 1024,
+        )
+    return _cache
@@ -0,0 +1,137 @@
+import codecs
+import csv
+import json
+from django.db import IntegrityError, transaction
+from rest_framework import serializers
+from .caching import invalidate
+
+IMPORT_BATCH_SIZE = 500
+# Per-row errors returned in a report; the counts always cover every row
+MAX_REPORTED_ERRORS = 500
+
+
+def format_for(filename, default="ndjson"):
+    name = (filename or "").lower()
+    if name.endswith(".csv"):
+        return "csv"
+    if name.endswith((".ndjson", ".jsonl")):
+        return "ndjson"
+    return default
+
+
+def read_rows(lines, file_format, json_fields=()):
+    """
+    Yields (line number, row) from an iterable of text lines. A row is a
+    dict, or an error string for lines that can't be parsed.
+    In CSV, empty cells are left out (so model defaults apply) and cells
+    of `json_fields` are decoded from JSON text when they parse.
+    """
+    if file_format == "csv":
+        reader = csv.DictReader(lines)
+        for row in reader:
+            values = {}
+            for key, value in row.items():
+                if key is None or value in (None, ""):
+                    continue
+                if key in json_fields:
+                    try:
+                        value = json.loads(value)
+                    except ValueError:
+                        pass
+                values[key] = value
+            yield reader.line_num, values
+        return
+
+    for number, line in enumerate(lines, start=1):
+        if not line.strip():
+            continue
+        try:
+            row = json.loads(line)
+        except ValueError as e:
+            yield number, f"Invalid JSON: {e}"
+            continue
+        yield number, row if isinstance(row, dict) else "Expected a JSON object"
+
+
+def decode_lines(binary_lines, encoding="utf-8-sig"):
+    return codecs.iterdecode(binary_lines, encoding)
+
+
+def json_fields_of(serializer):
+    return {name for name, field in serializer.fields.items() if isinstance(field, serializers.JSONField)}
+
+
+class ImportReport:
+    def __init__(self):
+        self.created = 0
+        self.failed = 0
+        self.errors = []
+
+    def error(self, line, errors):
+        self.failed += 1
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append({"line": line, "errors": errors})
+
+    def as_dict(self):
+        return {"created": self.created, "failed": self.failed, "errors": self.errors}
+
+
+def import_rows(view, rows, batch_size=IMPORT_BATCH_SIZE, dry_run=False):
+    """
+    Creates objects from (line number, row) pairs using the view's
+    serializer for validation. Valid rows are written with bulk_create, one
+    transaction per batch of `batch_size` rows; invalid rows are reported
+    and skipped without stopping the import. A batch the database rejects
+    (e.g. two rows with the same unique value) is retried row by row so
+    only the offending rows are reported. Models with many-to-many fields
+    (lists) are saved row by row through the serializer instead.
+    Returns an ImportReport.
+    """
+    model = view.queryset.model
+    row_by_row = bool(model._meta.many_to_many)
+    report = ImportReport()
+    batch = []
+
+    def write(serializers):
+        with transaction.atomic():
+            if row_by_row:
+                return [serializer.save() for serializer in serializers]
+            created = model.objects.bulk_create(
+                [model(**serializer.validated_data) for serializer in serializers]
+            )
+            view.after_bulk_write(created, [], set())
+            return created
+
+    def flush():
+        if not batch or dry_run:
+            report.created += len(batch)
+            batch.clear()
+            return
+        try:
+            report.created += len(write([serializer for _, serializer in batch]))
+        except IntegrityError:
+            for line, serializer in batch:
+                try:
+                    report.created += len(write([serializer]))
+                except IntegrityError as e:
+                    report.error(line, {"detail": f"Rejected by the database: {e}"})
+        batch.clear()
+
+    for line, row in rows:
+        if isinstance(row, str):
+            report.error(line, {"detail": row})
+            continue
+        row.pop("id", None)
+        serializer = view.get_serializer(data=row)
+        if not serializer.is_valid():
+            report.error(line, serializer.errors)
+            continue
+        batch.append((line, serializer))
+        if len(batch) >= batch_size:
+            flush()
+    flush()
+
+    if report.created and not dry_run and not row_by_row:
+        # bulk_create skips the post_save signals
+        invalidate(model)
+    return report
@@ -0,0 +1,153 @@
+import logging
+from datetime import timedelta
+from decimal import Decimal
+from django.core.exceptions import ValidationError
+from django.db import models, transaction
+from .caching import invalidate
+from .frontpage import invalidate_frontpage
+from .models import Film, FilmCredit
+
+logger = logging.getLogger(__name__)
+
+BULK_BATCH_SIZE = 200
+
+# Film fields filled from TMDb; a refresh overwrites these and leaves the
+# user's own fields (rating, watchlist, review, ...) alone
+TMDB_FIELDS = [
+    "title", "alt_title", "director", "alt_name", "cast", "crew", "industry_rating",
+    "series", "blurb", "synopsis", "language", "country", "poster", "background_pic",
+    "runtime", "genre", "budget", "box_office", "release_date",
+]
+
+
+def map_tmdb_film(data, **overrides):
+    """
+    Maps a TMDb movie payload (with credits) to Film field values.
+    `overrides` are applied on top, e.g. a rating from an import file.
+    """
+    credits = data.get("credits") or {}
+
+    runtime = None
+    runtime_value = data.get("runtime")
+    if runtime_value:
+        try:
+            runtime = timedelta(minutes=int(runtime_value))
+        except (ValueError, TypeError):
+            logger.warning(f"Invalid runtime for TMDb film {data.get('id')}: {runtime_value}")
+
+    # Find director's name and original_name
+    director_data = next(
+        (c for c in credits.get("crew", []) if c.get("job") == "Director"),
+        None
+    )
+    director_name = director_data.get("name") if director_data else None
+    director_original_name = director_data.get("original_name") if director_data else None
+    alt_name = director_original_name if director_original_name and director_original_name != director_name else None
+
+    fields = {
+        "tmdb_id": data.get("id"),
+        "title": data.get("title") or "Unknown Title",
+        "alt_title": data.get("original_title") if data.get("original_title") != data.get("title") else None,
+        "director": director_name or "",
+        "alt_name": alt_name,
+        "cast": [
+            {"actor": c.get("name"), "role": c.get("character") or ""}
+            for c in credits.get("cast", [])
+        ],
+        "crew": [
+            {"name": c.get("name"), "role": c.get("job") or ""}
+            for c in credits.get("crew", [])
+        ],
+        "industry_rating": round(float(data.get("vote_average") or 0.0), 1),
+        "series": data.get("belongs_to_collection", {}).get("name") if data.get("belongs_to_collection") else None,
+        "blurb": data.get("tagline"),
+        "synopsis": data.get("overview"),
+        "language": data.get("original_language"),
+        "country": ", ".join(data.get("origin_country", []) or []),
+        "poster": f"https://image.tmdb.org/t/p/original{data.get('poster_path')}" if data.get("poster_path") else None,
+        "background_pic": f"https://image.tmdb.org/t/p/original{data.get('backdrop_path')}" if data.get("backdrop_path") else None,
+        "runtime": runtime,
+        "genre": [g["name"] for g in data.get("genres", [])] or [],
+        "budget": data.get("budget") or 0,
+        "box_office": data.get("revenue") or 0,
+        "release_date": data.get("release_date") or None,
+    }
+    fields.update(overrides)
+
+    # Floats (TMDb's vote_average, imported ratings) become Decimals at the
+    # field's precision so they pass model validation
+    for field in Film._meta.concrete_fields:
+        value = fields.get(field.name)
+        if isinstance(field, models.DecimalField) and isinstance(value, float):
+            fields[field.name] = round(Decimal(str(value)), field.decimal_places)
+    return fields
+
+
+def upsert_films(rows, refresh=False, batch_size=BULK_BATCH_SIZE):
+    """
+    Writes mapped film rows (see map_tmdb_film) keyed by tmdb_id.
+    Existing tmdb_ids are resolved in one query and new films are inserted
+    with chunked bulk_create using ON CONFLICT (tmdb_id), so concurrent
+    imports of the same film never create duplicates. Existing films are
+    left alone unless `refresh` is set, in which case their TMDb fields are
+    updated in place.
+
+    Returns {tmdb_id: (status, detail)} with status "imported", "updated",
+    "duplicate" or "validation failed".
+    """
+    results = {}
+    unique_rows = {}
+    for row in rows:
+        tmdb_id = row.get("tmdb_id")
+        if tmdb_id is None or tmdb_id in unique_rows:
+            continue
+        unique_rows[tmdb_id] = row
+
+    existing = set(
+        Film.objects.filter(tmdb_id__in=list(unique_rows)).values_list("tmdb_id", flat=True)
+    )
+
+    films = []
+    for tmdb_id, row in unique_rows.items():
+        if tmdb_id in existing and not refresh:
+            results[tmdb_id] = ("duplicate", None)
+            continue
+        film = Film(**row)
+        try:
+            film.full_clean(validate_unique=False, validate_constraints=False)
+        except ValidationError as e:
+            logger.error(f"Validation failed for TMDb film {tmdb_id}: {e.message_dict}")
+            results[tmdb_id] = ("validation failed", {"errors": e.message_dict})
+            continue
+        films.append(film)
+
+    if not films:
+        return results
+
+    with transaction.atomic():
+        for start in range(0, len(films), batch_size):
+            batch = films[start:start + batch_size]
+            if refresh:
+                Film.objects.bulk_create(
+                    batch,
+                    update_conflicts=True,
+                    unique_fields=["tmdb_id"],
+                    update_fields=TMDB_FIELDS,
+                )
+            else:
+                Film.objects.bulk_create(batch, ignore_conflicts=True)
+
+        # bulk_create skips Film.save() and signals, so derive credits,
+        # refresh the dashboard and expire cached responses here
+        written = list(
+            Film.objects.filter(tmdb_id__in=[film.tmdb_id for film in films])
+            .only("id", "tmdb_id", *Film.CREDIT_FIELDS)
+        )
+        FilmCredit.rebuild_for(written)
+    invalidate_frontpage()
+    invalidate(Film)
+
+    for film in written:
+        status = "updated" if film.tmdb_id in existing else "imported"
+        results[film.tmdb_id] = (status, {"id": film.id})
+    return results
@@ -0,0 +1,187 @@
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections
+from django.db.backends.signals import connection_created
+
+# Samples kept per route for the percentiles (per process)
+METRICS_SAMPLES = 1000
+PERCENTILES = (50, 90, 99)
+
+_current = ContextVar("request_metrics", default=None)
+_routes = {}
+_routes_lock = threading.Lock()
+
+
+class RequestMetrics:
+    """
+    Counters for one request: SQL queries, time spent in the database and
+    time spent serializing (which includes any queries the serializers
+    trigger, so N+1 patterns show up as serialize_queries).
+    """
+
+    def __init__(self):
+        self.queries = 0
+        self.db_time = 0.0
+        self.serialize_time = 0.0
+        self.serialize_queries = 0
+        self.serialize_depth = 0
+        # Async views run queries from several threads at once
+        self.lock = threading.Lock()
+
+    def record_query(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            elapsed = time.perf_counter() - start
+            with self.lock:
+                self.db_time += elapsed
+                self.queries += 1
+                if self.serialize_depth:
+                    self.serialize_queries += 1
+
+
+def record_query(execute, sql, params, many, context):
+    """
+    Execute wrapper installed on every connection; counts the query against
+    the request in the current context. The context follows the request
+    into sync_to_async threads, so queries are counted whichever thread
+    runs them.
+    """
+    metrics = _current.get()
+    if metrics is None:
+        return execute(sql, params, many, context)
+    return metrics.record_query(execute, sql, params, many, context)
+
+
+def install_query_tracking(connection, **kwargs):
+    if record_query not in connection.execute_wrappers:
+        connection.execute_wrappers.append(record_query)
+
+
+@contextmanager
+def timed_serialization():
+    """
+    Adds the enclosed time to the current request's serializer time.
+    Nested serializers only count once. A no-op when instrumentation is off.
+    """
+    metrics = _current.get()
+    if metrics is None:
+        yield
+        return
+    metrics.serialize_depth += 1
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        metrics.serialize_depth -= 1
+        if not metrics.serialize_depth:
+            metrics.serialize_time += time.perf_counter() - start
+
+
+def route_name(request):
+    match = getattr(request, "resolver_match", None)
+    name = (match.view_name or match.route) if match else "unmatched"
+    return f"{request.method} {name}"
+
+
+def record_sample(route, sample):
+    with _routes_lock:
+        _routes.setdefault(route, deque(maxlen=METRICS_SAMPLES)).append(sample)
+
+
+def percentile(sorted_values, pct):
+    # Nearest-rank percentile
+    index = max(0, min(len(sorted_values) - 1, round(pct / 100 * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+def route_metrics():
+    """
+    Returns {route: {"count": n, "<metric>": {"p50": .., ...}}} over the
+    samples this process has recorded. Times are in milliseconds.
+    """
+    with _routes_lock:
+        snapshot = {route: list(samples) for route, samples in _routes.items()}
+    result = {}
+    for route, samples in sorted(snapshot.items()):
+        summary = {"count": len(samples)}
+        for metric in ("total_ms", "db_ms", "serialize_ms", "queries"):
+            values = sorted(sample[metric] for sample in samples)
+            summary[metric] = {f"p{pct}": percentile(values, pct) for pct in PERCENTILES}
+        result[route] = summary
+    return result
+
+
+def reset_metrics():
+    with _routes_lock:
+        _routes.clear()
+
+
+class ServerTimingMiddleware:
+    """
+    Opt-in (CONFIG["SERVER_TIMING"]) per-request instrumentation. Counts the
+    SQL queries and database time of every connection, times serializers
+    and the whole request, reports them in a Server-Timing header and keeps
+    per-route samples for the metrics endpoint. Works under WSGI and ASGI.
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        if not settings.CONFIG.get("SERVER_TIMING"):
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+        connection_created.connect(install_query_tracking)
+        for connection in connections.all(initialized_only=True):
+            install_query_tracking(connection)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        metrics = RequestMetrics()
+        token = _current.set(metrics)
+        start = time.perf_counter()
+        try:
+            response = self.get_response(request)
+        finally:
+            _current.reset(token)
+        return self.report(request, response, metrics, time.perf_counter() - start)
+
+    async def __acall__(self, request):
+        metrics = RequestMetrics()
+        token = _current.set(metrics)
+        start = time.perf_counter()
+        try:
+            response = await self.get_response(request)
+        finally:
+            _current.reset(token)
+        return self.report(request, response, metrics, time.perf_counter() - start)
+
+    def report(self, request, response, metrics, total):
+        sample = {
+            "total_ms": round(total * 1000, 2),
+            "db_ms": round(metrics.db_time * 1000, 2),
+            "serialize_ms": round(metrics.serialize_time * 1000, 2),
+            "queries": metrics.queries,
+        }
+        record_sample(route_name(request), sample)
+
+        response["Server-Timing"] = ", ".join([
+            f'db;dur={sample["db_ms"]};desc="{metrics.queries} queries"',
+            f'serialize;dur={sample["serialize_ms"]};desc="{metrics.serialize_queries} queries"',
+            f'total;dur={sample["total_ms"]}',
+        ])
+        # Lets the frontend's origin read the timings from the browser
+        origin = request.headers.get("Origin")
+        if origin and origin in getattr(settings, "CORS_ALLOWED_ORIGINS", []):
+            response["Timing-Allow-Origin"] = origin
+        return response
@@ -0,0 +1,143 @@
+import logging
+import os
+import socket
+import traceback
+from datetime import timedelta
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+from .ingest import map_tmdb_film, upsert_films
+from .models import Job, JobItem
+from .tmdb import get_client
+
+logger = logging.getLogger(__name__)
+
+# A running job whose worker has not reported progress for this long is
+# assumed dead and handed to another worker
+STALE_AFTER = timedelta(minutes=10)
+IMPORT_CHUNK_SIZE = 25
+
+HANDLERS = {}
+
+
+def register(kind):
+    """
+    Registers the decorated function as the handler for jobs of `kind`.
+    Handlers receive the claimed Job and process its pending items.
+    """
+    def decorator(func):
+        HANDLERS[kind] = func
+        return func
+    return decorator
+
+
+def enqueue(kind, items=(), payload=None):
+    """
+    Creates a queued job with one JobItem per entry in `items`.
+    """
+    items = list(items)
+    with transaction.atomic():
+        job = Job.objects.create(kind=kind, payload=payload or {}, total=len(items))
+        JobItem.objects.bulk_create(
+            [JobItem(job=job, position=i, item=item) for i, item in enumerate(items)],
+            batch_size=500,
+        )
+    return job
+
+
+def worker_name():
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+def requeue_stale():
+    """
+    Puts running jobs that stopped sending heartbeats back in the queue.
+    Items that already finished keep their results.
+    """
+    cutoff = timezone.now() - STALE_AFTER
+    requeued = Job.objects.filter(status="running", heartbeat_at__lt=cutoff).update(
+        status="queued", worker=None
+    )
+    if requeued:
+        logger.warning(f"Requeued {requeued} stale job(s)")
+    return requeued
+
+
+def claim_next(worker=None):
+    """
+    Claims the oldest queued job for `worker` and returns it, or None.
+    The claim is a conditional UPDATE, so concurrent workers never run the
+    same job, on any database backend.
+    """
+    worker = worker or worker_name()
+    candidates = Job.objects.filter(status="queued").order_by("created_at", "id").values_list("id", flat=True)
+    for job_id in candidates[:10]:
+        now = timezone.now()
+        claimed = Job.objects.filter(id=job_id, status="queued").update(
+            status="running", worker=worker, started_at=now, heartbeat_at=now
+        )
+        if claimed:
+            return Job.objects.get(id=job_id)
+    return None
+
+
+def run_job(job):
+    """
+    Runs the handler for a claimed job and records whether it finished or
+    failed.
+    """
+    handler = HANDLERS.get(job.kind)
+    try:
+        if handler is None:
+            raise ValueError(f"No handler registered for job kind '{job.kind}'")
+        handler(job)
+    except Exception:
+        logger.exception(f"Job {job.pk} ({job.kind}) failed")
+        Job.objects.filter(id=job.id).update(
+            status="failed", error=traceback.format_exc(), finished_at=timezone.now()
+        )
+    else:
+        Job.objects.filter(id=job.id).update(status="done", finished_at=timezone.now())
+
+
+def pending_items(job):
+    return job.items.filter(status="pending").order_by("position")
+
+
+def record_results(job, items):
+    """
+    Saves the status/detail of processed items and advances the job's
+    progress counter and heartbeat.
+    """
+    JobItem.objects.bulk_update(items, ["status", "detail"])
+    Job.objects.filter(id=job.id).update(
+        processed=F("processed") + len(items), heartbeat_at=timezone.now()
+    )
+
+
+@register("import_films")
+def import_films(job):
+    """
+    Imports a batch of titles or TMDb IDs. TMDb lookups for each chunk run
+    concurrently and the films are written in one bulk upsert; progress is
+    saved after every chunk so the job can be resumed if the worker dies.
+    """
+    client = get_client()
+    while True:
+        chunk = list(pending_items(job)[:IMPORT_CHUNK_SIZE])
+        if not chunk:
+            break
+        fetched = client.find_films([item.item for item in chunk])
+        with transaction.atomic():
+            written = upsert_films([map_tmdb_film(data) for data in fetched if data])
+            seen = set()
+            for item, data in zip(chunk, fetched):
+                if not data:
+                    item.status, item.detail = "not found", None
+                elif data["id"] in seen:
+                    # The same film was asked for twice in this chunk
+                    item.status, item.detail = "duplicate", None
+                else:
+                    seen.add(data["id"])
+                    item.status, item.detail = written.get(data["id"], ("error", None))
+            record_results(job, chunk)
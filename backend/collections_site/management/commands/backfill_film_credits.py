@@ -0,0 +1,29 @@
+from django.core.management.base import BaseCommand
+from ...models import Film, FilmCredit
+
+
+class Command(BaseCommand):
+    help = 'Rebuild the FilmCredit index from every film\'s cast and crew'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=500, help='Films processed per transaction')
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        films = Film.objects.only('id', 'cast', 'crew', 'director').order_by('id')
+        total = films.count()
+        processed = 0
+        last_id = 0
+
+        while True:
+            batch = list(films.filter(id__gt=last_id)[:batch_size])
+            if not batch:
+                break
+            FilmCredit.rebuild_for(batch)
+            processed += len(batch)
+            last_id = batch[-1].id
+            self.stdout.write(f'Rebuilt credits for {processed}/{total} films')
+
+        self.stdout.write(
+            self.style.SUCCESS(f'Backfill complete: {FilmCredit.objects.count()} credits for {processed} films.')
+        )
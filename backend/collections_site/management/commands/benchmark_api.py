@@ -0,0 +1,176 @@
+import json
+import platform
+import re
+import statistics
+import time
+from datetime import datetime, timezone
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test import Client, override_settings
+from ...caching import invalidate
+from ...dashboard import DASHBOARD_MODELS
+from ...frontpage import invalidate_frontpage
+from ...models import Book, Film, List, Music
+
+# Query count reported by ServerTimingMiddleware: db;dur=..;desc="N queries"
+SERVER_TIMING_QUERIES = re.compile(r'(?:^|,)\s*db;[^,]*desc="(\d+) queries"')
+
+
+def endpoints():
+    """
+    Returns (name, path) pairs for the benchmarked endpoints, using ids and
+    search terms taken from the current data.
+    """
+    paths = [
+        ('films', '/api/films/'),
+        ('films summary', '/api/films/?view=summary&limit=60'),
+        ('films frontpage', '/api/films/frontpage/'),
+        ('films stats', '/api/films/stats/'),
+        ('books', '/api/books/'),
+        ('music', '/api/music/'),
+        ('lists', '/api/lists/'),
+        ('dashboard', '/api/dashboard/'),
+    ]
+    film = Film.objects.order_by('id').only('id', 'title').first()
+    if film:
+        term = film.title.split()[0]
+        paths += [
+            ('film detail', f'/api/films/{film.id}/'),
+            ('films search', f'/api/films/?q={term}'),
+            ('search', f'/api/search/?q={term}'),
+        ]
+    book = Book.objects.order_by('id').only('id').first()
+    if book:
+        paths.append(('book detail', f'/api/books/{book.id}/'))
+    lst = List.objects.order_by('id').only('id').first()
+    if lst:
+        paths += [
+            ('list detail', f'/api/lists/{lst.id}/'),
+            ('list items', f'/api/lists/{lst.id}/items/'),
+        ]
+    return paths
+
+
+def queries_from_header(response):
+    """
+    Returns the request's query count from its Server-Timing header. The
+    middleware counts queries on every thread, including the worker threads
+    async views run them in, which CaptureQueriesContext can't see.
+    """
+    match = SERVER_TIMING_QUERIES.search(response.get('Server-Timing', ''))
+    return int(match.group(1)) if match else 0
+
+
+def percentile(sorted_values, pct):
+    index = max(0, min(len(sorted_values) - 1, round(pct / 100 * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+class Command(BaseCommand):
+    help = 'Measure latency percentiles, query counts and payload sizes of the API endpoints'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--iterations', type=int, default=20, help='Timed requests per endpoint')
+        parser.add_argument('--warmup', type=int, default=2, help='Untimed requests per endpoint before measuring')
+        parser.add_argument('--only', type=str, help='Comma-separated endpoint names to run')
+        parser.add_argument(
+            '--warm-cache', action='store_true',
+            help='Serve from the response, dashboard and front page caches (by default every request rebuilds them)',
+        )
+        parser.add_argument('--output', type=str, help='Write the results to this JSON file')
+        parser.add_argument('--compare', type=str, help='JSON file from a previous run to compare against')
+
+    def handle(self, *args, **options):
+        iterations = max(1, options['iterations'])
+        selected = endpoints()
+        if options['only']:
+            names = {name.strip() for name in options['only'].split(',')}
+            selected = [(name, path) for name, path in selected if name in names]
+            if not selected:
+                raise CommandError(f'No endpoints match --only {options["only"]}')
+
+        baseline = self.load(options['compare']) if options['compare'] else None
+
+        config = dict(settings.CONFIG, SERVER_TIMING=True)
+        if not options['warm_cache']:
+            config['RESPONSE_CACHE_TIMEOUT'] = 0
+
+        results = {}
+        with override_settings(ALLOWED_HOSTS=['testserver'], CONFIG=config, DEBUG=False):
+            client = Client()
+            for name, path in selected:
+                results[name] = self.measure(client, path, options['warmup'], iterations, not options['warm_cache'])
+                self.report(name, results[name], baseline)
+
+        if options['output']:
+            run = {
+                'created_at': datetime.now(timezone.utc).isoformat(),
+                'database': connection.vendor,
+                'python': platform.python_version(),
+                'response_cache': options['warm_cache'],
+                'iterations': iterations,
+                'rows': {model.__name__: model.objects.count() for model in (Film, Book, Music, List)},
+                'endpoints': results,
+            }
+            with open(options['output'], 'w', encoding='utf-8') as f:
+                json.dump(run, f, indent=2)
+            self.stdout.write(self.style.SUCCESS(f'Results written to {options["output"]}'))
+
+    def load(self, path):
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                return json.load(f).get('endpoints', {})
+        except (OSError, ValueError) as e:
+            raise CommandError(f'Could not read {path}: {e}')
+
+    def measure(self, client, path, warmup, iterations, cold):
+        for _ in range(warmup):
+            if cold:
+                self.clear_caches()
+            client.get(path)
+
+        timings = []
+        queries = []
+        for _ in range(iterations):
+            if cold:
+                self.clear_caches()
+            start = time.perf_counter()
+            response = client.get(path)
+            timings.append((time.perf_counter() - start) * 1000)
+            queries.append(queries_from_header(response))
+        if response.status_code != 200:
+            self.stdout.write(self.style.WARNING(f'{path} returned {response.status_code}'))
+
+        timings.sort()
+        return {
+            'path': path,
+            'status': response.status_code,
+            'p50_ms': round(percentile(timings, 50), 2),
+            'p90_ms': round(percentile(timings, 90), 2),
+            'p99_ms': round(percentile(timings, 99), 2),
+            'mean_ms': round(statistics.fmean(timings), 2),
+            'queries': max(queries),
+            'bytes': len(response.content),
+        }
+
+    def clear_caches(self):
+        # The response cache is off (timeout 0), but the dashboard and the
+        # front page pools have caches of their own. New model versions
+        # orphan the cached dashboards and the pools are dropped outright.
+        invalidate(*DASHBOARD_MODELS)
+        invalidate_frontpage()
+
+    def report(self, name, result, baseline):
+        line = (
+            f'{name:<16} p50 {result["p50_ms"]:>8.2f}ms  p90 {result["p90_ms"]:>8.2f}ms  '
+            f'p99 {result["p99_ms"]:>8.2f}ms  {result["queries"]:>3} queries  {result["bytes"]:>9} bytes'
+        )
+        previous = (baseline or {}).get(name)
+        if previous:
+            change = (result['p50_ms'] - previous['p50_ms']) / previous['p50_ms'] * 100 if previous['p50_ms'] else 0
+            line += (
+                f'  | p50 {change:+.0f}%  queries {result["queries"] - previous["queries"]:+d}  '
+                f'bytes {result["bytes"] - previous["bytes"]:+d}'
+            )
+        self.stdout.write(line)
@@ -1,115 +1,215 @@
 # collections_site/management/commands/import_letterboxd_films.py
 import csv
-from django.core.management.base import BaseCommand
-from django.conf import settings
+import json
+import os
+import unicodedata
+from decimal import Decimal
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from ...caching import invalidate
+from ...frontpage import invalidate_frontpage
+from ...ingest import map_tmdb_film, upsert_films
 from ...models import Film
-from ...serializers import FilmSerializer
-from ...views import fetch_tmdb_data, batch_import_films  # Import from your views
-from django.core import management
-from datetime import timedelta
+from ...tmdb import get_client
+
+
+def normalize_title(title):
+    return " ".join(unicodedata.normalize("NFKC", title).casefold().split())
+
+
+class FilmIndex:
+    """
+    In-memory lookup of the library by normalized title (and year) and by
+    TMDb id, loaded once instead of querying per CSV row.
+    """
+
+    def __init__(self):
+        self.by_title = {}
+        self.by_tmdb_id = {}
+
+    @classmethod
+    def load(cls):
+        index = cls()
+        for film in Film.objects.only("id", "title", "release_date", "rating", "tmdb_id").iterator(chunk_size=2000):
+            index.add(film)
+        return index
+
+    def add(self, film):
+        self.by_title.setdefault(normalize_title(film.title), []).append(film)
+        if film.tmdb_id is not None:
+            self.by_tmdb_id[film.tmdb_id] = film
+
+    def find(self, title, year=None):
+        """
+        Returns the film matching the title, preferring one released in
+        `year` when several films share the title.
+        """
+        films = self.by_title.get(normalize_title(title))
+        if not films:
+            return None
+        if year:
+            for film in films:
+                if film.release_date and film.release_date.year == year:
+                    return film
+        return films[0]
+
 
 class Command(BaseCommand):
     help = 'Import Letterboxd CSV data into Film model'
 
     def add_arguments(self, parser):
         parser.add_argument('csv_file', type=str, help='Path to the Letterboxd CSV file')
+        parser.add_argument('--workers', type=int, default=8, help='Number of concurrent TMDb lookups')
+        parser.add_argument('--batch-size', type=int, default=200, help='Rows written per transaction')
+        parser.add_argument('--checkpoint', type=str, help='JSON file recording progress, used to resume an interrupted import')
+        parser.add_argument('--dry-run', action='store_true', help='Report what would change without writing anything')
 
     def handle(self, *args, **options):
-        csv_file = options['csv_file']
-        imported = 0
-        updated = 0
-        skipped = 0
-
-        with open(csv_file, 'r', encoding='utf-8') as file:
-            reader = csv.DictReader(file)
-            for row in reader:
-                title = row.get('Name', '').strip()
-                rating = float(row.get('Rating', 0)) * 2 if row.get('Rating') else None
-                year = int(row.get("Year", 0)) if row.get("Year") else None
-
-                if not title:
-                    self.stdout.write(self.style.ERROR(f'Skipped row with empty title: {row}'))
-                    skipped += 1
-                    continue
-
-                # Check if film already exists by title (case-insensitive)
-                existing_film = Film.objects.filter(title__iexact=title).first()
-                if existing_film:
-                    # Update rating if provided and different
-                    if rating is not None and existing_film.rating != rating:
-                        existing_film.rating = rating
-                        existing_film.save()
-                        updated += 1
-                        self.stdout.write(self.style.SUCCESS(f'Updated rating for existing film: {title} to {rating}'))
-                    else:
-                        skipped += 1
-                        self.stdout.write(self.style.WARNING(f'Skipped existing film with same rating: {title}'))
-                else:
-                    # Import new film using your existing TMDb logic
-                    tmdb_data = fetch_tmdb_data(title, year=year)
-                    if tmdb_data:
-                        film_title = tmdb_data.get("title") or title
-                        director = next(
-                            (c["name"] for c in tmdb_data.get("credits", {}).get("crew", []) if c["job"] == "Director"),
-                            None,
-                        )
-                        # Set alt_title and alt_name to None if they match title or director
-                        alt_title = tmdb_data.get("original_title")
-                        if alt_title == film_title:
-                            alt_title = None
-                        alt_name = next(
-                            (c["original_name"] for c in tmdb_data.get("credits", {}).get("crew", []) if c["job"] == "Director"),
-                            None,
-                        )
-                        if alt_name == director:
-                            alt_name = None
-                            
-                        film_data = {
-                            # ... (your existing film_data mapping from views.py)
-                            "tmdb_id": tmdb_data.get("id"),
-                            "title": film_title,
-                            "alt_title": alt_title,
-                            "director": director,
-                            "alt_name": alt_name,
-                            "cast": [
-                                {"actor": c.get("name"), "role": c.get("character") or ""}
-                                for c in tmdb_data.get("credits", {}).get("cast", [])
-                            ],
-                            "crew": [
-                                {"name": c.get("name"), "role": c.get("job") or ""}
-                                for c in tmdb_data.get("credits", {}).get("crew", [])
-                            ],
-                            "industry_rating": round(float(tmdb_data.get("vote_average") or 0.0), 1),
-                            "series": tmdb_data.get("belongs_to_collection", {}).get("name") if tmdb_data.get("belongs_to_collection") else None,
-                            "blurb": tmdb_data.get("tagline"),
-                            "synopsis": tmdb_data.get("overview"),
-                            "language": tmdb_data.get("original_language"),
-                            "country": ", ".join(tmdb_data.get("origin_country", []) or []),
-                            "poster": f"https://image.tmdb.org/t/p/original{tmdb_data.get('poster_path')}" if tmdb_data.get("poster_path") else None,
-                            "background_pic": f"https://image.tmdb.org/t/p/original{tmdb_data.get('backdrop_path')}" if tmdb_data.get("backdrop_path") else None,
-                            "runtime": timedelta(minutes=tmdb_data.get("runtime", 0)) if tmdb_data.get("runtime") else None,
-                            "genre": [g["name"] for g in tmdb_data.get("genres", [])] or [],
-                            "budget": tmdb_data.get("budget") or 0,
-                            "box_office": tmdb_data.get("revenue") or 0,
-                            "release_date": tmdb_data.get("release_date"),
-                            "watchlist": True,
-                            "rating": rating,  # Set your Letterboxd rating
-                        }
-
-                        serializer = FilmSerializer(data=film_data)
-                        if serializer.is_valid():
-                            film = serializer.save()
-                            imported += 1
-                            self.stdout.write(self.style.SUCCESS(f'Imported new film: {title} with rating {rating}'))
-                        else:
-                            skipped += 1
-                            self.stdout.write(self.style.ERROR(f'Validation failed for {title}: {serializer.errors}'))
-                    else:
-                        skipped += 1
-                        self.stdout.write(self.style.WARNING(f'No TMDb data found for {title}'))
+        csv_file = os.path.abspath(options['csv_file'])
+        self.dry_run = options['dry_run']
+        self.workers = max(1, options['workers'])
+        batch_size = max(1, options['batch_size'])
+        checkpoint = options['checkpoint']
+        self.counts = {'imported': 0, 'updated': 0, 'skipped': 0}
+
+        start_row = self.read_checkpoint(checkpoint, csv_file)
+        if start_row:
+            self.stdout.write(self.style.WARNING(f'Resuming from checkpoint after row {start_row}'))
+
+        self.index = FilmIndex.load()
+        rows_done = 0
+        batch = []
+        try:
+            with open(csv_file, 'r', encoding='utf-8') as file:
+                for row in csv.DictReader(file):
+                    rows_done += 1
+                    if rows_done <= start_row:
+                        continue
+                    batch.append(row)
+                    if len(batch) >= batch_size:
+                        self.process_batch(batch)
+                        batch = []
+                        self.write_checkpoint(checkpoint, csv_file, rows_done)
+                if batch:
+                    self.process_batch(batch)
+                    self.write_checkpoint(checkpoint, csv_file, rows_done)
+        except OSError as e:
+            raise CommandError(f'Could not read {csv_file}: {e}')
+
+        if checkpoint and not self.dry_run and os.path.exists(checkpoint):
+            os.remove(checkpoint)
 
+        prefix = 'Dry run complete (nothing written)' if self.dry_run else 'Import complete'
         self.stdout.write(
             self.style.SUCCESS(
-                f'Import complete: {imported} imported, {updated} updated, {skipped} skipped.'
+                f'{prefix}: {self.counts["imported"]} imported, {self.counts["updated"]} updated, '
+                f'{self.counts["skipped"]} skipped.'
             )
-        )
\ No newline at end of file
+        )
+
+    def read_checkpoint(self, checkpoint, csv_file):
+        if not checkpoint or not os.path.exists(checkpoint):
+            return 0
+        try:
+            with open(checkpoint, 'r', encoding='utf-8') as f:
+                state = json.load(f)
+        except (OSError, ValueError) as e:
+            raise CommandError(f'Could not read checkpoint {checkpoint}: {e}')
+        if state.get('csv_file') != csv_file:
+            raise CommandError(f'Checkpoint {checkpoint} belongs to {state.get("csv_file")}, not {csv_file}')
+        return int(state.get('rows_done', 0))
+
+    def write_checkpoint(self, checkpoint, csv_file, rows_done):
+        if not checkpoint or self.dry_run:
+            return
+        tmp_path = f'{checkpoint}.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'csv_file': csv_file, 'rows_done': rows_done}, f)
+        os.replace(tmp_path, checkpoint)
+
+    def process_batch(self, rows):
+        """
+        Matches a batch of rows against the library, resolves unknown titles
+        on TMDb concurrently and writes the results in one transaction.
+        """
+        rating_updates = {}
+        unknown = []
+        for row in rows:
+            title = row.get('Name', '').strip()
+            rating = Decimal(row['Rating']) * 2 if row.get('Rating') else None
+            year = int(row['Year']) if (row.get('Year') or '').isdigit() else None
+
+            if not title:
+                self.stdout.write(self.style.ERROR(f'Skipped row with empty title: {row}'))
+                self.counts['skipped'] += 1
+                continue
+
+            existing_film = self.index.find(title, year)
+            if existing_film:
+                self.update_rating(existing_film, title, rating, rating_updates)
+            else:
+                unknown.append((title, year, rating))
+
+        fetched = get_client().find_films(
+            [(title, year) for title, year, _ in unknown], max_workers=self.workers
+        )
+        new_rows = {}
+        for (title, year, rating), tmdb_data in zip(unknown, fetched):
+            if not tmdb_data:
+                self.counts['skipped'] += 1
+                self.stdout.write(self.style.WARNING(f'No TMDb data found for {title}'))
+                continue
+            existing_film = self.index.by_tmdb_id.get(tmdb_data['id'])
+            if existing_film:
+                # Listed under another title, or repeated in this batch
+                self.update_rating(existing_film, title, rating, rating_updates)
+                continue
+            if tmdb_data['id'] in new_rows:
+                self.counts['skipped'] += 1
+                self.stdout.write(self.style.WARNING(f'Skipped repeated film: {title}'))
+                continue
+            new_rows[tmdb_data['id']] = (title, map_tmdb_film(tmdb_data, watchlist=True, rating=rating))
+
+        if self.dry_run:
+            for tmdb_id, (title, film_row) in new_rows.items():
+                self.counts['imported'] += 1
+                self.index.add(Film(tmdb_id=tmdb_id, title=film_row['title'], rating=film_row['rating']))
+                self.stdout.write(self.style.SUCCESS(f'Would import new film: {title} with rating {film_row["rating"]}'))
+            return
+
+        with transaction.atomic():
+            if rating_updates:
+                Film.objects.bulk_update(list(rating_updates.values()), ['rating'])
+            results = upsert_films([film_row for _, film_row in new_rows.values()])
+
+        if rating_updates:
+            # bulk_update skips the post_save signals that refresh the
+            # dashboard and the response cache
+            invalidate_frontpage()
+            invalidate(Film)
+
+        for tmdb_id, (title, film_row) in new_rows.items():
+            status, detail = results.get(tmdb_id, ('error', None))
+            if status == 'imported':
+                self.counts['imported'] += 1
+                self.index.add(Film(id=detail['id'], tmdb_id=tmdb_id, title=film_row['title'], rating=film_row['rating']))
+                self.stdout.write(self.style.SUCCESS(f'Imported new film: {title} with rating {film_row["rating"]}'))
+            elif status == 'duplicate':
+                self.counts['skipped'] += 1
+                self.stdout.write(self.style.WARNING(f'Skipped film already imported from TMDb: {title}'))
+            else:
+                self.counts['skipped'] += 1
+                errors = detail['errors'] if detail else status
+                self.stdout.write(self.style.ERROR(f'Validation failed for {title}: {errors}'))
+
+    def update_rating(self, film, title, rating, rating_updates):
+        # Update rating if provided and different
+        if rating is not None and film.rating != rating:
+            film.rating = rating
+            rating_updates[film.id] = film
+            self.counts['updated'] += 1
+            verb = 'Would update' if self.dry_run else 'Updated'
+            self.stdout.write(self.style.SUCCESS(f'{verb} rating for existing film: {title} to {rating}'))
+        else:
+            self.counts['skipped'] += 1
+            self.stdout.write(self.style.WARNING(f'Skipped existing film with same rating: {title}'))
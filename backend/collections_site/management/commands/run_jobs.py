@@ -0,0 +1,57 @@
+import threading
+import time
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections, connection
+from ...jobs import claim_next, requeue_stale, run_job, worker_name
+
+
+class Command(BaseCommand):
+    help = 'Run the background job worker (batch imports etc.)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--concurrency', type=int, default=1, help='Number of jobs to run in parallel')
+        parser.add_argument('--sleep', type=float, default=2.0, help='Seconds to wait when the queue is empty')
+        parser.add_argument('--once', action='store_true', help='Exit once the queue is empty')
+
+    def handle(self, *args, **options):
+        self.stop = threading.Event()
+        self.once = options['once']
+        self.sleep = options['sleep']
+        concurrency = max(1, options['concurrency'])
+
+        self.stdout.write(self.style.SUCCESS(f'Job worker {worker_name()} started with {concurrency} thread(s)'))
+        threads = [
+            threading.Thread(target=self.work, args=(f'{worker_name()}#{i}',), daemon=True)
+            for i in range(concurrency)
+        ]
+        for thread in threads:
+            thread.start()
+        try:
+            for thread in threads:
+                while thread.is_alive():
+                    thread.join(timeout=1)
+        except KeyboardInterrupt:
+            self.stdout.write('Stopping after the current jobs finish...')
+            self.stop.set()
+            for thread in threads:
+                thread.join()
+        self.stdout.write(self.style.SUCCESS('Job worker stopped'))
+
+    def work(self, name):
+        try:
+            while not self.stop.is_set():
+                close_old_connections()
+                requeue_stale()
+                job = claim_next(name)
+                if job is None:
+                    if self.once:
+                        break
+                    self.stop.wait(self.sleep)
+                    continue
+                started = time.monotonic()
+                self.stdout.write(f'[{name}] Running {job}')
+                run_job(job)
+                job.refresh_from_db()
+                self.stdout.write(f'[{name}] {job} after {time.monotonic() - started:.1f}s')
+        finally:
+            connection.close()
@@ -0,0 +1,206 @@
+import random
+from datetime import date, timedelta
+from decimal import Decimal
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from ...caching import invalidate
+from ...frontpage import invalidate_frontpage
+from ...models import Book, Film, FilmCredit, List, Music
+
+# Marks generated rows so --clear removes them and nothing else
+SYNTHETIC_MARKER = '[synthetic]'
+
+SCALES = {
+    'small': {'films': 1_000, 'books': 500, 'music': 300, 'lists': 10},
+    'medium': {'films': 50_000, 'books': 20_000, 'music': 10_000, 'lists': 50},
+    'large': {'films': 500_000, 'books': 200_000, 'music': 100_000, 'lists': 200},
+}
+
+SYLLABLES = ['an', 'bel', 'cor', 'da', 'el', 'fen', 'gar', 'hal', 'is', 'jor', 'ka', 'lin',
+             'mar', 'nor', 'os', 'pel', 'quin', 'ra', 'sol', 'tan', 'ul', 'ver', 'wyn', 'zo']
+WORDS = ['Night', 'River', 'Silent', 'Last', 'Summer', 'House', 'Blue', 'Stranger', 'City', 'Garden',
+         'Winter', 'Road', 'Light', 'Empire', 'Dream', 'Shadow', 'Glass', 'Return', 'Fire', 'Storm']
+FILM_GENRES = ['Drama', 'Comedy', 'Thriller', 'Horror', 'Romance', 'Science Fiction', 'Crime',
+               'Documentary', 'Animation', 'War', 'Western', 'Mystery']
+BOOK_GENRES = ['Fiction', 'History', 'Poetry', 'Philosophy', 'Fantasy', 'Biography', 'Science']
+MUSIC_GENRES = ['Rock', 'Jazz', 'Classical', 'Electronic', 'Folk', 'Hip Hop', 'Pop', 'Soul']
+LANGUAGES = ['en', 'fr', 'ja', 'de', 'it', 'es', 'ko', 'sv']
+COUNTRIES = ['US', 'GB', 'FR', 'JP', 'DE', 'IT', 'ES', 'KR', 'SE']
+CREW_JOBS = ['Director', 'Writer', 'Producer', 'Director of Photography', 'Editor',
+             'Original Music Composer', 'Production Design', 'Costume Design', 'Sound Designer']
+
+
+class Generator:
+    """
+    Deterministic (seeded) fake data with TMDb-like shapes and sizes:
+    films carry 10-80 cast and 15-150 crew entries, albums 6-20 tracks.
+    """
+
+    def __init__(self, seed):
+        self.random = random.Random(seed)
+        self.people = [self.name() for _ in range(20_000)]
+
+    def name(self):
+        word = lambda: ''.join(self.random.choices(SYLLABLES, k=self.random.randint(2, 3))).capitalize()
+        return f'{word()} {word()}'
+
+    def person(self):
+        # Skewed so some people appear in many films, as in real credits
+        return self.people[int(len(self.people) * self.random.random() ** 3)]
+
+    def title(self):
+        return ' '.join(self.random.sample(WORDS, self.random.randint(1, 4)))
+
+    def day(self, start=1920, end=2024):
+        return date(self.random.randint(start, end), self.random.randint(1, 12), self.random.randint(1, 28))
+
+    def rating(self, chance=0.6):
+        if self.random.random() > chance:
+            return None
+        return Decimal(self.random.randint(2, 20)) / 2
+
+    def film(self, n):
+        director = self.person()
+        seen = self.random.random() < 0.5
+        return Film(
+            title=f'{self.title()} {n}',
+            director=director,
+            cast=[{'actor': self.person(), 'role': self.name()} for _ in range(self.random.randint(10, 80))],
+            crew=[{'name': director, 'role': 'Director'}] + [
+                {'name': self.person(), 'role': self.random.choice(CREW_JOBS)}
+                for _ in range(self.random.randint(15, 150))
+            ],
+            rating=self.rating() if seen else None,
+            industry_rating=Decimal(self.random.randint(30, 90)) / 10,
+            synopsis=' '.join(self.random.choices(WORDS, k=self.random.randint(30, 120))).lower(),
+            language=self.random.choice(LANGUAGES),
+            country=', '.join(self.random.sample(COUNTRIES, self.random.randint(1, 2))),
+            runtime=timedelta(minutes=self.random.randint(70, 200)),
+            genre=self.random.sample(FILM_GENRES, self.random.randint(1, 3)),
+            release_date=self.day(),
+            seen=seen,
+            date_watched=self.day(2015, 2024) if seen and self.random.random() < 0.5 else None,
+            watchlist=not seen and self.random.random() < 0.4,
+            favourite=seen and self.random.random() < 0.05,
+            poster=f'https://example.com/posters/{n}.jpg',
+            notes=SYNTHETIC_MARKER,
+        )
+
+    def book(self, n):
+        read = self.random.random() < 0.5
+        return Book(
+            title=f'{self.title()} {n}',
+            author=self.person(),
+            date_published=self.day(1800),
+            rating=self.rating() if read else None,
+            industry_rating=Decimal(self.random.randint(20, 50)) / 10,
+            genre=self.random.sample(BOOK_GENRES, self.random.randint(1, 2)),
+            page_count=self.random.randint(80, 1200),
+            synopsis=' '.join(self.random.choices(WORDS, k=self.random.randint(30, 120))).lower(),
+            language=self.random.choice(LANGUAGES),
+            read=read,
+            readlist=not read and self.random.random() < 0.3,
+            favourite=read and self.random.random() < 0.05,
+            notes=SYNTHETIC_MARKER,
+        )
+
+    def album(self, n):
+        tracks = self.random.randint(6, 20)
+        return Music(
+            title=f'{self.title()} {n}',
+            artist=self.person(),
+            format=self.random.choice(Music.FORMAT_CHOICES)[0],
+            type=self.random.choice(Music.TYPE_CHOICES)[0],
+            owned=self.random.random() < 0.6,
+            price=Decimal(self.random.randint(500, 6000)) / 100,
+            release_date=self.day(1950),
+            genre=self.random.sample(MUSIC_GENRES, self.random.randint(1, 2)),
+            tracklist=[
+                {
+                    'track_number': i + 1,
+                    'title': self.title(),
+                    'lyrics': ' '.join(self.random.choices(WORDS, k=self.random.randint(20, 80))).lower(),
+                    'length': f'{self.random.randint(2, 7)}:{self.random.randint(0, 59):02d}',
+                }
+                for i in range(tracks)
+            ],
+            notes=SYNTHETIC_MARKER,
+        )
+
+
+class Command(BaseCommand):
+    help = 'Seed synthetic films, books, music and lists for benchmarking'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--scale', choices=SCALES, default='small', help='Preset row counts')
+        parser.add_argument('--films', type=int, help='Override the number of films')
+        parser.add_argument('--books', type=int, help='Override the number of books')
+        parser.add_argument('--music', type=int, help='Override the number of albums')
+        parser.add_argument('--lists', type=int, help='Override the number of lists')
+        parser.add_argument('--list-size', type=int, default=1000, help='Largest number of members per list')
+        parser.add_argument('--seed', type=int, default=1, help='Random seed, for reproducible datasets')
+        parser.add_argument('--batch-size', type=int, default=1000, help='Rows inserted per query')
+        parser.add_argument('--clear', action='store_true', help='Delete previously seeded rows first')
+
+    def handle(self, *args, **options):
+        counts = dict(SCALES[options['scale']])
+        for key in counts:
+            if options[key] is not None:
+                counts[key] = options[key]
+        self.batch_size = max(1, options['batch_size'])
+        generator = Generator(options['seed'])
+
+        if options['clear']:
+            self.clear()
+
+        self.seed('films', Film, generator.film, counts['films'])
+        self.seed('books', Book, generator.book, counts['books'])
+        self.seed('music', Music, generator.album, counts['music'])
+        self.seed_lists(generator, counts['lists'], options['list_size'])
+
+        # bulk_create skips signals, so expire the cached dashboards here
+        invalidate_frontpage()
+        invalidate(Film, Book, Music, List)
+        self.stdout.write(self.style.SUCCESS(
+            f'Seeded {counts["films"]} films, {counts["books"]} books, {counts["music"]} albums '
+            f'and {counts["lists"]} lists.'
+        ))
+
+    def clear(self):
+        List.objects.filter(description=SYNTHETIC_MARKER).delete()
+        for model in (Film, Book, Music):
+            deleted, _ = model.objects.filter(notes=SYNTHETIC_MARKER).delete()
+            self.stdout.write(f'Deleted {deleted} synthetic {model.__name__} rows (including related rows)')
+
+    def seed(self, name, model, make, total):
+        for start in range(0, total, self.batch_size):
+            rows = [make(n) for n in range(start, min(start + self.batch_size, total))]
+            with transaction.atomic():
+                created = model.objects.bulk_create(rows)
+                if model is Film:
+                    if not all(film.pk for film in created):
+                        created = list(Film.objects.filter(notes=SYNTHETIC_MARKER).order_by('-id')[:len(rows)])
+                    FilmCredit.rebuild_for(created)
+            self.stdout.write(f'{name}: {min(start + self.batch_size, total)}/{total}')
+
+    def seed_lists(self, generator, total, list_size):
+        film_ids = list(Film.objects.filter(notes=SYNTHETIC_MARKER).values_list('id', flat=True))
+        book_ids = list(Book.objects.filter(notes=SYNTHETIC_MARKER).values_list('id', flat=True))
+        for n in range(total):
+            category, ids, through = (
+                ('film', film_ids, List.films.through) if n % 2 == 0 or not book_ids
+                else ('book', book_ids, List.books.through)
+            )
+            if not ids:
+                continue
+            size = min(len(ids), generator.random.randint(10, max(10, list_size)))
+            with transaction.atomic():
+                lst = List.objects.create(
+                    name=f'{generator.title()} {n}', category=category, description=SYNTHETIC_MARKER
+                )
+                column = f'{category}_id'
+                through.objects.bulk_create(
+                    [through(list_id=lst.id, **{column: member}) for member in generator.random.sample(ids, size)],
+                    batch_size=self.batch_size,
+                )
+            self.stdout.write(f'lists: {n + 1}/{total}')
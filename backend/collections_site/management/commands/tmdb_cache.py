@@ -0,0 +1,25 @@
+import json
+from django.core.management.base import BaseCommand, CommandError
+from ...tmdb import get_client
+
+
+class Command(BaseCommand):
+    help = 'Inspect or maintain the on-disk TMDb response cache'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--clear', action='store_true', help='Delete every cached response and reset the hit/miss counts')
+        parser.add_argument('--prune', action='store_true', help='Delete expired entries and enforce the size limit')
+
+    def handle(self, *args, **options):
+        cache = get_client().cache
+        if cache is None:
+            raise CommandError('The TMDb cache is disabled (TMDB_CACHE_DIR is empty).')
+
+        if options['clear']:
+            cache.clear()
+            self.stdout.write(self.style.SUCCESS(f'Cleared TMDb cache at {cache.root}'))
+        elif options['prune']:
+            removed = cache.prune()
+            self.stdout.write(self.style.SUCCESS(f'Pruned {removed} TMDb cache entries'))
+
+        self.stdout.write(json.dumps(cache.stats(), indent=2))
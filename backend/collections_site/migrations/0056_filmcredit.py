@@ -0,0 +1,30 @@
+# Generated by Django 5.2.6 on 2026-10-18 19:24
+
+import django.db.models.deletion
+import django.db.models.functions.text
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('collections_site', '0055_liveperformance_writers'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='FilmCredit',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(choices=[('cast', 'Cast'), ('crew', 'Crew')], max_length=10)),
+                ('person', models.CharField(max_length=255)),
+                ('role', models.CharField(blank=True, default='', max_length=255)),
+                ('billing_order', models.PositiveIntegerField(default=0)),
+                ('film', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='credits', to='collections_site.film')),
+            ],
+            options={
+                'ordering': ['film', 'kind', 'billing_order'],
+                'indexes': [models.Index(fields=['kind', 'person'], name='filmcredit_kind_person_idx'), models.Index(django.db.models.functions.text.Upper('person'), models.F('role'), name='filmcredit_upper_person_idx')],
+            },
+        ),
+    ]
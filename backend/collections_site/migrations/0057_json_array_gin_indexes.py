@@ -0,0 +1,43 @@
+# GIN indexes backing genre/tag containment filters on Postgres.
+# SQLite has no equivalent index type, so the operation is a no-op there.
+
+from django.db import migrations
+
+
+JSON_ARRAY_COLUMNS = [
+    ('collections_site_film', 'genre'),
+    ('collections_site_film', 'tags'),
+    ('collections_site_book', 'genre'),
+    ('collections_site_book', 'tags'),
+    ('collections_site_music', 'genre'),
+    ('collections_site_gamecollection', 'genre'),
+    ('collections_site_art', 'tags'),
+]
+
+
+def create_gin_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for table, column in JSON_ARRAY_COLUMNS:
+        schema_editor.execute(
+            f'CREATE INDEX IF NOT EXISTS "{table}_{column}_gin" '
+            f'ON "{table}" USING gin ("{column}" jsonb_path_ops)'
+        )
+
+
+def drop_gin_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for table, column in JSON_ARRAY_COLUMNS:
+        schema_editor.execute(f'DROP INDEX IF EXISTS "{table}_{column}_gin"')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('collections_site', '0056_filmcredit'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_gin_indexes, drop_gin_indexes),
+    ]
@@ -0,0 +1,89 @@
+# Generated by Django 5.2.6 on 2026-10-18 19:26
+# Full-text and trigram search for films and books.
+# On Postgres the search_vector columns are kept up to date by triggers and
+# backed by GIN indexes, alongside pg_trgm indexes on UPPER() of the searched
+# columns (matching both the % operator in search.py and icontains).
+# On SQLite the columns stay empty and search falls back to icontains.
+
+import django.contrib.postgres.search
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations
+
+
+SEARCH_CONFIG = 'simple'
+
+# table -> [(column, weight), ...]
+SEARCH_COLUMNS = {
+    'collections_site_film': [('title', 'A'), ('alt_title', 'A'), ('director', 'B'), ('alt_name', 'B')],
+    'collections_site_book': [('title', 'A'), ('alt_title', 'A'), ('author', 'B'), ('alt_name', 'B')],
+}
+
+
+def vector_sql(columns, prefix=''):
+    return ' || '.join(
+        f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce({prefix}\"{column}\", '')), '{weight}')"
+        for column, weight in columns
+    )
+
+
+def create_search_triggers(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for table, columns in SEARCH_COLUMNS.items():
+        column_list = ', '.join(f'"{column}"' for column, _ in columns)
+        schema_editor.execute(f'''
+            CREATE OR REPLACE FUNCTION {table}_search_vector_update() RETURNS trigger AS $$
+            BEGIN
+                NEW.search_vector := {vector_sql(columns, 'NEW.')};
+                RETURN NEW;
+            END
+            $$ LANGUAGE plpgsql
+        ''')
+        schema_editor.execute(f'DROP TRIGGER IF EXISTS {table}_search_vector_trigger ON "{table}"')
+        schema_editor.execute(f'''
+            CREATE TRIGGER {table}_search_vector_trigger
+            BEFORE INSERT OR UPDATE OF {column_list} ON "{table}"
+            FOR EACH ROW EXECUTE FUNCTION {table}_search_vector_update()
+        ''')
+        schema_editor.execute(f'UPDATE "{table}" SET search_vector = {vector_sql(columns)}')
+        schema_editor.execute(
+            f'CREATE INDEX IF NOT EXISTS "{table}_search_vector_gin" ON "{table}" USING gin (search_vector)'
+        )
+        for column, _ in columns:
+            schema_editor.execute(
+                f'CREATE INDEX IF NOT EXISTS "{table}_{column}_trgm" '
+                f'ON "{table}" USING gin ((UPPER("{column}")) gin_trgm_ops)'
+            )
+
+
+def drop_search_triggers(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for table, columns in SEARCH_COLUMNS.items():
+        schema_editor.execute(f'DROP TRIGGER IF EXISTS {table}_search_vector_trigger ON "{table}"')
+        schema_editor.execute(f'DROP FUNCTION IF EXISTS {table}_search_vector_update()')
+        schema_editor.execute(f'DROP INDEX IF EXISTS "{table}_search_vector_gin"')
+        for column, _ in columns:
+            schema_editor.execute(f'DROP INDEX IF EXISTS "{table}_{column}_trgm"')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('collections_site', '0057_json_array_gin_indexes'),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.AddField(
+            model_name='book',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='film',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.RunPython(create_search_triggers, drop_search_triggers),
+    ]
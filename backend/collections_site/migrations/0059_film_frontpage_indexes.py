@@ -0,0 +1,25 @@
+# Generated by Django 5.2.6 on 2026-10-18 19:28
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('collections_site', '0058_search_vector'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='film',
+            index=models.Index(condition=models.Q(('watchlist', True)), fields=['id'], name='film_watchlist_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='film',
+            index=models.Index(condition=models.Q(('favourite', True)), fields=['id'], name='film_favourite_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='film',
+            index=models.Index(condition=models.Q(('date_watched__isnull', False)), fields=['-date_watched'], name='film_date_watched_idx'),
+        ),
+    ]
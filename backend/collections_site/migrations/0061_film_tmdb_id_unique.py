@@ -0,0 +1,35 @@
+# Generated by Django 5.2.6 on 2026-10-18 19:33
+# Makes Film.tmdb_id unique so imports can upsert with ON CONFLICT (tmdb_id).
+# Existing duplicates keep the tmdb_id on their oldest row; the others are
+# unlinked (tmdb_id set to NULL) rather than deleted.
+
+from django.db import migrations, models
+from django.db.models import Count, Min
+
+
+def unlink_duplicate_tmdb_ids(apps, schema_editor):
+    Film = apps.get_model('collections_site', 'Film')
+    duplicates = (
+        Film.objects.exclude(tmdb_id__isnull=True)
+        .values('tmdb_id')
+        .annotate(n=Count('id'), keep=Min('id'))
+        .filter(n__gt=1)
+    )
+    for row in duplicates:
+        Film.objects.filter(tmdb_id=row['tmdb_id']).exclude(id=row['keep']).update(tmdb_id=None)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('collections_site', '0060_job'),
+    ]
+
+    operations = [
+        migrations.RunPython(unlink_duplicate_tmdb_ids, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='film',
+            name='tmdb_id',
+            field=models.IntegerField(blank=True, null=True, unique=True),
+        ),
+    ]
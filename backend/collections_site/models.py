@@ -1,5 +1,8 @@
-from django.db import models
-from django.contrib.postgres.fields import ArrayField
+import json
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import models, transaction
+from django.db.models.functions import Upper
+from django.contrib.postgres.search import SearchVectorField
 
 # Create your models here.
 class Watch(models.Model):
@@ -273,6 +276,17 @@ class Extra(models.Model):
     def __str__(self):
         return f"{self.brand} {self.model} ({self.category})"
     
+def snapshot_value(value):
+    """
+    Returns a comparable copy of a field value. JSON values (lists and
+    dicts) are kept as JSON text, so in-place edits such as
+    film.cast.append(...) still count as changes.
+    """
+    if isinstance(value, (list, dict)):
+        return json.dumps(value, cls=DjangoJSONEncoder)
+    return value
+
+
 class Film(models.Model):
     title = models.CharField(max_length=200)
     alt_title = models.CharField(max_length=200, blank=True, null=True)
@@ -309,11 +323,160 @@ class Film(models.Model):
     seen = models.BooleanField(default=False)
     date_watched = models.DateField(blank=True, null=True)
     watchlist = models.BooleanField(default=False)
-    tmdb_id = models.IntegerField(blank=True, null=True)
+    tmdb_id = models.IntegerField(blank=True, null=True, unique=True)
+    search_vector = SearchVectorField(null=True, editable=False) # Maintained by a Postgres trigger, see migration 0058
+
+    CREDIT_FIELDS = ("cast", "crew", "director")
+    # Fields whose loaded values are kept for change detection: the credit
+    # sources and the front page fields (FilmSerializer.Meta.summary_fields)
+    TRACKED_FIELDS = frozenset(CREDIT_FIELDS + (
+        "id", "title", "alt_title", "alt_name", "poster", "rating",
+        "industry_rating", "release_date", "genre", "favourite", "seen",
+        "watchlist", "date_watched", "tmdb_id",
+    ))
+
+    class Meta:
+        indexes = [
+            # Partial indexes backing the films dashboard pools
+            models.Index(fields=["id"], condition=models.Q(watchlist=True), name="film_watchlist_idx"),
+            models.Index(fields=["id"], condition=models.Q(favourite=True), name="film_favourite_idx"),
+            models.Index(
+                fields=["-date_watched"],
+                condition=models.Q(date_watched__isnull=False),
+                name="film_date_watched_idx",
+            ),
+        ]
     
     def __str__(self):
         return f"{self.title} ({self.director})"
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Keep the loaded values of the tracked fields so save() can tell
+        # which of them changed
+        instance._loaded_values = {
+            name: snapshot_value(value)
+            for name, value in zip(field_names, values)
+            if name in cls.TRACKED_FIELDS
+        }
+        return instance
+
+    def save(self, *args, **kwargs):
+        credits_changed = self.credits_changed(kwargs.get("update_fields"))
+        super().save(*args, **kwargs)
+        if credits_changed:
+            FilmCredit.rebuild_for([self])
+        deferred = self.get_deferred_fields()
+        self._loaded_values = {
+            name: snapshot_value(getattr(self, name))
+            for name in self.TRACKED_FIELDS
+            if name not in deferred
+        }
+
+    def has_changed(self, fields):
+        """
+        Returns True if any of `fields` (all in TRACKED_FIELDS) differs from
+        the value loaded from the database. Deferred fields weren't edited;
+        films that weren't loaded from the database always count as changed.
+        """
+        loaded = getattr(self, "_loaded_values", None)
+        if loaded is None:
+            return True
+        deferred = self.get_deferred_fields()
+        return any(
+            field not in deferred and snapshot_value(getattr(self, field)) != loaded.get(field)
+            for field in fields
+        )
+
+    def credits_changed(self, update_fields=None):
+        """
+        Returns True if cast, crew or director differ from the values loaded
+        from the database, i.e. the FilmCredit rows need rebuilding.
+        """
+        if update_fields is not None and not set(update_fields) & set(self.CREDIT_FIELDS):
+            return False
+        return self.has_changed(self.CREDIT_FIELDS)
+
+    def build_credits(self):
+        """
+        Flattens the cast/crew JSON into unsaved FilmCredit rows.
+        The director field is added as a Director crew credit when the crew
+        list doesn't already contain them.
+        """
+        credits = []
+        for order, entry in enumerate(self.cast or []):
+            if isinstance(entry, dict) and entry.get("actor"):
+                credits.append(FilmCredit(
+                    film=self,
+                    kind="cast",
+                    person=str(entry["actor"])[:255],
+                    role=str(entry.get("role") or "")[:255],
+                    billing_order=order,
+                ))
+        for order, entry in enumerate(self.crew or []):
+            if isinstance(entry, dict) and entry.get("name"):
+                credits.append(FilmCredit(
+                    film=self,
+                    kind="crew",
+                    person=str(entry["name"])[:255],
+                    role=str(entry.get("role") or "")[:255],
+                    billing_order=order,
+                ))
+        if self.director and not any(
+            c.kind == "crew" and c.role == "Director" and c.person.lower() == self.director.lower()
+            for c in credits
+        ):
+            credits.append(FilmCredit(
+                film=self,
+                kind="crew",
+                person=self.director[:255],
+                role="Director",
+                billing_order=len(self.crew or []),
+            ))
+        return credits
+
+class FilmCredit(models.Model):
+    """
+    Derived, indexed copy of Film.cast / Film.crew used for person lookups.
+    Rebuilt whenever a film's credits change; never edit it directly.
+    """
+    KIND_CHOICES = [
+        ("cast", "Cast"),
+        ("crew", "Crew"),
+    ]
+
+    film = models.ForeignKey(Film, on_delete=models.CASCADE, related_name="credits")
+    kind = models.CharField(max_length=10, choices=KIND_CHOICES)
+    person = models.CharField(max_length=255)
+    role = models.CharField(max_length=255, blank=True, default="")
+    billing_order = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        ordering = ["film", "kind", "billing_order"]
+        indexes = [
+            models.Index(fields=["kind", "person"], name="filmcredit_kind_person_idx"),
+            models.Index(Upper("person"), "role", name="filmcredit_upper_person_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.person} - {self.role} ({self.kind})"
+
+    @classmethod
+    def rebuild_for(cls, films):
+        """
+        Replaces the credit rows of the given (saved) films.
+        """
+        films = [film for film in films if film.pk]
+        if not films:
+            return
+        with transaction.atomic():
+            cls.objects.filter(film__in=films).delete()
+            cls.objects.bulk_create(
+                [credit for film in films for credit in film.build_credits()],
+                batch_size=1000,
+            )
+
 class Book(models.Model):
     YEAR_SPECIFICITY_CHOICES = [
         ("exact", "Exact"),
@@ -355,6 +518,7 @@ class Book(models.Model):
     readlist = models.BooleanField(default=False)
     notes = models.TextField(blank=True, null=True)
     date_read = models.DateField(blank=True, null=True)
+    search_vector = SearchVectorField(null=True, editable=False) # Maintained by a Postgres trigger, see migration 0058
     
     def __str__(self):
         return f"{self.title} ({self.author})"
@@ -433,4 +597,58 @@ class LivePerformance(models.Model):
     external_links = models.URLField(blank=True, null=True)
     year = models.IntegerField(blank=True, null=True)
     year_specificity = models.CharField(max_length=50, choices=YEAR_SPECIFICITY_CHOICES, blank=True, null=True)
-    writers = models.JSONField(default=list, blank=True) # Format: [{"name": NAME, "role": ROLE}]
\ No newline at end of file
+    writers = models.JSONField(default=list, blank=True) # Format: [{"name": NAME, "role": ROLE}]
+
+class Job(models.Model):
+    """
+    A unit of background work (e.g. a batch film import) picked up by the
+    `run_jobs` worker. See jobs.py for the queue itself.
+    """
+    STATUS_CHOICES = [
+        ("queued", "Queued"),
+        ("running", "Running"),
+        ("done", "Done"),
+        ("failed", "Failed"),
+    ]
+
+    kind = models.CharField(max_length=50)
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default="queued")
+    payload = models.JSONField(default=dict, blank=True)
+    total = models.PositiveIntegerField(default=0)
+    processed = models.PositiveIntegerField(default=0)
+    error = models.TextField(blank=True, null=True)
+    worker = models.CharField(max_length=100, blank=True, null=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    started_at = models.DateTimeField(blank=True, null=True)
+    heartbeat_at = models.DateTimeField(blank=True, null=True)
+    finished_at = models.DateTimeField(blank=True, null=True)
+
+    class Meta:
+        ordering = ["-created_at"]
+        indexes = [
+            models.Index(fields=["status", "created_at"], name="job_status_created_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.kind} #{self.pk} ({self.status})"
+
+
+class JobItem(models.Model):
+    """
+    One input of a Job together with its outcome, reported by the progress
+    endpoint.
+    """
+    job = models.ForeignKey(Job, on_delete=models.CASCADE, related_name="items")
+    position = models.PositiveIntegerField()
+    item = models.CharField(max_length=500)
+    status = models.CharField(max_length=50, default="pending")
+    detail = models.JSONField(blank=True, null=True)
+
+    class Meta:
+        ordering = ["job", "position"]
+        constraints = [
+            models.UniqueConstraint(fields=["job", "position"], name="jobitem_job_position_uniq"),
+        ]
+
+    def __str__(self):
+        return f"{self.item}: {self.status}"
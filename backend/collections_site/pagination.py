@@ -0,0 +1,135 @@
+import json
+import logging
+from django.db import connections
+from rest_framework.pagination import Cursor, CursorPagination
+from rest_framework.response import Response
+
+logger = logging.getLogger(__name__)
+
+
+def estimate_count(queryset, exact_threshold=1000):
+    """
+    Returns (count, is_estimate) for a queryset.
+    On Postgres the planner's row estimate is used (pg_class.reltuples for an
+    unfiltered table, EXPLAIN otherwise) and an exact COUNT(*) is only run when
+    the estimate is small enough to be cheap. Other backends always count.
+    """
+    connection = connections[queryset.db]
+    if connection.vendor != "postgresql":
+        return queryset.count(), False
+
+    estimate = None
+    try:
+        with connection.cursor() as cursor:
+            if not queryset.query.where:
+                cursor.execute(
+                    "SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass",
+                    [queryset.model._meta.db_table],
+                )
+                row = cursor.fetchone()
+                estimate = row[0] if row else None
+            else:
+                sql, params = queryset.order_by().query.sql_with_params()
+                cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+                plan = cursor.fetchone()[0]
+                if isinstance(plan, str):
+                    plan = json.loads(plan)
+                estimate = plan[0]["Plan"]["Plan Rows"]
+    except Exception as e:
+        logger.warning(f"Row estimate failed for {queryset.model.__name__}: {e}")
+
+    # reltuples is -1 for tables that have never been analysed
+    if estimate is None or estimate < exact_threshold:
+        return queryset.count(), False
+    return int(estimate), True
+
+
+class KeysetPagination(CursorPagination):
+    """
+    Opt-in keyset pagination on the primary key.
+    Requests without `limit` or `cursor` are returned unpaginated, exactly as
+    before, so existing clients keep working. Paginated responses carry a
+    `count` that is a planner estimate on large Postgres tables.
+    """
+    ordering = "-id"
+    page_size = None
+    default_page_size = 50
+    page_size_query_param = "limit"
+    max_page_size = 500
+    count_query_param = "count"
+    exact_count_threshold = 1000
+
+    def get_page_size(self, request):
+        page_size = super().get_page_size(request)
+        if page_size is None and self.cursor_query_param in request.query_params:
+            return self.default_page_size
+        return page_size
+
+    def paginate_queryset(self, queryset, request, view=None):
+        # Sliced querysets (e.g. the film quick search) can't be filtered further
+        if getattr(queryset, "query", None) is not None and queryset.query.is_sliced:
+            return None
+        self.count = None
+        self.count_is_estimate = False
+        self.page_offset = None
+        if request.query_params.get(self.count_query_param, "true").lower() not in ("0", "false"):
+            if self.get_page_size(request):
+                self.count, self.count_is_estimate = estimate_count(
+                    queryset, self.exact_count_threshold
+                )
+        if "search_rank" in queryset.query.annotations or getattr(view, "offset_pagination", False):
+            return self.paginate_by_offset(queryset, request)
+        return super().paginate_queryset(queryset, request, view)
+
+    def paginate_by_offset(self, queryset, request):
+        """
+        Ranked search results, and views that set `offset_pagination` for a
+        custom ordering, have no stable key to seek on, so they are paged by
+        offset (bounded by offset_cutoff) while keeping the cursor format.
+        """
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        if not self.page_size:
+            return None
+        self.base_url = request.build_absolute_uri()
+        self.cursor = self.decode_cursor(request)
+        self.page_offset = self.cursor.offset if self.cursor else 0
+
+        results = list(queryset[self.page_offset:self.page_offset + self.page_size + 1])
+        self.page = results[:self.page_size]
+        self.has_next = len(results) > len(self.page)
+        self.has_previous = self.page_offset > 0
+        if self.has_previous or self.has_next:
+            self.display_page_controls = True
+        return self.page
+
+    def get_next_link(self):
+        if self.page_offset is None:
+            return super().get_next_link()
+        if not self.has_next:
+            return None
+        offset = min(self.page_offset + self.page_size, self.offset_cutoff)
+        return self.encode_cursor(Cursor(offset=offset, reverse=False, position=None))
+
+    def get_previous_link(self):
+        if self.page_offset is None:
+            return super().get_previous_link()
+        if not self.has_previous:
+            return None
+        offset = max(self.page_offset - self.page_size, 0)
+        return self.encode_cursor(Cursor(offset=offset, reverse=False, position=None))
+
+    def get_paginated_response(self, data):
+        return Response({
+            "count": self.count,
+            "count_is_estimate": self.count_is_estimate,
+            "next": self.get_next_link(),
+            "previous": self.get_previous_link(),
+            "results": data,
+        })
+
+    def get_paginated_response_schema(self, schema):
+        response_schema = super().get_paginated_response_schema(schema)
+        response_schema["properties"]["count"] = {"type": "integer", "nullable": True}
+        response_schema["properties"]["count_is_estimate"] = {"type": "boolean"}
+        return response_schema
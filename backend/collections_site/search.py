@@ -0,0 +1,61 @@
+from functools import reduce
+from operator import or_
+from django.contrib.postgres.lookups import TrigramSimilar
+from django.contrib.postgres.search import SearchQuery, SearchRank, TrigramSimilarity
+from django.core.exceptions import FieldDoesNotExist
+from django.db import connections
+from django.db.models import F, Q
+from django.db.models.functions import Greatest, Upper
+
+# Must match SEARCH_CONFIG in migration 0058, which builds the tsvectors
+SEARCH_CONFIG = "simple"
+
+
+def uses_postgres_search(queryset):
+    """
+    True when the queryset's model has a search_vector column and lives on
+    Postgres, i.e. ranked full-text/trigram search is available.
+    """
+    try:
+        queryset.model._meta.get_field("search_vector")
+    except FieldDoesNotExist:
+        return False
+    return connections[queryset.db].vendor == "postgresql"
+
+
+def search_queryset(queryset, query, fields):
+    """
+    Searches `fields` for `query`.
+    On Postgres rows match on the search_vector tsvector, trigram similarity
+    (typo tolerance) or substring, all of which are GIN-indexed, and are
+    ordered by full-text rank and then best trigram similarity. Other
+    databases fall back to an unranked icontains OR across the fields.
+    """
+    query = query.strip()
+    if not query:
+        return queryset
+
+    substring = reduce(or_, (Q(**{f"{field}__icontains": query}) for field in fields))
+    if not uses_postgres_search(queryset):
+        return queryset.filter(substring)
+
+    search_query = SearchQuery(query, config=SEARCH_CONFIG, search_type="websearch")
+    # The trigram indexes are built on UPPER(column) so the same index serves
+    # both the % operator here and the UPPER(...) LIKE generated by icontains
+    trigram = reduce(or_, (Q(TrigramSimilar(Upper(field), query.upper())) for field in fields))
+    similarities = [TrigramSimilarity(field, query) for field in fields]
+    similarity = Greatest(*similarities) if len(similarities) > 1 else similarities[0]
+
+    return (
+        queryset
+        .filter(Q(search_vector=search_query) | trigram | substring)
+        .annotate(
+            search_rank=SearchRank(F("search_vector"), search_query),
+            search_similarity=similarity,
+        )
+        .order_by(
+            F("search_rank").desc(nulls_last=True),
+            F("search_similarity").desc(nulls_last=True),
+            "-id",
+        )
+    )
@@ -1,80 +1,196 @@
+from django.db import transaction
 from rest_framework import serializers
+from .caching import invalidate
+from .images import variant_url_template
+from .instrumentation import timed_serialization
 from .models import (
     Watch, Music, FilmCollection, BookCollection,
     Wardrobe, GameCollection, Art,
     ExtrasCategory, Extra, Film, Book,
-    Instrument, List, LivePerformance
+    Instrument, List, LivePerformance, Job, JobItem
 )
 
-class WatchSerializer(serializers.ModelSerializer):
+class CollectionSerializer(serializers.ModelSerializer):
+    """
+    Base serializer for the collection endpoints.
+    GET requests can ask for a sparse fieldset with `?fields=title,poster` or
+    for the lightweight card representation with `?view=summary`, which uses
+    `Meta.summary_fields`. Code can pass `fields=[...]` directly instead.
+    The primary key is always included.
+    Each artwork URL field in `Meta.image_fields` that is returned gets a
+    `<field>_variants` URL template for its resized thumb/card/full copies
+    (see images.variant_url_template).
+    """
+    fields_query_param = "fields"
+    view_query_param = "view"
+
+    def __init__(self, *args, **kwargs):
+        fields = kwargs.pop("fields", None)
+        super().__init__(*args, **kwargs)
+        if fields is not None:
+            requested = set(fields) | {"id"}
+        else:
+            requested = self.requested_fields(self.context.get("request"))
+        if requested is not None:
+            for name in set(self.fields) - requested:
+                self.fields.pop(name)
+
+    def to_representation(self, instance):
+        with timed_serialization():
+            data = super().to_representation(instance)
+            for name in getattr(self.Meta, "image_fields", ()):
+                if name in data:
+                    data[f"{name}_variants"] = variant_url_template(data[name])
+            return data
+
+    @classmethod
+    def requested_fields(cls, request):
+        """
+        Returns the set of field names asked for by the request, or None
+        when the full representation should be used.
+        """
+        if request is None or request.method not in ("GET", "HEAD"):
+            return None
+        params = request.query_params
+        requested = None
+        if params.get(cls.fields_query_param):
+            requested = {f.strip() for f in params[cls.fields_query_param].split(",") if f.strip()}
+        elif params.get(cls.view_query_param) == "summary":
+            summary_fields = getattr(cls.Meta, "summary_fields", None)
+            if summary_fields:
+                requested = set(summary_fields)
+        if requested is None:
+            return None
+        requested.add("id")
+        return requested
+
+    @classmethod
+    def requested_columns(cls, request):
+        """
+        Returns the concrete model fields needed to serve the requested
+        fields, suitable for `QuerySet.only()`, or None for all columns.
+        """
+        requested = cls.requested_fields(request)
+        if requested is None:
+            return None
+        declared = cls().fields
+        concrete = {f.name for f in cls.Meta.model._meta.concrete_fields}
+        columns = set()
+        for name in requested:
+            field = declared.get(name)
+            if field is None:
+                continue
+            source = field.source.split(".")[0]
+            if source in concrete:
+                columns.add(source)
+        return columns or None
+
+class WatchSerializer(CollectionSerializer):
     class Meta:
         model = Watch
         fields = '__all__'
+        summary_fields = ["id", "brand", "collection", "model", "reference_number", "photo", "year", "price", "owned"]
+        image_fields = ["photo"]
 
-class MusicSerializer(serializers.ModelSerializer):
+class MusicSerializer(CollectionSerializer):
     class Meta:
         model = Music
         fields = "__all__"
+        summary_fields = ["id", "title", "artist", "format", "type", "release_date", "genre", "cover_art", "price", "owned"]
+        image_fields = ["cover_art"]
 
-class FilmCollectionSerializer(serializers.ModelSerializer):
+class FilmCollectionSerializer(CollectionSerializer):
     class Meta:
         model = FilmCollection
         fields = "__all__"
+        summary_fields = ["id", "title", "director", "format", "type", "release_year", "cover_art", "price", "owned"]
+        image_fields = ["cover_art"]
 
-class BookCollectionSerializer(serializers.ModelSerializer):
+class BookCollectionSerializer(CollectionSerializer):
     class Meta:
         model = BookCollection
         fields = "__all__"
+        summary_fields = ["id", "title", "author", "format", "publication_date", "cover_image", "price", "owned"]
+        image_fields = ["cover_image"]
 
-class WardrobeSerializer(serializers.ModelSerializer):
+class WardrobeSerializer(CollectionSerializer):
     class Meta:
         model = Wardrobe
         fields = "__all__"
+        summary_fields = ["id", "category", "type", "style", "brands", "colour", "pictures", "price", "owned"]
 
-class GameCollectionSerializer(serializers.ModelSerializer):
+class GameCollectionSerializer(CollectionSerializer):
     class Meta:
         model = GameCollection
         fields = "__all__"
+        summary_fields = ["id", "title", "special_title", "platform", "console", "release_date", "cover_art", "price", "owned"]
+        image_fields = ["cover_art"]
 
-class ArtSerializer(serializers.ModelSerializer):
+class ArtSerializer(CollectionSerializer):
     class Meta:
         model = Art
         fields = "__all__"
+        summary_fields = ["id", "title", "artist", "year", "year_specificity", "type", "photo", "price", "owned"]
+        image_fields = ["photo"]
 
-class ExtrasCategorySerializer(serializers.ModelSerializer):
+class ExtrasCategorySerializer(CollectionSerializer):
     class Meta:
         model = ExtrasCategory
         fields = "__all__"
+        summary_fields = ["id", "name"]
 
-class ExtraSerializer(serializers.ModelSerializer):
+class ExtraSerializer(CollectionSerializer):
     class Meta:
         model = Extra
         fields = "__all__"
+        summary_fields = ["id", "category", "theme", "brand", "model", "year", "photo", "price", "owned"]
+        image_fields = ["photo"]
 
-class FilmSerializer(serializers.ModelSerializer):
+class FilmSerializer(CollectionSerializer):
     class Meta:
         model = Film
-        fields = "__all__"
+        exclude = ["search_vector"]
+        summary_fields = [
+            "id", "title", "alt_title", "director", "alt_name", "poster", "rating",
+            "industry_rating", "release_date", "genre", "favourite", "seen",
+            "watchlist", "date_watched", "tmdb_id",
+        ]
+        image_fields = ["poster", "background_pic"]
 
-class BookSerializer(serializers.ModelSerializer):
+class BookSerializer(CollectionSerializer):
     class Meta:
         model = Book
-        fields = "__all__"
+        exclude = ["search_vector"]
+        summary_fields = [
+            "id", "title", "alt_title", "author", "alt_name", "cover", "rating",
+            "industry_rating", "year_released", "year_specificity", "genre",
+            "language", "read", "favourite", "readlist", "date_read",
+        ]
+        image_fields = ["cover"]
 
-class InstrumentSerializer(serializers.ModelSerializer):
+class InstrumentSerializer(CollectionSerializer):
     class Meta:
         model = Instrument
         fields = "__all__"
+        summary_fields = ["id", "instrument", "brand", "name", "maker", "category", "type", "year", "photo", "price", "owned"]
+        image_fields = ["photo"]
 
-class ListSerializer(serializers.ModelSerializer):
-    films = FilmSerializer(many=True, read_only=True)
+class ListSerializer(CollectionSerializer):
+    """
+    Lists are returned with their member counts and a few cover images;
+    the members themselves are served, paginated, by the `items` action.
+    """
     films_ids = serializers.ListField(
         child=serializers.IntegerField(), write_only=True, required=False
     )
-    books = BookSerializer(many=True, read_only=True)
     books_ids = serializers.ListField(
         child=serializers.IntegerField(), write_only=True, required=False
     )
+    film_count = serializers.SerializerMethodField()
+    book_count = serializers.SerializerMethodField()
+    covers = serializers.SerializerMethodField()
+
+    COVER_COUNT = 4
 
     class Meta:
         model = List
@@ -83,78 +199,143 @@ class ListSerializer(serializers.ModelSerializer):
             "name",
             "description",
             "category",
-            "films",
             "films_ids",
-            "books",
             "books_ids",
+            "film_count",
+            "book_count",
+            "covers",
             "created_at",
         ]
+        summary_fields = ["id", "name", "description", "category", "created_at"]
+
+    # Counts and covers come from the annotations/prefetches set up in
+    # ListViewSet.get_queryset, with a query fallback for fresh instances
+    def get_film_count(self, obj):
+        count = getattr(obj, "film_count", None)
+        return count if count is not None else obj.films.count()
+
+    def get_book_count(self, obj):
+        count = getattr(obj, "book_count", None)
+        return count if count is not None else obj.books.count()
+
+    def get_covers(self, obj):
+        if obj.category == "book":
+            members = getattr(obj, "cover_books", None)
+            if members is None:
+                members = obj.books.exclude(cover__isnull=True).exclude(cover="").order_by("-id")[:self.COVER_COUNT]
+            return [book.cover for book in members]
+        members = getattr(obj, "cover_films", None)
+        if members is None:
+            members = obj.films.exclude(poster__isnull=True).exclude(poster="").order_by("-id")[:self.COVER_COUNT]
+        return [film.poster for film in members]
 
     def validate(self, data):
         category = data.get("category")
-        films = data.get("films", [])
-        books = data.get("books", [])
         if category == "film":
-            if books or data.get("books_ids"):
+            if data.get("books_ids"):
                 raise serializers.ValidationError("Book items are not allowed in a Film list.")
             data["books_ids"] = []  # Ensure books_ids is empty
         elif category == "book":
-            if films or data.get("films_ids"):
+            if data.get("films_ids"):
                 raise serializers.ValidationError("Film items are not allowed in a Book list.")
             data["films_ids"] = []  # Ensure films_ids is empty
         return data
 
     def validate_films_ids(self, value):
+        return self.validate_member_ids(value, Film, "film")
+
+    def validate_books_ids(self, value):
+        return self.validate_member_ids(value, Book, "book")
+
+    def validate_member_ids(self, value, model, label):
+        """
+        Checks every submitted id with a single IN query and reports all of
+        the missing ones together. Returns the ids de-duplicated, in order.
+        """
         if not value:
             return []
-        invalid_ids = []
-        for fid in value:
-            try:
-                film_id = int(fid)  # Ensure integer
-                if not Film.objects.filter(id=film_id).exists():
-                    invalid_ids.append(f"{film_id} (not found in database)")
-            except (ValueError, TypeError) as e:
-                invalid_ids.append(f"{fid} (invalid format: {type(fid)})")
+        ids = list(dict.fromkeys(value))
+        found = set(model.objects.filter(id__in=ids).values_list("id", flat=True))
+        invalid_ids = [f"{member_id} (not found in database)" for member_id in ids if member_id not in found]
         if invalid_ids:
-            raise serializers.ValidationError(f"Invalid film IDs: {invalid_ids}")
-        return value
+            raise serializers.ValidationError(f"Invalid {label} IDs: {invalid_ids}")
+        return ids
 
     def create(self, validated_data):
-        films_ids = validated_data.pop("films_ids", [])
-        books_ids = validated_data.pop("books_ids", [])
-        instance = super().create(validated_data)
-        if films_ids:
-            instance.films.set(films_ids)
-        if books_ids:
-            instance.books.set(books_ids)
+        films_ids = validated_data.pop("films_ids", None)
+        books_ids = validated_data.pop("books_ids", None)
+        with transaction.atomic():
+            instance = super().create(validated_data)
+            if films_ids:
+                self.set_members(instance, "films", films_ids, created=True)
+            if books_ids:
+                self.set_members(instance, "books", books_ids, created=True)
         return instance
 
     def update(self, instance, validated_data):
-        films_ids = validated_data.pop("films_ids", [])
-        books_ids = validated_data.pop("books_ids", [])
-        instance = super().update(instance, validated_data)
-        if films_ids:
-            instance.films.set(films_ids)
-        if books_ids:
-            instance.books.set(books_ids)
+        # Ids that are sent replace the membership (an empty list clears it);
+        # omitted ids leave it untouched
+        films_ids = validated_data.pop("films_ids", None)
+        books_ids = validated_data.pop("books_ids", None)
+        with transaction.atomic():
+            instance = super().update(instance, validated_data)
+            if films_ids is not None:
+                self.set_members(instance, "films", films_ids)
+            if books_ids is not None:
+                self.set_members(instance, "books", books_ids)
         return instance
 
-    def validate_books_ids(self, value):
-        if not value:
-            return []
-        invalid_ids = []
-        for bid in value:
-            try:
-                book_id = int(bid)
-                if not Book.objects.filter(id=book_id).exists():
-                    invalid_ids.append(f"{book_id} (not found in database)")
-            except (ValueError, TypeError) as e:
-                invalid_ids.append(f"{bid} (invalid format: {type(bid)})")
-        if invalid_ids:
-            raise serializers.ValidationError(f"Invalid book IDs: {invalid_ids}")
-        return value
-    
-class LivePerformanceSerializer(serializers.ModelSerializer):
+    def set_members(self, instance, relation, ids, created=False):
+        """
+        Applies `ids` as the list's members for `relation` by diffing against
+        the through table: one read, one DELETE for removed ids and batched
+        INSERTs for new ones, whatever the size of the list.
+        """
+        manager = getattr(instance, relation)
+        through = manager.through
+        source = f"{manager.source_field_name}_id"
+        target = f"{manager.target_field_name}_id"
+
+        current = set() if created else set(
+            through.objects.filter(**{source: instance.pk}).values_list(target, flat=True)
+        )
+        wanted = set(ids)
+        removed = current - wanted
+        if removed:
+            through.objects.filter(**{source: instance.pk, f"{target}__in": removed}).delete()
+        added = [member_id for member_id in ids if member_id not in current]
+        if added:
+            through.objects.bulk_create(
+                [through(**{source: instance.pk, target: member_id}) for member_id in added],
+                batch_size=500,
+                ignore_conflicts=True,
+            )
+        if removed or added:
+            # Through-table writes don't send m2m_changed
+            invalidate(List)
+
+class LivePerformanceSerializer(CollectionSerializer):
     class Meta:
         model = LivePerformance
-        fields = "__all__"
\ No newline at end of file
+        fields = "__all__"
+        summary_fields = [
+            "id", "title", "original_title", "performance_type", "creator", "year",
+            "year_specificity", "date_seen", "rating", "images", "seen",
+        ]
+        # Despite its name, `images` holds a single URL
+        image_fields = ["images"]
+
+class JobItemSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = JobItem
+        fields = ["position", "item", "status", "detail"]
+
+class JobSerializer(serializers.ModelSerializer):
+    items = JobItemSerializer(many=True, read_only=True)
+
+    class Meta:
+        model = Job
+        fields = [
+            "id", "kind", "status", "total", "processed", "error",
+            "created_at", "started_at", "finished_at", "items",
+        ]
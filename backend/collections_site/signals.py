@@ -0,0 +1,58 @@
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+from .caching import invalidate
+from .frontpage import FRONTPAGE_FIELDS, invalidate_frontpage
+from .models import (
+    Art, Book, BookCollection, Extra, ExtrasCategory, Film, FilmCollection,
+    GameCollection, Instrument, List, LivePerformance, Music, Wardrobe, Watch,
+)
+
+
+@receiver(post_save, sender=Film)
+def film_saved(sender, instance, created, update_fields=None, **kwargs):
+    """
+    Drops the cached films dashboard when a saved film could change it.
+    Uses the values tracked since Film.from_db to skip unrelated edits.
+    """
+    if created:
+        invalidate_frontpage()
+        return
+    if update_fields is not None and not set(update_fields) & set(FRONTPAGE_FIELDS):
+        return
+    if instance.has_changed(FRONTPAGE_FIELDS):
+        invalidate_frontpage()
+
+
+@receiver(post_delete, sender=Film)
+def film_deleted(sender, instance, **kwargs):
+    invalidate_frontpage()
+
+
+# Models served from the response or dashboard caches. Receivers are
+# connected per model: a receiver without a sender disables fast deletes for
+# every model, so cascades (e.g. a film's FilmCredit rows) would load and
+# signal each related row.
+CACHED_MODELS = (
+    Watch, Music, FilmCollection, BookCollection, Wardrobe, GameCollection,
+    Art, ExtrasCategory, Extra, Film, Book, Instrument, List, LivePerformance,
+)
+
+
+def model_changed(sender, **kwargs):
+    """
+    Bumps the model's version so cached API responses built from it are
+    no longer served.
+    """
+    invalidate(sender)
+
+
+for model in CACHED_MODELS:
+    post_save.connect(model_changed, sender=model, dispatch_uid=f"model_changed_save_{model._meta.label_lower}")
+    post_delete.connect(model_changed, sender=model, dispatch_uid=f"model_changed_delete_{model._meta.label_lower}")
+
+
+@receiver(m2m_changed, sender=List.films.through)
+@receiver(m2m_changed, sender=List.books.through)
+def list_members_changed(sender, action, **kwargs):
+    if action in ("post_add", "post_remove", "post_clear"):
+        invalidate(List)
@@ -0,0 +1,170 @@
+from django.db import connections
+from django.db.models import Avg, Count, F, Q
+from django.db.models.functions import ExtractYear, Floor
+from .models import Film, FilmCredit
+
+TOP_PEOPLE = 10
+MIN_RATED_FILMS = 4  # People need this many rated films to rank by average
+
+
+def rounded(value, digits=2):
+    return round(float(value), digits) if value is not None else None
+
+
+def group_counts(queryset, key):
+    """
+    Films per value of `key` with their average rating, largest first.
+    """
+    rows = (
+        queryset.exclude(**{f"{key}__isnull": True})
+        .values(key)
+        .annotate(count=Count("id"), avg_rating=Avg("rating"))
+        .order_by("-count", key)
+    )
+    return [
+        {"value": row[key], "count": row["count"], "avg_rating": rounded(row["avg_rating"])}
+        for row in rows
+    ]
+
+
+def unnested_counts(queryset, sql_by_vendor):
+    """
+    Like group_counts for multi-valued columns, which need vendor-specific
+    SQL to expand into one row per value. `sql_by_vendor` maps a vendor to
+    a SELECT over the film ids in %s returning (value, count, avg_rating).
+    """
+    connection = connections[queryset.db]
+    sql = sql_by_vendor.get(connection.vendor)
+    if sql is None:
+        return []
+    ids_sql, params = queryset.values("id").query.sql_with_params()
+    with connection.cursor() as cursor:
+        cursor.execute(sql % ids_sql, params)
+        return [
+            {"value": value, "count": count, "avg_rating": rounded(avg_rating)}
+            for value, count, avg_rating in cursor.fetchall()
+        ]
+
+
+GENRE_SQL = {
+    "postgresql": """
+        SELECT g.value, COUNT(*), AVG(f.rating)
+        FROM collections_site_film f
+        CROSS JOIN LATERAL jsonb_array_elements_text(
+            CASE WHEN jsonb_typeof(f.genre) = 'array' THEN f.genre ELSE '[]'::jsonb END
+        ) AS g(value)
+        WHERE f.id IN (%s)
+        GROUP BY g.value ORDER BY COUNT(*) DESC, g.value
+    """,
+    "sqlite": """
+        SELECT g.value, COUNT(*), AVG(f.rating)
+        FROM collections_site_film f, json_each(
+            CASE WHEN json_type(f.genre) = 'array' THEN f.genre ELSE '[]' END
+        ) AS g
+        WHERE f.id IN (%s)
+        GROUP BY g.value ORDER BY COUNT(*) DESC, g.value
+    """,
+}
+
+# Film.country holds a comma-separated list such as "US, GB"
+COUNTRY_SQL = {
+    "postgresql": """
+        SELECT TRIM(c.value), COUNT(*), AVG(f.rating)
+        FROM collections_site_film f
+        CROSS JOIN LATERAL unnest(string_to_array(f.country, ',')) AS c(value)
+        WHERE f.id IN (%s) AND TRIM(c.value) <> ''
+        GROUP BY TRIM(c.value) ORDER BY COUNT(*) DESC, TRIM(c.value)
+    """,
+    "sqlite": """
+        SELECT TRIM(c.value), COUNT(*), AVG(f.rating)
+        FROM collections_site_film f, json_each(
+            '["' || replace(replace(f.country, '"', ''), ',', '","') || '"]'
+        ) AS c
+        WHERE f.id IN (%s) AND f.country IS NOT NULL AND TRIM(c.value) <> ''
+        GROUP BY TRIM(c.value) ORDER BY COUNT(*) DESC, TRIM(c.value)
+    """,
+}
+
+
+def top_people(credits, limit=TOP_PEOPLE):
+    """
+    Ranks the people in a FilmCredit queryset by number of films and by
+    average rating (among people with enough rated films).
+    """
+    people = credits.values("person").annotate(
+        count=Count("film", distinct=True),
+        rated=Count("film", distinct=True, filter=Q(film__rating__isnull=False)),
+        avg_rating=Avg("film__rating"),
+    )
+
+    def rows(queryset):
+        return [
+            {"name": row["person"], "count": row["count"], "avg_rating": rounded(row["avg_rating"])}
+            for row in queryset[:limit]
+        ]
+
+    return {
+        "most_films": rows(people.order_by("-count", "-avg_rating", "person")),
+        "highest_rated": rows(
+            people.filter(rated__gte=MIN_RATED_FILMS).order_by("-avg_rating", "-count", "person")
+        ),
+    }
+
+
+def film_stats(queryset=None):
+    """
+    Library-wide film statistics, computed with aggregate queries.
+    """
+    films = queryset if queryset is not None else Film.objects.all()
+    films = films.order_by()
+
+    totals = films.aggregate(
+        total=Count("id"),
+        seen=Count("id", filter=Q(seen=True)),
+        watchlist=Count("id", filter=Q(watchlist=True)),
+        favourites=Count("id", filter=Q(favourite=True)),
+        rated=Count("id", filter=Q(rating__isnull=False)),
+        avg_rating=Avg("rating"),
+        avg_industry_rating=Avg("industry_rating"),
+        avg_difference=Avg(
+            F("rating") - F("industry_rating"),
+            filter=Q(rating__isnull=False, industry_rating__isnull=False),
+        ),
+    )
+    for key in ("avg_rating", "avg_industry_rating", "avg_difference"):
+        totals[key] = rounded(totals[key])
+
+    rating_histogram = [
+        {"rating": rounded(row["rating"], 1), "count": row["count"]}
+        for row in films.filter(rating__isnull=False)
+        .values("rating").annotate(count=Count("id")).order_by("rating")
+    ]
+    industry_histogram = [
+        {"rating": int(row["bucket"]), "count": row["count"]}
+        for row in films.filter(industry_rating__isnull=False)
+        .annotate(bucket=Floor("industry_rating"))
+        .values("bucket").annotate(count=Count("id")).order_by("bucket")
+    ]
+
+    dated = films.filter(release_date__isnull=False).annotate(year=ExtractYear("release_date"))
+    by_year = sorted(group_counts(dated, "year"), key=lambda row: row["value"])
+    by_decade = sorted(
+        group_counts(dated.annotate(decade=Floor(F("year") / 10) * 10), "decade"),
+        key=lambda row: row["value"],
+    )
+    for row in by_decade:
+        row["value"] = int(row["value"])
+
+    credits = FilmCredit.objects.filter(film__in=films.values("id"))
+    return {
+        "totals": totals,
+        "rating_histogram": rating_histogram,
+        "industry_rating_histogram": industry_histogram,
+        "by_year": by_year,
+        "by_decade": by_decade,
+        "by_genre": unnested_counts(films, GENRE_SQL),
+        "by_language": group_counts(films.exclude(language=""), "language"),
+        "by_country": unnested_counts(films, COUNTRY_SQL),
+        "directors": top_people(credits.filter(kind="crew", role="Director")),
+        "actors": top_people(credits.filter(kind="cast")),
+    }
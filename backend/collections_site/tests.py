@@ -1,3 +1,546 @@
-from django.test import TestCase
+import io
+import shutil
+import tempfile
+import time
+from datetime import timedelta
+from unittest import mock, skipIf
+from django.conf import settings
+from django.core.cache import cache
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import IntegrityError, connections
+from django.db.models.signals import post_delete
+from django.test import TestCase, TransactionTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.test import APIClient
+from .frontpage import FRONTPAGE_CACHE_KEY, FRONTPAGE_FIELDS
+from .images import Image, ImageCache, public_address, source_token
+from .ingest import map_tmdb_film, upsert_films
+from .models import Film, FilmCredit, List, Watch
+from .tmdb_cache import TMDbCache
+from .views import WatchViewSet
 
-# Create your tests here.
+
+def follow_pages(client, url):
+    """
+    Requests `url` and every `next` link after it; returns the pages.
+    """
+    pages = []
+    while url:
+        response = client.get(url)
+        assert response.status_code == 200, response.content
+        pages.append(response.json())
+        url = pages[-1]["next"]
+    return pages
+
+
+class PaginationTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.watches = [Watch.objects.create(brand="Brand", model=f"Model {i}") for i in range(7)]
+
+    def test_unpaginated_without_limit_or_cursor(self):
+        response = self.client.get("/api/watches/")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.json()), 7)
+
+    def test_keyset_pages_cover_every_row_once(self):
+        pages = follow_pages(self.client, "/api/watches/?limit=3")
+        self.assertEqual([len(page["results"]) for page in pages], [3, 3, 1])
+        self.assertEqual(pages[0]["count"], 7)
+        self.assertFalse(pages[0]["count_is_estimate"])
+        ids = [row["id"] for page in pages for row in page["results"]]
+        self.assertEqual(ids, sorted((watch.id for watch in self.watches), reverse=True))
+
+    def test_count_can_be_skipped(self):
+        response = self.client.get("/api/watches/?limit=3&count=false")
+        self.assertIsNone(response.json()["count"])
+
+    def test_offset_pages_follow_custom_ordering(self):
+        lst = List.objects.create(name="Favourites", category="film")
+        titles = ["Delta", "Alpha", "Echo", "Charlie", "Bravo"]
+        lst.films.set([Film.objects.create(title=title) for title in titles])
+
+        pages = follow_pages(self.client, f"/api/lists/{lst.id}/items/?limit=2&ordering=title")
+        self.assertEqual([len(page["results"]) for page in pages], [2, 2, 1])
+        self.assertEqual([row["title"] for page in pages for row in page["results"]], sorted(titles))
+
+
+class FilmCreditTests(TestCase):
+    def setUp(self):
+        self.film = Film.objects.create(
+            title="Heat",
+            director="Michael Mann",
+            cast=[{"actor": "Al Pacino", "role": "Hanna"}, {"actor": "Robert De Niro", "role": "McCauley"}],
+            crew=[{"name": "Dante Spinotti", "role": "Director of Photography"}],
+        )
+
+    def credits(self, film):
+        return list(FilmCredit.objects.filter(film=film).values_list("kind", "person", "role"))
+
+    def test_credits_built_on_create(self):
+        self.assertEqual(self.credits(self.film), [
+            ("cast", "Al Pacino", "Hanna"),
+            ("cast", "Robert De Niro", "McCauley"),
+            ("crew", "Dante Spinotti", "Director of Photography"),
+            ("crew", "Michael Mann", "Director"),
+        ])
+
+    def test_in_place_edit_rebuilds_credits(self):
+        film = Film.objects.get(pk=self.film.pk)
+        film.cast.append({"actor": "Val Kilmer", "role": "Shiherlis"})
+        film.save()
+        self.assertIn(("cast", "Val Kilmer", "Shiherlis"), self.credits(film))
+
+    def test_unrelated_edit_keeps_credit_rows(self):
+        before = list(FilmCredit.objects.filter(film=self.film).values_list("id", flat=True))
+        film = Film.objects.get(pk=self.film.pk)
+        film.rating = 9
+        film.save()
+        self.assertEqual(list(FilmCredit.objects.filter(film=film).values_list("id", flat=True)), before)
+
+    def test_front_page_fields_are_tracked(self):
+        self.assertLessEqual(set(FRONTPAGE_FIELDS), Film.TRACKED_FIELDS)
+
+    def test_person_filters_use_credits(self):
+        other = Film.objects.create(title="Collateral", director="Michael Mann", cast=[{"actor": "Tom Cruise"}])
+        Film.objects.create(title="Alien", director="Ridley Scott")
+        client = APIClient()
+
+        by_director = client.get("/api/films/?director=michael mann").json()
+        self.assertEqual({row["id"] for row in by_director}, {self.film.id, other.id})
+        by_actor = client.get("/api/films/?actor=Tom Cruise").json()
+        self.assertEqual([row["id"] for row in by_actor], [other.id])
+
+
+class JSONArrayFilterTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.drama = Film.objects.create(title="Drama", genre=["Drama"], tags=["classic"])
+        self.comedy_drama = Film.objects.create(title="Dramedy", genre=["Comedy", "Drama"], tags=[])
+        self.horror = Film.objects.create(title="Horror", genre=["Horror", "Comedy"], tags=["classic"])
+        self.untagged = Film.objects.create(title="Untagged", genre=[], tags=None)
+
+    def ids(self, query):
+        response = self.client.get(f"/api/films/?{query}")
+        self.assertEqual(response.status_code, 200)
+        return {row["id"] for row in response.json()}
+
+    def test_any_of(self):
+        expected = {self.drama.id, self.comedy_drama.id, self.horror.id}
+        self.assertEqual(self.ids("genre=Drama&genre=Horror"), expected)
+        self.assertEqual(self.ids("genre=Drama,Horror"), expected)
+
+    def test_all_of(self):
+        self.assertEqual(self.ids("genre__all=Comedy,Drama"), {self.comedy_drama.id})
+
+    def test_exclude_keeps_rows_without_the_value(self):
+        self.assertEqual(self.ids("genre__exclude=Comedy"), {self.drama.id, self.untagged.id})
+
+    def test_matching_is_exact_on_elements(self):
+        self.assertEqual(self.ids("genre=Dram"), set())
+
+    def test_filters_combine_across_fields(self):
+        self.assertEqual(self.ids("tags=classic&genre__exclude=Horror"), {self.drama.id})
+
+    def test_filters_apply_before_the_quick_search_limit(self):
+        self.assertEqual(self.ids("q=Dram&genre=Comedy"), {self.comedy_drama.id})
+        Film.objects.bulk_create(Film(title=f"Drama {i}", genre=["Drama"]) for i in range(12))
+        self.assertEqual(len(self.ids("q=Drama&genre=Drama")), 10)
+
+
+def tmdb_movie(tmdb_id, title, **extra):
+    return {
+        "id": tmdb_id,
+        "title": title,
+        "vote_average": 7.84,
+        "genres": [{"name": "Drama"}],
+        "credits": {
+            "cast": [{"name": "Actor One", "character": "Lead"}],
+            "crew": [{"name": "Some Director", "job": "Director"}],
+        },
+        **extra,
+    }
+
+
+class UpsertFilmsTests(TestCase):
+    def test_second_import_is_a_no_op(self):
+        rows = [map_tmdb_film(tmdb_movie(1, "First")), map_tmdb_film(tmdb_movie(2, "Second"))]
+        first = upsert_films(rows)
+        self.assertEqual({status for status, _ in first.values()}, {"imported"})
+
+        second = upsert_films(rows)
+        self.assertEqual(second, {1: ("duplicate", None), 2: ("duplicate", None)})
+        self.assertEqual(Film.objects.count(), 2)
+        self.assertEqual(FilmCredit.objects.filter(person="Actor One").count(), 2)
+
+    def test_repeated_tmdb_id_in_one_call_is_written_once(self):
+        rows = [map_tmdb_film(tmdb_movie(3, "Once")), map_tmdb_film(tmdb_movie(3, "Twice"))]
+        upsert_films(rows)
+        self.assertEqual(list(Film.objects.values_list("title", flat=True)), ["Once"])
+
+    def test_refresh_updates_tmdb_fields_only(self):
+        upsert_films([map_tmdb_film(tmdb_movie(4, "Old Title"))])
+        Film.objects.filter(tmdb_id=4).update(rating=9)
+
+        results = upsert_films([map_tmdb_film(tmdb_movie(4, "New Title"))], refresh=True)
+        film = Film.objects.get(tmdb_id=4)
+        self.assertEqual(results[4], ("updated", {"id": film.id}))
+        self.assertEqual(film.title, "New Title")
+        self.assertEqual(film.rating, 9)
+        self.assertEqual(Film.objects.count(), 1)
+
+
+class ListMembershipTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.a, self.b, self.c = (Film.objects.create(title=title) for title in ("A", "B", "C"))
+        response = self.client.post(
+            "/api/lists/", {"name": "Watch next", "category": "film", "films_ids": [self.a.id, self.b.id]}, format="json"
+        )
+        self.assertEqual(response.status_code, 201, response.content)
+        self.list = List.objects.get(pk=response.json()["id"])
+
+    def rows(self):
+        return dict(List.films.through.objects.filter(list=self.list).values_list("film_id", "id"))
+
+    def patch(self, data):
+        return self.client.patch(f"/api/lists/{self.list.id}/", data, format="json")
+
+    def test_update_only_touches_changed_members(self):
+        before = self.rows()
+        self.assertEqual(self.patch({"films_ids": [self.b.id, self.c.id, self.c.id]}).status_code, 200)
+        after = self.rows()
+        self.assertEqual(set(after), {self.b.id, self.c.id})
+        # B's through row was kept, not deleted and re-inserted
+        self.assertEqual(after[self.b.id], before[self.b.id])
+
+    def test_omitted_ids_leave_members_alone(self):
+        self.assertEqual(self.patch({"name": "Renamed"}).status_code, 200)
+        self.assertEqual(set(self.rows()), {self.a.id, self.b.id})
+
+    def test_empty_list_clears_members(self):
+        self.assertEqual(self.patch({"films_ids": []}).status_code, 200)
+        self.assertEqual(self.rows(), {})
+
+    def test_unknown_ids_are_all_reported(self):
+        response = self.patch({"films_ids": [self.a.id, 98765, 98766]})
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("98765", str(response.json()))
+        self.assertIn("98766", str(response.json()))
+        self.assertEqual(set(self.rows()), {self.a.id, self.b.id})
+
+
+class ResponseCacheTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.watch = Watch.objects.create(brand="Brand", model="Original")
+
+    def test_second_request_is_a_hit(self):
+        first = self.client.get("/api/watches/")
+        second = self.client.get("/api/watches/")
+        self.assertEqual(first["X-Response-Cache"], "miss")
+        self.assertEqual(second["X-Response-Cache"], "hit")
+        self.assertEqual(first.json(), second.json())
+        self.assertEqual(first["ETag"], second["ETag"])
+
+    def test_matching_etag_gets_not_modified(self):
+        etag = self.client.get(f"/api/watches/{self.watch.id}/")["ETag"]
+        response = self.client.get(f"/api/watches/{self.watch.id}/", HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.content, b"")
+
+    def test_write_invalidates_after_commit(self):
+        etag = self.client.get("/api/watches/")["ETag"]
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.patch(f"/api/watches/{self.watch.id}/", {"model": "Changed"}, format="json")
+        self.assertEqual(response.status_code, 200)
+
+        response = self.client.get("/api/watches/", HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["X-Response-Cache"], "miss")
+        self.assertNotEqual(response["ETag"], etag)
+        self.assertEqual(response.json()[0]["model"], "Changed")
+
+    def test_delete_invalidates(self):
+        self.client.get("/api/watches/")
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.delete(f"/api/watches/{self.watch.id}/")
+        response = self.client.get("/api/watches/")
+        self.assertEqual(response["X-Response-Cache"], "miss")
+        self.assertEqual(response.json(), [])
+
+    def test_front_page_pools_dropped_after_commit(self):
+        cache.set(FRONTPAGE_CACHE_KEY, {"watchlist": []})
+        with self.captureOnCommitCallbacks(execute=True):
+            Film.objects.create(title="New", watchlist=True)
+            self.assertIsNotNone(cache.get(FRONTPAGE_CACHE_KEY))
+        self.assertIsNone(cache.get(FRONTPAGE_CACHE_KEY))
+
+    def test_derived_rows_keep_fast_deletes(self):
+        # Any delete receiver makes cascades load and signal every row
+        self.assertFalse(post_delete.has_listeners(FilmCredit))
+
+
+class BulkWriteTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.kept = Watch.objects.create(brand="Brand", model="Kept")
+        self.doomed = Watch.objects.create(brand="Brand", model="Doomed")
+
+    def bulk(self, url, data):
+        return self.client.post(url, data, format="json")
+
+    def models(self):
+        return sorted(Watch.objects.values_list("model", flat=True))
+
+    def test_applies_every_section(self):
+        response = self.bulk("/api/watches/bulk/", {
+            "create": [{"brand": "New", "model": "One"}],
+            "update": [{"id": self.kept.id, "model": "Renamed"}],
+            "delete": [self.doomed.id],
+        })
+        self.assertEqual(response.status_code, 200, response.content)
+        results = response.json()
+        self.assertEqual(results["create"][0]["status"], "created")
+        self.assertEqual(results["update"], [{"id": self.kept.id, "status": "updated"}])
+        self.assertEqual(results["delete"], [{"id": self.doomed.id, "status": "deleted"}])
+        self.assertEqual(self.models(), ["One", "Renamed"])
+
+    def test_one_invalid_item_writes_nothing(self):
+        response = self.bulk("/api/watches/bulk/", {
+            "create": [{"brand": "New", "model": "One"}, {"brand": "New"}],
+            "update": [{"id": self.kept.id, "model": "Renamed"}],
+            "delete": [self.doomed.id, 98765],
+        })
+        self.assertEqual(response.status_code, 400)
+        results = response.json()
+        self.assertEqual([result["status"] for result in results["create"]], ["valid", "invalid"])
+        self.assertIn("model", results["create"][1]["errors"])
+        self.assertEqual(results["delete"][1], {"id": 98765, "status": "not found"})
+        self.assertEqual(self.models(), ["Doomed", "Kept"])
+
+    def test_items_clashing_on_a_unique_field_are_rejected(self):
+        response = self.bulk("/api/films/bulk/", {"create": [{"title": "A", "tmdb_id": 7}, {"title": "B", "tmdb_id": 7}]})
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual([result["status"] for result in response.json()["create"]], ["invalid", "invalid"])
+        self.assertFalse(Film.objects.exists())
+
+    def test_database_error_rolls_back_the_batch(self):
+        with mock.patch.object(WatchViewSet, "after_bulk_write", side_effect=IntegrityError("rejected")):
+            response = self.bulk("/api/watches/bulk/", {
+                "create": [{"brand": "New", "model": "One"}],
+                "delete": [self.doomed.id],
+            })
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("nothing was written", response.json()["detail"])
+        self.assertEqual(self.models(), ["Doomed", "Kept"])
+
+    def test_lists_do_not_support_bulk(self):
+        self.assertEqual(self.bulk("/api/lists/bulk/", {"create": []}).status_code, 405)
+
+
+class ImportTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+
+    def upload(self, url, name, content, **data):
+        data["file"] = SimpleUploadedFile(name, content.encode("utf-8"))
+        response = self.client.post(url, data, format="multipart")
+        self.assertEqual(response.status_code, 200, response.content)
+        return response.json()
+
+    def test_bad_rows_are_reported_by_line(self):
+        content = "\n".join([
+            '{"brand": "Brand", "model": "One"}',
+            '{"brand": "Brand", "model": ',
+            '',
+            '{"brand": "Brand"}',
+            '["not", "an", "object"]',
+            '{"brand": "Brand", "model": "Two"}',
+        ])
+        report = self.upload("/api/watches/import/", "watches.ndjson", content)
+        self.assertEqual(report["created"], 2)
+        self.assertEqual(report["failed"], 3)
+        self.assertEqual([error["line"] for error in report["errors"]], [2, 4, 5])
+        self.assertIn("Invalid JSON", report["errors"][0]["errors"]["detail"])
+        self.assertIn("model", report["errors"][1]["errors"])
+        self.assertEqual(sorted(Watch.objects.values_list("model", flat=True)), ["One", "Two"])
+
+    def test_csv_lines_count_the_header(self):
+        content = "brand,model\nBrand,One\n,Missing brand\n"
+        report = self.upload("/api/watches/import/", "watches.csv", content)
+        self.assertEqual(report["created"], 1)
+        self.assertEqual([error["line"] for error in report["errors"]], [3])
+
+    def test_rows_the_database_rejects_do_not_sink_the_batch(self):
+        content = "\n".join([
+            '{"title": "First", "tmdb_id": 11}',
+            '{"title": "Again", "tmdb_id": 11}',
+            '{"title": "Other", "tmdb_id": 12}',
+        ])
+        report = self.upload("/api/films/import/", "films.ndjson", content)
+        self.assertEqual(report["created"], 2)
+        self.assertEqual([error["line"] for error in report["errors"]], [2])
+        self.assertIn("Rejected by the database", report["errors"][0]["errors"]["detail"])
+        self.assertEqual(sorted(Film.objects.values_list("title", flat=True)), ["First", "Other"])
+
+
+class TMDbCacheStatsTests(TestCase):
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        self.addCleanup(TMDbCache(self.root).clear)
+
+    def test_counts_are_shared_between_instances(self):
+        # Each instance stands in for a separate process using the cache
+        web, worker = TMDbCache(self.root), TMDbCache(self.root)
+        web.set("/movie/1", None, {"id": 1})
+        web.get("/movie/1")
+        worker.get("/movie/1")
+        worker.get("/search/movie", {"query": "Heat"})
+        web.flush_stats()
+        worker.flush_stats()
+
+        stats = TMDbCache(self.root).stats()
+        self.assertEqual(stats["hits"], {"movie": 2})
+        self.assertEqual(stats["misses"], {"search": 1})
+        self.assertEqual(stats["hit_rate"], round(2 / 3, 3))
+        self.assertEqual(stats["entries"], {"movie": 1})
+
+    def test_clear_resets_counts(self):
+        cache = TMDbCache(self.root)
+        cache.get("/movie/1")
+        cache.clear()
+        self.assertEqual(cache.stats()["misses"], {})
+
+
+@override_settings(CONFIG={**settings.CONFIG, "RESPONSE_CACHE_TIMEOUT": 0, "DATABASE_REPLICA_STICKY_SECONDS": 10})
+class ReplicaRoutingTests(TransactionTestCase):
+    # Test runs define `replica` as a mirror of `default` (see settings.py).
+    # Not a TestCase: reads inside a transaction always use the primary.
+    databases = {"default", "replica"}
+
+    def setUp(self):
+        self.watch = Watch.objects.create(brand="Brand", model="Model")
+        self.client = APIClient()
+
+    def watch_queries(self, method, path, client=None, **kwargs):
+        """
+        Makes a request; returns how many queries on the watch table it
+        sent to the primary and to the replica.
+        """
+        with CaptureQueriesContext(connections["default"]) as primary, \
+                CaptureQueriesContext(connections["replica"]) as replica:
+            response = getattr(client or self.client, method)(path, format="json", **kwargs)
+        self.assertLess(response.status_code, 400, response.content)
+        return tuple(
+            sum("collections_site_watch" in query["sql"] for query in captured)
+            for captured in (primary, replica)
+        )
+
+    def data_age(self, seconds):
+        # consistent_reads sends reads of data changed within the window to
+        # the primary; moving its clock past the window leaves the client's
+        # stickiness to decide
+        return mock.patch("collections_site.db_routers.time", mock.Mock(time=lambda: time.time() + seconds))
+
+    def test_safe_reads_use_the_replica(self):
+        with self.data_age(11):
+            primary, replica = self.watch_queries("get", "/api/watches/")
+        self.assertEqual(primary, 0)
+        self.assertGreater(replica, 0)
+
+    def test_recently_changed_data_is_read_from_the_primary(self):
+        primary, replica = self.watch_queries("get", "/api/watches/")
+        self.assertGreater(primary, 0)
+        self.assertEqual(replica, 0)
+
+    def test_writes_and_the_reads_after_them_use_the_primary(self):
+        primary, replica = self.watch_queries("patch", f"/api/watches/{self.watch.id}/", data={"model": "New"})
+        self.assertGreater(primary, 0)
+        self.assertEqual(replica, 0)
+
+        with self.data_age(11):
+            # The same client reads its own write from the primary...
+            primary, replica = self.watch_queries("get", "/api/watches/")
+            self.assertGreater(primary, 0)
+            self.assertEqual(replica, 0)
+            # ...while other clients keep using the replica
+            other = APIClient(REMOTE_ADDR="10.0.0.2")
+            self.assertEqual(self.watch_queries("get", "/api/watches/", client=other)[0], 0)
+
+    def test_stickiness_expires(self):
+        self.watch_queries("patch", f"/api/watches/{self.watch.id}/", data={"model": "New"})
+        later = timezone.now() + timedelta(seconds=11)
+        with self.data_age(11), mock.patch("django.core.cache.backends.db.tz_now", return_value=later):
+            primary, replica = self.watch_queries("get", "/api/watches/")
+        self.assertEqual(primary, 0)
+        self.assertGreater(replica, 0)
+
+
+def png_bytes(width=400, height=600):
+    output = io.BytesIO()
+    Image.new("RGB", (width, height), "red").save(output, "PNG")
+    return output.getvalue()
+
+
+# The directory only switches variants on; files go to each test's ImageCache
+@override_settings(CONFIG={**settings.CONFIG, "IMAGE_CACHE_DIR": "image-cache"})
+class ImageVariantTests(TestCase):
+    source = "https://images.example.com/poster.png"
+
+    def setUp(self):
+        self.client = APIClient()
+        root = tempfile.mkdtemp()
+        image_cache = ImageCache(root)
+        self.addCleanup(shutil.rmtree, root, ignore_errors=True)
+        patcher = mock.patch("collections_site.views.get_image_cache", return_value=image_cache)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def variant_url(self, variant="card", source=None):
+        film = Film.objects.create(title="Poster", poster=source or self.source)
+        template = self.client.get(f"/api/films/{film.id}/").json()["poster_variants"]
+        return template.replace("{variant}", variant)
+
+    def test_one_template_per_image_field(self):
+        film = Film.objects.create(title="Poster", poster=self.source)
+        data = self.client.get(f"/api/films/{film.id}/").json()
+        self.assertEqual(data["poster_variants"], f"/api/images/{{variant}}.webp?s={source_token(self.source)}")
+        self.assertIsNone(data["background_pic_variants"])
+
+    @skipIf(Image is None, "Pillow is not installed")
+    def test_variant_is_resized_and_cached(self):
+        url = self.variant_url("thumb")
+        with mock.patch("collections_site.images.download", return_value=png_bytes()) as download:
+            first = self.client.get(url)
+            second = self.client.get(url)
+        self.assertEqual(first.status_code, 200)
+        self.assertEqual(first["Content-Type"], "image/webp")
+        self.assertIn("immutable", first["Cache-Control"])
+        with Image.open(io.BytesIO(b"".join(first.streaming_content))) as image:
+            self.assertEqual(image.width, 185)
+        self.assertEqual(second.status_code, 200)
+        download.assert_called_once()
+
+    def test_bad_token_and_unknown_variant(self):
+        url = self.variant_url()
+        self.assertEqual(self.client.get(url[:-3] + "xyz").status_code, 400)
+        self.assertEqual(self.client.get(url.replace("/card.", "/huge.")).status_code, 404)
+
+    def test_internal_hosts_are_never_fetched(self):
+        self.assertIsNone(public_address("127.0.0.1"))
+        self.assertIsNone(public_address("10.1.2.3"))
+        self.assertIsNone(public_address("169.254.169.254"))
+        self.assertEqual(public_address("8.8.8.8"), "8.8.8.8")
+
+        source = "http://169.254.169.254/latest/meta-data/"
+        url = self.variant_url(source=source)
+        with mock.patch("collections_site.images.requests.Session") as session, \
+                self.assertLogs("collections_site.images", "WARNING") as logs:
+            response = self.client.get(url)
+        session.assert_not_called()
+        self.assertIn("host is not public", logs.output[0])
+        # Falls back to the source URL rather than failing
+        self.assertEqual(response.status_code, 302)
+        self.assertEqual(response["Location"], source)
@@ -0,0 +1,283 @@
+import asyncio
+import logging
+import threading
+import time
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+import requests
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from .tmdb_cache import TMDbCache
+
+try:
+    import httpx
+except ImportError:  # Optional; without it async callers run the sync client in a thread
+    httpx = None
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BASE_URL = "https://api.themoviedb.org/3"
+RETRY_TOTAL = 3
+RETRY_BACKOFF = 0.5
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket rate limiter.
+    Tokens refill at `rate` per second up to `capacity`, so short bursts go
+    out immediately while the sustained rate stays under the limit.
+    """
+
+    def __init__(self, rate, capacity=None):
+        self.rate = float(rate)
+        self.capacity = float(capacity or rate)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def reserve(self, tokens=1):
+        """
+        Takes `tokens` from the bucket and returns how many seconds the caller
+        must wait before using them (0 if they were available).
+        """
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            self.tokens -= tokens
+            if self.tokens >= 0:
+                return 0.0
+            return -self.tokens / self.rate
+
+    def acquire(self, tokens=1):
+        delay = self.reserve(tokens)
+        if delay > 0:
+            time.sleep(delay)
+
+
+class TMDbClient:
+    """
+    TMDb API client with a pooled keep-alive session, retries with backoff
+    (honouring Retry-After on 429), a token-bucket rate limiter shared by
+    all threads and bounded concurrent fetching. The a*-methods do the same
+    over httpx for async views, without holding a thread while they wait.
+    Responses are read from and written to `cache` (a TMDbCache) when one is
+    given. Point `base_url` at a local stub server to test without the real
+    API, or use an offline cache to replay recorded responses.
+    """
+
+    def __init__(self, token=None, base_url=None, rate=40, burst=None,
+                 max_workers=8, pool_size=20, timeout=(3.05, 10), cache=None):
+        self.base_url = (base_url or DEFAULT_BASE_URL).rstrip("/")
+        self.cache = cache
+        self.timeout = timeout
+        self.max_workers = max_workers
+        self.pool_size = pool_size
+        self.limiter = TokenBucket(rate, burst)
+        # Shared httpx clients, one per long-lived event loop (see aget)
+        self._async_clients = weakref.WeakKeyDictionary()
+
+        retry = Retry(
+            total=RETRY_TOTAL,
+            backoff_factor=RETRY_BACKOFF,
+            status_forcelist=RETRY_STATUSES,
+            allowed_methods=("GET",),
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=pool_size, max_retries=retry)
+        self.session = requests.Session()
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.session.headers.update({
+            "accept": "application/json",
+            "Authorization": f"Bearer {token}",
+        })
+
+    def get(self, path, params=None):
+        """
+        GETs `path` (relative to the API root) and returns the decoded JSON,
+        or None on any HTTP or network error.
+        """
+        if self.cache is not None:
+            hit, payload = self.cache.get(path, params)
+            if hit:
+                return payload
+            if self.cache.offline:
+                logger.warning(f"TMDb offline mode: no cached response for {path} {params or ''}")
+                return None
+
+        self.limiter.acquire()
+        try:
+            response = self.session.get(f"{self.base_url}{path}", params=params, timeout=self.timeout)
+        except requests.RequestException as e:
+            logger.error(f"TMDb request {path} failed: {e}")
+            return None
+        if response.status_code != 200:
+            logger.error(f"TMDb request {path} failed: {response.status_code}")
+            return None
+        data = response.json()
+        if self.cache is not None:
+            self.cache.set(path, params, data)
+        return data
+
+    def _new_async_client(self):
+        connect, read = self.timeout
+        return httpx.AsyncClient(
+            base_url=self.base_url,
+            headers=dict(self.session.headers),
+            timeout=httpx.Timeout(read, connect=connect),
+            limits=httpx.Limits(max_connections=self.pool_size),
+        )
+
+    @asynccontextmanager
+    async def _async_session(self, shared):
+        if not shared:
+            async with self._new_async_client() as client:
+                yield client
+            return
+        loop = asyncio.get_running_loop()
+        client = self._async_clients.get(loop)
+        if client is None:
+            client = self._async_clients[loop] = self._new_async_client()
+        yield client
+
+    async def aget(self, path, params=None, shared_client=False):
+        """
+        Async get(): the same cache, rate limiter and retry policy, with the
+        request made over httpx so many lookups can wait on TMDb at once.
+        Pass `shared_client` only from a process-wide event loop (an ASGI
+        server): the loop keeps one pooled client for its lifetime. Otherwise,
+        e.g. async views under WSGI that get a new loop per request, each
+        call opens and closes its own client.
+        """
+        if httpx is None:
+            return await sync_to_async(self.get, thread_sensitive=False)(path, params)
+        if self.cache is not None:
+            hit, payload = self.cache.get(path, params)
+            if hit:
+                return payload
+            if self.cache.offline:
+                logger.warning(f"TMDb offline mode: no cached response for {path} {params or ''}")
+                return None
+
+        delay = self.limiter.reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        async with self._async_session(shared_client) as client:
+            for attempt in range(RETRY_TOTAL + 1):
+                retries_left = attempt < RETRY_TOTAL
+                try:
+                    response = await client.get(path, params=params)
+                except httpx.HTTPError as e:
+                    if not retries_left:
+                        logger.error(f"TMDb request {path} failed: {e}")
+                        return None
+                    await asyncio.sleep(RETRY_BACKOFF * 2 ** attempt)
+                    continue
+                if response.status_code in RETRY_STATUSES and retries_left:
+                    retry_after = response.headers.get("Retry-After", "")
+                    await asyncio.sleep(float(retry_after) if retry_after.isdigit() else RETRY_BACKOFF * 2 ** attempt)
+                    continue
+                break
+
+        if response.status_code != 200:
+            logger.error(f"TMDb request {path} failed: {response.status_code}")
+            return None
+        data = response.json()
+        if self.cache is not None:
+            self.cache.set(path, params, data)
+        return data
+
+    async def aget_movie_images(self, movie_id, shared_client=False):
+        return await self.aget(f"/movie/{movie_id}/images", shared_client=shared_client)
+
+    def search_movies(self, query):
+        data = self.get("/search/movie", {"query": query})
+        return data.get("results", []) if data else []
+
+    def get_movie(self, movie_id):
+        return self.get(f"/movie/{movie_id}", {"append_to_response": "credits"})
+
+    def get_movie_images(self, movie_id):
+        return self.get(f"/movie/{movie_id}/images")
+
+    def find_film(self, query, year=None):
+        """
+        Accepts either a TMDb id or a title and returns the film details
+        (with credits), or None. Titles can be narrowed by release year.
+        """
+        query = str(query).strip()
+        if query.isdigit():
+            return self.get_movie(query)
+
+        results = self.search_movies(query)
+        if not results:
+            logger.warning(f"No results found for query: {query}")
+            return None
+
+        movie_id = None
+        if year:
+            for r in results:
+                release_date = r.get("release_date") or ""
+                if release_date[:4].isdigit() and int(release_date[:4]) == year:
+                    movie_id = r["id"]
+                    break
+            if not movie_id:
+                logger.warning(f"No results matched year {year} for query: {query}")
+                return None
+        else:
+            movie_id = results[0]["id"]
+
+        return self.get_movie(movie_id)
+
+    def find_films(self, queries, max_workers=None):
+        """
+        Resolves many queries concurrently. Each query is a title/id string or
+        a (title, year) tuple. Results are returned in input order, with None
+        for queries that could not be resolved.
+        """
+        def resolve(query):
+            if isinstance(query, (tuple, list)):
+                return self.find_film(*query)
+            return self.find_film(query)
+
+        queries = list(queries)
+        if not queries:
+            return []
+        workers = max(1, min(max_workers or self.max_workers, len(queries)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(resolve, queries))
+
+
+_client = None
+_client_lock = threading.Lock()
+
+
+def get_client():
+    """
+    Returns the process-wide TMDbClient configured from settings.CONFIG.
+    """
+    global _client
+    with _client_lock:
+        if _client is None:
+            config = settings.CONFIG
+            cache = None
+            if config.get("TMDB_CACHE_DIR"):
+                cache = TMDbCache(
+                    config["TMDB_CACHE_DIR"],
+                    max_bytes=int(config.get("TMDB_CACHE_MAX_MB") or 256) * 1024 * 1024,
+                    offline=bool(config.get("TMDB_OFFLINE")),
+                )
+            _client = TMDbClient(
+                token=config.get("TMDB_READ_TOKEN"),
+                base_url=config.get("TMDB_API_BASE"),
+                rate=config.get("TMDB_RATE_LIMIT") or 40,
+                max_workers=config.get("TMDB_MAX_WORKERS") or 8,
+                cache=cache,
+            )
+        return _client
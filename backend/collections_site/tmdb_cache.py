@@ -0,0 +1,273 @@
+import atexit
+import hashlib
+import json
+import logging
+import os
+import re
+import shutil
+import tempfile
+import threading
+import time
+from collections import Counter
+from pathlib import Path
+from urllib.parse import urlencode
+
+try:
+    import fcntl
+except ImportError:  # Windows: the stats file is merged without a lock
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+DAY = 24 * 60 * 60
+
+# Seconds before a cached response is considered stale, per endpoint
+DEFAULT_TTLS = {
+    "search": 1 * DAY,
+    "movie": 7 * DAY,
+    "images": 1 * DAY,
+    "other": 1 * DAY,
+}
+
+STATS_FILE = "stats.json"
+STATS_LOCK_FILE = "stats.lock"
+# Lookups counted in memory before they are added to the stats file
+STATS_FLUSH_EVERY = 50
+
+
+def endpoint_for(path):
+    """
+    Maps a TMDb API path to the cache endpoint name used for TTLs and stats.
+    """
+    if path.startswith("/search/"):
+        return "search"
+    if re.fullmatch(r"/movie/\d+/images", path):
+        return "images"
+    if re.fullmatch(r"/movie/\d+", path):
+        return "movie"
+    return "other"
+
+
+def normalize_key(path, params=None):
+    """
+    Builds the cache key for a request. Parameters are sorted and the search
+    query is case- and whitespace-normalized so equivalent requests share an
+    entry.
+    """
+    normalized = []
+    for name, value in sorted((params or {}).items()):
+        value = str(value)
+        if name == "query":
+            value = " ".join(value.lower().split())
+        normalized.append((name, value))
+    return f"{path}?{urlencode(normalized)}" if normalized else path
+
+
+class TMDbCache:
+    """
+    Persistent on-disk cache of TMDb JSON responses.
+    Entries live in <root>/<endpoint>/<hash>.json and expire after the
+    endpoint's TTL. The cache is bounded by `max_bytes`; when it grows past
+    that, the least recently used entries (by mtime, refreshed on every hit)
+    are evicted. In `offline` mode only cached responses are served, expired
+    or not, so imports can be replayed deterministically without the network.
+    Hit/miss counts are kept per endpoint in <root>/stats.json, which every
+    process using the cache adds to, so `manage.py tmdb_cache` reports the
+    hit rate of the web and worker processes.
+    """
+
+    def __init__(self, root, ttls=None, max_bytes=256 * 1024 * 1024, offline=False):
+        self.root = Path(root)
+        self.ttls = {**DEFAULT_TTLS, **(ttls or {})}
+        self.max_bytes = max_bytes
+        self.offline = offline
+        self.lock = threading.Lock()
+        self._bytes = None
+        # Counts not yet added to the stats file
+        self.hits = Counter()
+        self.misses = Counter()
+        self._unflushed = 0
+        atexit.register(self.flush_stats)
+
+    def _path(self, endpoint, key):
+        digest = hashlib.sha1(key.encode("utf-8")).hexdigest()
+        return self.root / endpoint / f"{digest}.json"
+
+    def get(self, path, params=None):
+        """
+        Returns (hit, payload) for a request.
+        """
+        endpoint = endpoint_for(path)
+        key = normalize_key(path, params)
+        file_path = self._path(endpoint, key)
+        try:
+            with open(file_path, "r", encoding="utf-8") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            entry = None
+
+        fresh = entry is not None and entry.get("key") == key and (
+            self.offline or time.time() - entry.get("stored_at", 0) < self.ttls[endpoint]
+        )
+        with self.lock:
+            (self.hits if fresh else self.misses)[endpoint] += 1
+            self._unflushed += 1
+            flush = self._unflushed >= STATS_FLUSH_EVERY
+        if flush:
+            self.flush_stats()
+        if not fresh:
+            return False, None
+
+        try:
+            os.utime(file_path)  # Mark as recently used
+        except OSError:
+            pass
+        return True, entry["payload"]
+
+    def set(self, path, params, payload):
+        """
+        Stores a response and evicts old entries if the cache is over size.
+        """
+        if self.offline:
+            return
+        endpoint = endpoint_for(path)
+        key = normalize_key(path, params)
+        file_path = self._path(endpoint, key)
+        data = json.dumps({"key": key, "stored_at": time.time(), "payload": payload}).encode("utf-8")
+        try:
+            # An overwritten entry only adds the difference
+            previous = file_path.stat().st_size
+        except OSError:
+            previous = 0
+        try:
+            file_path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=file_path.parent, suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, file_path)
+        except OSError as e:
+            logger.warning(f"Could not write TMDb cache entry {key}: {e}")
+            return
+
+        with self.lock:
+            if self._bytes is None:
+                self._bytes = self.size()
+            else:
+                self._bytes += len(data) - previous
+            over = self._bytes > self.max_bytes
+        if over:
+            self.evict()
+
+    def _entries(self):
+        for file_path in self.root.glob("*/*.json"):
+            try:
+                stat = file_path.stat()
+            except OSError:
+                continue
+            yield file_path, stat.st_mtime, stat.st_size
+
+    def size(self):
+        return sum(size for _, _, size in self._entries())
+
+    def evict(self, target_ratio=0.9):
+        """
+        Removes least recently used entries until the cache is below
+        `target_ratio` of max_bytes. Returns the number of entries removed.
+        """
+        entries = sorted(self._entries(), key=lambda e: e[1])
+        total = sum(size for _, _, size in entries)
+        target = self.max_bytes * target_ratio
+        removed = 0
+        for file_path, _, size in entries:
+            if total <= target:
+                break
+            try:
+                file_path.unlink()
+            except OSError:
+                continue
+            total -= size
+            removed += 1
+        with self.lock:
+            self._bytes = total
+        return removed
+
+    def prune(self):
+        """
+        Removes expired entries and enforces the size bound.
+        Returns the number of entries removed.
+        """
+        removed = 0
+        now = time.time()
+        for file_path, _, _ in list(self._entries()):
+            try:
+                with open(file_path, "r", encoding="utf-8") as f:
+                    stored_at = json.load(f).get("stored_at", 0)
+            except (OSError, ValueError):
+                stored_at = 0
+            if now - stored_at >= self.ttls.get(file_path.parent.name, self.ttls["other"]):
+                file_path.unlink(missing_ok=True)
+                removed += 1
+        return removed + self.evict(target_ratio=1.0)
+
+    def clear(self):
+        shutil.rmtree(self.root, ignore_errors=True)
+        with self.lock:
+            self._bytes = 0
+            self.hits, self.misses, self._unflushed = Counter(), Counter(), 0
+
+    def _read_stats(self):
+        try:
+            with open(self.root / STATS_FILE, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def flush_stats(self):
+        """
+        Adds this process's hit/miss counts to the shared stats file and
+        resets them.
+        """
+        with self.lock:
+            hits, misses = self.hits, self.misses
+            self.hits, self.misses, self._unflushed = Counter(), Counter(), 0
+        if not hits and not misses:
+            return
+        try:
+            self.root.mkdir(parents=True, exist_ok=True)
+            # The stats file is replaced on every write, so lock a separate file
+            with open(self.root / STATS_LOCK_FILE, "a") as lock_file:
+                if fcntl is not None:
+                    fcntl.flock(lock_file, fcntl.LOCK_EX)
+                totals = self._read_stats()
+                for name, counts in (("hits", hits), ("misses", misses)):
+                    totals[name] = dict(Counter(totals.get(name, {})) + counts)
+                fd, tmp_path = tempfile.mkstemp(dir=self.root, suffix=".tmp")
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump(totals, f)
+                os.replace(tmp_path, self.root / STATS_FILE)
+        except OSError as e:
+            logger.warning(f"Could not update TMDb cache stats: {e}")
+
+    def stats(self):
+        """
+        Returns the hit/miss counts of every process since the cache was
+        last cleared, and on-disk usage per endpoint.
+        """
+        self.flush_stats()
+        totals = self._read_stats()
+        hits, misses = totals.get("hits", {}), totals.get("misses", {})
+        lookups = sum(hits.values()) + sum(misses.values())
+        entries = Counter()
+        sizes = Counter()
+        for file_path, _, size in self._entries():
+            entries[file_path.parent.name] += 1
+            sizes[file_path.parent.name] += size
+        return {
+            "offline": self.offline,
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": round(sum(hits.values()) / lookups, 3) if lookups else None,
+            "entries": dict(entries),
+            "bytes": dict(sizes),
+            "max_bytes": self.max_bytes,
+        }
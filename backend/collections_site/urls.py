@@ -4,7 +4,7 @@ from .views import (
     WatchViewSet, MusicViewSet, FilmCollectionViewSet, BookCollectionViewSet,
     WardrobeViewSet, GameCollectionViewSet, ArtViewSet,
     ExtrasCategoryViewSet, ExtraViewSet, FilmViewSet, BookViewSet,
-    InstrumentViewSet, ListViewSet, LivePerformanceViewSet, batch_import_films, fetch_tmdb_images, update_film_image
+    InstrumentViewSet, ListViewSet, LivePerformanceViewSet, batch_import_films, dashboard, film_frontpage, image_variant, job_detail, metrics, search, fetch_tmdb_images, update_film_image
 )
 
 router = routers.DefaultRouter()
@@ -24,8 +24,15 @@ router.register(r'lists', ListViewSet, basename="list")
 router.register(r'performances', LivePerformanceViewSet)
 
 urlpatterns = [
+    # Async views; before the router so films/frontpage/ isn't taken as a film id
+    path("films/frontpage/", film_frontpage, name="film_frontpage"),
+    path("search/", search, name="search"),
     path("", include(router.urls)),
     path("batch-import-films/", batch_import_films, name="batch_import_films"),
+    path("dashboard/", dashboard, name="dashboard"),
+    path("metrics/", metrics, name="metrics"),
+    path("images/<str:variant>.<str:image_format>", image_variant, name="image_variant"),
+    path("jobs/<int:pk>/", job_detail, name="job_detail"),
     path("films/<int:tmdb_id>/images/", fetch_tmdb_images, name="fetch_tmdb_images"),
     path("films/<int:pk>/update-image/", update_film_image, name="update_film_image"),
 ] 
\ No newline at end of file
@@ -1,186 +1,381 @@
-import requests
+import csv
 import logging
-from django.shortcuts import render
+from django.core import signing
+from django.core.handlers.asgi import ASGIRequest
+from django.http import FileResponse, Http404, HttpResponseBadRequest, HttpResponseRedirect, JsonResponse
+from django.shortcuts import get_object_or_404
+from django.views.decorators.http import require_GET
 from django.conf import settings
-from django.contrib.postgres.fields import JSONField, ArrayField
 from rest_framework import viewsets
-from rest_framework.decorators import api_view, action
+from rest_framework.decorators import api_view, action, permission_classes
+from rest_framework.parsers import MultiPartParser
+from rest_framework.permissions import IsAdminUser
 from rest_framework.response import Response
-from rest_framework.filters import SearchFilter
 from rest_framework import status
-from datetime import timedelta
-import time
-from django.db.models import Q
-from django.db.models.expressions import RawSQL
+from django.db.models import Count, F, OuterRef, Prefetch, Subquery
+from django.db.models.functions import Coalesce
 from .models import (
     Watch, Music, FilmCollection, BookCollection,
     Wardrobe, GameCollection, Art,
-    ExtrasCategory, Extra, Film, Book,
-    Instrument, List, LivePerformance
+    ExtrasCategory, Extra, Film, FilmCredit, Book,
+    Instrument, List, LivePerformance, Job, JobItem
 )
+from .asyncdb import gather_queries
+from .bulk import bulk_write
+from .caching import cache_response, finalize_cached_response
+from .dashboard import get_dashboard
+from .diagnostics import diagnose_queryset
+from .export import CSVRenderer, NDJSONRenderer, stream_export
+from .images import FORMATS, VARIANTS, get_image_cache, source_from_token
+from .importer import IMPORT_BATCH_SIZE, decode_lines, format_for, import_rows, json_fields_of, read_rows
+from .filters import JSONArrayFilter, RankedSearchFilter
+from .frontpage import aget_frontpage, invalidate_frontpage
+from .instrumentation import reset_metrics, route_metrics
+from .jobs import enqueue
+from .search import search_queryset
+from .stats import film_stats
+from .tmdb import get_client
 from .serializers import (
     WatchSerializer, MusicSerializer, FilmCollectionSerializer, BookCollectionSerializer,
     WardrobeSerializer, GameCollectionSerializer, ArtSerializer,
     ExtrasCategorySerializer, ExtraSerializer, FilmSerializer, BookSerializer,
-    InstrumentSerializer, ListSerializer, LivePerformanceSerializer
+    InstrumentSerializer, ListSerializer, LivePerformanceSerializer, JobSerializer
 )
 
 # Set up logging
 logger = logging.getLogger(__name__)
 
-# Existing ViewSets unchanged
-class WatchViewSet(viewsets.ModelViewSet):
+class CollectionViewSet(viewsets.ModelViewSet):
+    """
+    Base ViewSet for the collection endpoints.
+    When the serializer is asked for a sparse fieldset (`?fields=` or
+    `?view=summary`) only the matching columns are read from the database.
+    JSON array fields listed in `json_array_fields` can be filtered with
+    any-of/all-of/exclude query params (see JSONArrayFilter).
+    list/retrieve responses are cached and served with ETag/Last-Modified
+    until one of `cache_models` (default: the queryset's model) changes.
+    Query diagnostics for the filtered queryset are logged only when
+    enabled (see diagnostics.py).
+    POST `bulk/` applies many creates/updates/deletes in one transaction
+    unless `bulk_enabled` is False (see bulk.py).
+    GET `export/?format=ndjson|csv` streams the whole (filtered) collection
+    and POST `import/` loads an uploaded NDJSON/CSV file (see importer.py).
+    """
+    filter_backends = [JSONArrayFilter]
+    json_array_fields = ()
+    cache_models = None
+    bulk_enabled = True
+
+    def get_cache_models(self):
+        return self.cache_models or (self.queryset.model,)
+
+    @cache_response
+    def list(self, request, *args, **kwargs):
+        return super().list(request, *args, **kwargs)
+
+    @cache_response
+    def retrieve(self, request, *args, **kwargs):
+        return super().retrieve(request, *args, **kwargs)
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        response = super().finalize_response(request, response, *args, **kwargs)
+        return finalize_cached_response(request, response)
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        serializer_class = self.get_serializer_class()
+        if hasattr(serializer_class, "requested_columns"):
+            columns = serializer_class.requested_columns(self.request)
+            if columns:
+                queryset = queryset.only(*columns)
+        return queryset
+
+    @action(detail=False, methods=['post'])
+    def bulk(self, request):
+        """
+        Body: {"create": [{...}], "update": [{"id": 1, ...}], "delete": [ids]}.
+        Returns per-item results; 400 and no writes if any item is invalid.
+        """
+        if not self.bulk_enabled:
+            return Response(
+                {"detail": "Bulk writes are not supported for this collection."},
+                status=status.HTTP_405_METHOD_NOT_ALLOWED,
+            )
+        ok, results = bulk_write(self, request.data)
+        return Response(results, status=status.HTTP_200_OK if ok else status.HTTP_400_BAD_REQUEST)
+
+    @action(detail=False, methods=['get'], renderer_classes=[NDJSONRenderer, CSVRenderer])
+    def export(self, request):
+        """
+        Streams every row matching the usual filters as NDJSON (default) or
+        CSV; `?flatten=1` writes JSON fields as readable text in CSV cells.
+        """
+        queryset = self.filter_queryset(self.get_queryset())
+        flatten = request.query_params.get("flatten", "").lower() in ("1", "true", "yes")
+        return stream_export(
+            queryset,
+            self.get_serializer(),
+            request.accepted_renderer.format,
+            self.basename,
+            flatten=flatten,
+            asynchronous=isinstance(request._request, ASGIRequest),
+        )
+
+    @action(detail=False, methods=['post'], url_path='import', parser_classes=[MultiPartParser])
+    def import_file(self, request):
+        """
+        Creates objects from an uploaded `file` (.csv, or NDJSON otherwise;
+        override with a `file_format` field). Invalid rows are reported per
+        line and skipped; `batch_size` sets the rows per bulk insert.
+        """
+        upload = request.data.get("file")
+        if upload is None:
+            return Response({"file": ["No file was submitted."]}, status=status.HTTP_400_BAD_REQUEST)
+        file_format = request.data.get("file_format") or format_for(upload.name)
+        if file_format not in ("csv", "ndjson"):
+            return Response({"file_format": ["Use csv or ndjson."]}, status=status.HTTP_400_BAD_REQUEST)
+        try:
+            batch_size = max(1, int(request.data.get("batch_size") or IMPORT_BATCH_SIZE))
+        except ValueError:
+            return Response({"batch_size": ["Must be an integer."]}, status=status.HTTP_400_BAD_REQUEST)
+
+        json_fields = json_fields_of(self.get_serializer())
+        try:
+            rows = read_rows(decode_lines(upload), file_format, json_fields)
+            report = import_rows(self, rows, batch_size=batch_size)
+        except (UnicodeDecodeError, csv.Error) as e:
+            return Response({"file": [f"Could not read file: {e}"]}, status=status.HTTP_400_BAD_REQUEST)
+        return Response(report.as_dict())
+
+    def after_bulk_write(self, created, updated, update_fields):
+        """
+        Hook for work that save() or signals would normally do, run inside
+        the bulk transaction.
+        """
+
+    def filter_queryset(self, queryset):
+        queryset = super().filter_queryset(queryset)
+        diagnose_queryset(self.request, queryset)
+        return queryset
+
+
+class WatchViewSet(CollectionViewSet):
     queryset = Watch.objects.all()
     serializer_class = WatchSerializer
     
-class MusicViewSet(viewsets.ModelViewSet):
+class MusicViewSet(CollectionViewSet):
     queryset = Music.objects.all()
     serializer_class = MusicSerializer
+    json_array_fields = ("genre",)
 
-class FilmCollectionViewSet(viewsets.ModelViewSet):
+class FilmCollectionViewSet(CollectionViewSet):
     queryset = FilmCollection.objects.all()
     serializer_class = FilmCollectionSerializer
 
-class BookCollectionViewSet(viewsets.ModelViewSet):
+class BookCollectionViewSet(CollectionViewSet):
     queryset = BookCollection.objects.all()
     serializer_class = BookCollectionSerializer
 
-class WardrobeViewSet(viewsets.ModelViewSet):
+class WardrobeViewSet(CollectionViewSet):
     queryset = Wardrobe.objects.all()
     serializer_class = WardrobeSerializer
 
-class GameCollectionViewSet(viewsets.ModelViewSet):
+class GameCollectionViewSet(CollectionViewSet):
     queryset = GameCollection.objects.all()
     serializer_class = GameCollectionSerializer
+    json_array_fields = ("genre",)
 
-class ArtViewSet(viewsets.ModelViewSet):
+class ArtViewSet(CollectionViewSet):
     queryset = Art.objects.all()
     serializer_class = ArtSerializer
+    json_array_fields = ("tags",)
 
-class ExtrasCategoryViewSet(viewsets.ModelViewSet):
+class ExtrasCategoryViewSet(CollectionViewSet):
     queryset = ExtrasCategory.objects.all()
     serializer_class = ExtrasCategorySerializer
 
-class ExtraViewSet(viewsets.ModelViewSet):
+class ExtraViewSet(CollectionViewSet):
     queryset = Extra.objects.all()
     serializer_class = ExtraSerializer
 
-class FilmViewSet(viewsets.ModelViewSet):
-    queryset = Film.objects.all()
+class FilmViewSet(CollectionViewSet):
+    queryset = Film.objects.defer("search_vector")
     serializer_class = FilmSerializer
-    filter_backends = [SearchFilter]
+    filter_backends = [JSONArrayFilter, RankedSearchFilter]
     search_fields = ['title', 'alt_title', 'director', 'alt_name']
+    json_array_fields = ("genre", "tags")
+    quick_search_limit = 10
 
     def get_queryset(self):
         queryset = super().get_queryset()
         q = self.request.query_params.get('q')
-        director = self.request.query_params.get('directors')
+        director = self.request.query_params.get('directors') or self.request.query_params.get('director')
         actor = self.request.query_params.get('actor')
-        genre = self.request.query_params.get('genre')
         crew = self.request.query_params.get('crew')
 
-        logger.debug(f"Query params: q={q}, director={director}, actor={actor}, genre={genre}, crew={crew}")
+        logger.debug(f"Query params: q={q}, director={director}, actor={actor}, crew={crew}")
 
         # Apply individual filters independently
+        # People lookups go through the indexed FilmCredit table
         if director:
-            queryset = queryset.filter(director__iexact=director)
+            queryset = queryset.filter(id__in=FilmCredit.objects.filter(
+                kind="crew", role="Director", person__iexact=director
+            ).values("film_id"))
         if actor:
-            queryset = queryset.filter(cast__contains=[{"actor": actor}])
-        if genre:
-            # Use this if genre is array of strings: ["Drama", "Comedy"]
-            queryset = queryset.filter(genre__contains=[genre])
+            queryset = queryset.filter(id__in=FilmCredit.objects.filter(
+                kind="cast", person=actor
+            ).values("film_id"))
         if crew:
-            queryset = queryset.filter(crew__contains=[{"name": crew}])
+            queryset = queryset.filter(id__in=FilmCredit.objects.filter(
+                kind="crew", person=crew
+            ).values("film_id"))
 
         if q:
-            queryset = queryset.filter(
-                Q(title__icontains=q) |
-                Q(alt_title__icontains=q) |
-                Q(director__icontains=q) |
-                Q(alt_name__icontains=q)
-            )[:10]
-
-        logger.debug(f"Filtered queryset count: {queryset.count()}")
+            queryset = search_queryset(queryset, q, self.search_fields)
         return queryset
-    
-    @action(detail=False, methods=['get'])
-    def frontpage(self, request):
-        watchlist = Film.objects.filter(watchlist=True).order_by('?')[:5]
-        favourites = Film.objects.filter(favourite=True).order_by('?')[:5]
-        recent = Film.objects.filter(date_watched__isnull=False).order_by('-date_watched')[:5]
-
-        data_set = {
-            "watchlist": watchlist,
-            "favourites": favourites,
-            "recent": recent,
-        }
-
-        # If all are empty, provide fallback
-        if not any(qs.exists() for qs in data_set.values()):
-            fallback = Film.objects.order_by('?')[:5]
-            data_set["fallback"] = fallback
-        else:
-            # Remove any empty keys
-            data_set = {k: v for k, v in data_set.items() if v.exists()}
 
-        # Serialize efficiently
-        result = {
-            key: FilmSerializer(films, many=True).data
-            for key, films in data_set.items()
-        }
+    def filter_queryset(self, queryset):
+        queryset = super().filter_queryset(queryset)
+        # The quick search (`?q=`) lists the best matches, unpaginated. The
+        # slice comes last: a sliced queryset can't be filtered any further.
+        if self.action == "list" and self.request.query_params.get('q'):
+            queryset = queryset[:self.quick_search_limit]
+        return queryset
 
-        return Response(result)
+    def after_bulk_write(self, created, updated, update_fields):
+        # What Film.save() and the post_save signal do for single writes
+        if set(update_fields) & set(Film.CREDIT_FIELDS):
+            FilmCredit.rebuild_for(list(created) + list(updated))
+        else:
+            FilmCredit.rebuild_for(created)
+        invalidate_frontpage()
 
-class BookViewSet(viewsets.ModelViewSet):
-    queryset = Book.objects.all()
+    @action(detail=False, methods=['get'])
+    @cache_response
+    def stats(self, request):
+        """
+        Library-wide statistics computed in the database (see stats.py).
+        Cached until the next film change.
+        """
+        return Response(film_stats())
+
+class BookViewSet(CollectionViewSet):
+    queryset = Book.objects.defer("search_vector")
     serializer_class = BookSerializer
-    filter_backends = [SearchFilter]
+    filter_backends = [JSONArrayFilter, RankedSearchFilter]
     search_fields = ['title', 'alt_title', 'author', 'alt_name']
+    json_array_fields = ("genre", "tags")
     
     def get_queryset(self):
         queryset = super().get_queryset()
         author = self.request.query_params.get('author')
-        genre = self.request.query_params.get('genre')
 
-        logger.debug(f"Query params: author={author}, genre={genre}, ")
+        logger.debug(f"Query params: author={author}")
 
+        # genre/tags filtering is handled by JSONArrayFilter
         if author:
             queryset = queryset.filter(author__iexact=author)
-        elif genre:
-            # Use json_each to iterate over genre array in SQLite
-            queryset = queryset.filter(
-                id__in=RawSQL(
-                    """
-                    SELECT id FROM collections_site_book
-                    WHERE EXISTS (
-                        SELECT 1 FROM json_each(collections_site_book.genre)
-                        WHERE json_each.value LIKE %s
-                    )
-                    """,
-                    (f'%{genre}%',)
-                )
-            )
-        logger.debug(f"Filtered queryset count: {queryset.count()}")
-        logger.debug(f"Filtered films: {[book.title for book in queryset]}")
         return queryset
      
     
-class InstrumentViewSet(viewsets.ModelViewSet):
+class InstrumentViewSet(CollectionViewSet):
     queryset = Instrument.objects.all()
     serializer_class = InstrumentSerializer
 
 
-class ListViewSet(viewsets.ModelViewSet):
+def member_count(through):
+    """
+    Counts a list's rows in an M2M through table as a correlated subquery,
+    so member counts don't multiply each other the way joined Counts do.
+    """
+    counts = (
+        through.objects.filter(list_id=OuterRef("pk"))
+        .order_by()
+        .values("list_id")
+        .annotate(n=Count("pk"))
+        .values("n")
+    )
+    return Coalesce(Subquery(counts), 0)
+
+
+class ListViewSet(CollectionViewSet):
+    queryset = List.objects.all()
     serializer_class = ListSerializer
+    # Counts, covers and items are built from the members too
+    cache_models = (List, Film, Book)
+    # Membership is written through ListSerializer.set_members
+    bulk_enabled = False
+
+    # Sort keys accepted by the `items` action, per list category
+    item_orderings = {
+        "film": ("title", "release_date", "rating", "date_watched"),
+        "book": ("title", "year_released", "rating", "date_read"),
+    }
 
     def get_queryset(self):
-        queryset = List.objects.all().order_by("-created_at")
+        queryset = super().get_queryset().order_by("-created_at")
         category = self.request.query_params.get('category')
         if category:
             queryset = queryset.filter(category=category)
+        if self.action in ("list", "retrieve", "export"):
+            cover_count = ListSerializer.COVER_COUNT
+            queryset = queryset.annotate(
+                film_count=member_count(List.films.through),
+                book_count=member_count(List.books.through),
+            ).prefetch_related(
+                Prefetch(
+                    "films",
+                    queryset=Film.objects.exclude(poster__isnull=True).exclude(poster="")
+                    .only("id", "poster").order_by("-id")[:cover_count],
+                    to_attr="cover_films",
+                ),
+                Prefetch(
+                    "books",
+                    queryset=Book.objects.exclude(cover__isnull=True).exclude(cover="")
+                    .only("id", "cover").order_by("-id")[:cover_count],
+                    to_attr="cover_books",
+                ),
+            )
         return queryset
+
+    @action(detail=True, methods=["get"])
+    @cache_response
+    def items(self, request, pk=None):
+        """
+        Returns the list's films or books in their summary form (or as
+        picked with `?fields=`), paginated with `?limit=` / `?cursor=` and
+        sorted with `?ordering=` (e.g. `-release_date`).
+        """
+        lst = self.get_object()
+        if lst.category == "book":
+            serializer_class, queryset = BookSerializer, Book.objects.filter(lists=lst)
+        else:
+            serializer_class, queryset = FilmSerializer, Film.objects.filter(lists=lst)
+
+        fields = None if serializer_class.requested_fields(request) else serializer_class.Meta.summary_fields
+        queryset = queryset.only(*(serializer_class.requested_columns(request) or fields))
+
+        ordering = request.query_params.get("ordering", "")
+        if ordering.lstrip("-") in self.item_orderings.get(lst.category, self.item_orderings["film"]):
+            name = ordering.lstrip("-")
+            key = F(name).desc(nulls_last=True) if ordering.startswith("-") else F(name).asc(nulls_last=True)
+            queryset = queryset.order_by(key, "-id")
+            self.offset_pagination = True
+        else:
+            queryset = queryset.order_by("-id")
+
+        page = self.paginate_queryset(queryset)
+        serializer = serializer_class(
+            page if page is not None else queryset,
+            many=True,
+            fields=fields,
+            context=self.get_serializer_context(),
+        )
+        if page is not None:
+            return self.get_paginated_response(serializer.data)
+        return Response(serializer.data)
     
-class LivePerformanceViewSet(viewsets.ModelViewSet):
+class LivePerformanceViewSet(CollectionViewSet):
     queryset = LivePerformance.objects.all()
     serializer_class = LivePerformanceSerializer
   
@@ -191,169 +386,174 @@ def fetch_tmdb_data(query: str, year: int = None):
     Optionall filters results by release year
     Returns JSON or None.
     """
-    base = "https://api.themoviedb.org/3"
-    read_token = settings.CONFIG['TMDB_READ_TOKEN']
-    headers = {
-        "accept": "application/json",
-        "Authorization": f"Bearer {read_token}"
-    }
-    
-    if query.isdigit():
-        url = f"{base}/movie/{query}?append_to_response=credits"
-        response = requests.get(url, headers=headers)
-        if response.status_code != 200:
-            logger.error(f"Failed to fetch movie by ID {query}: {response.status_code}")
-            return None
-        return response.json()
-
-    search_url = f"{base}/search/movie?query={query}"
-    response = requests.get(search_url, headers=headers)
-    if response.status_code != 200:
-        logger.error(f"Failed to search movie {query}: {response.status_code}")
-        return None
-
-    data = response.json()
-    results = data.get("results", [])
-
-    if not results:
-        logger.warning(f"No results found for query: {query}")
-        return None
-
-    # If year provided, filter by release year
-    movie_id = None
-    if year:
-        for r in results:
-            if r.get("release_date"):
-                release_year = int(r["release_date"].split("-")[0])
-                if release_year == year:
-                    movie_id = r["id"]
-                    break
-        if not movie_id:
-            logger.warning(f"No results matched year {year} for query: {query}")
-            return None
-    else:
-        movie_id = results[0]["id"]
-    
-    details_url = f"{base}/movie/{movie_id}?append_to_response=credits"
-    response = requests.get(details_url, headers=headers)
-    if response.status_code != 200:
-        logger.error(f"Failed to fetch movie details for ID {movie_id}: {response.status_code}")
-        return None
-    return response.json()
+    return get_client().find_film(query, year=year)
 
 
 @api_view(["POST"])
 def batch_import_films(request):
     """
-    Accepts a list of titles or TMDb IDs, fetches from TMDb,
-    saves them to the DB, and returns a progress report.
+    Accepts a list of titles or TMDb IDs and queues them for import by the
+    background worker. Returns the job id straight away; progress and
+    per-item results are served by `job_detail`.
     """
     items = request.data.get("items", [])
-    if not items:
+    if not isinstance(items, list):
+        return Response({"error": "items must be a list"}, status=status.HTTP_400_BAD_REQUEST)
+    entries = [entry.strip() for entry in items if isinstance(entry, str) and entry.strip()]
+    if not entries:
         return Response({"error": "No items provided"}, status=status.HTTP_400_BAD_REQUEST)
-    
-    results = []
-    for entry in items:
-        entry = entry.strip()
-        if not entry:
-            continue
-        
-        data = fetch_tmdb_data(entry)
-        if not data:
-            results.append({"item": entry, "status": "not found"})
-            continue
-        
-        if Film.objects.filter(tmdb_id=data["id"]).exists():
-            results.append({"item": entry, "status": "duplicate"})
-            continue
-        
-        runtime = None
-        runtime_value = data.get("runtime")
-        if runtime_value is not None:
-            try:
-                runtime = timedelta(minutes=int(runtime_value))
-            except (ValueError, TypeError):
-                logger.warning(f"Invalid runtime for {entry}: {runtime_value}")
-                runtime = None
-        
-        # Find director's name and original_name
-        director_data = next(
-            (c for c in data.get("credits", {}).get("crew", []) if c["job"] == "Director"),
-            None
+    max_length = JobItem._meta.get_field("item").max_length
+    # Positions in the submitted list
+    too_long = [
+        index for index, entry in enumerate(items)
+        if isinstance(entry, str) and len(entry.strip()) > max_length
+    ]
+    if too_long:
+        return Response(
+            {"error": f"Items must be at most {max_length} characters", "items": too_long},
+            status=status.HTTP_400_BAD_REQUEST
         )
-        director_name = director_data.get("name") if director_data else None
-        director_original_name = director_data.get("original_name") if director_data else None
-        alt_name = director_original_name if director_original_name and director_original_name != director_name else None
-        
-        film_data = {
-            "tmdb_id": data.get("id"),
-            "title": data.get("title") or "Unknown Title",
-            "alt_title": data.get("original_title") if data.get("original_title") != data.get("title") else None,
-            "director": director_name,
-            "alt_name": alt_name,
-            "cast": [
-                {"actor": c.get("name"), "role": c.get("character") or ""}
-                for c in data.get("credits", {}).get("cast", [])
-            ],
-            "crew": [
-                {"name": c.get("name"), "role": c.get("job") or ""}
-                for c in data.get("credits", {}).get("crew", [])
-            ],
-            "industry_rating": round(float(data.get("vote_average") or 0.0), 1),
-            "series": data.get("belongs_to_collection", {}).get("name") if data.get("belongs_to_collection") else None,
-            "blurb": data.get("tagline"),
-            "synopsis": data.get("overview"),
-            "language": data.get("original_language"),
-            "country": ", ".join(data.get("origin_country", []) or []),
-            "poster": f"https://image.tmdb.org/t/p/original{data.get('poster_path')}" if data.get("poster_path") else None,
-            "background_pic": f"https://image.tmdb.org/t/p/original{data.get('backdrop_path')}" if data.get("backdrop_path") else None,
-            "runtime": runtime,
-            "genre": [g["name"] for g in data.get("genres", [])] or [],
-            "budget": data.get("budget") or 0,
-            "box_office": data.get("revenue") or 0,
-            "release_date": data.get("release_date") or None,
-        }
-
-        logger.debug(f"Film data for {entry}: {film_data}")
-        serializer = FilmSerializer(data=film_data)
-        if serializer.is_valid():
-            serializer.save()
-            results.append({"item": entry, "status": "imported"})
-        else:
-            logger.error(f"Validation failed for {entry}: {serializer.errors}")
-            results.append({"item": entry, "status": "validation failed", "errors": serializer.errors})
-            
-        time.sleep(0.25)
-    
-    return Response({"results": results}, status=status.HTTP_200_OK)
 
+    job = enqueue("import_films", entries)
+    return Response(
+        {"job": job.id, "status": job.status, "total": job.total},
+        status=status.HTTP_202_ACCEPTED,
+    )
 
-@api_view(["GET"])
-def fetch_tmdb_images(request, tmdb_id):
+
+@require_GET
+async def film_frontpage(request):
     """
-    Fetches posters and backdrops from TMDb for a given movie ID
+    Random watchlist/favourite picks plus recently watched films, served
+    from cached pools (see frontpage.py) instead of ORDER BY RANDOM().
+    On a cache miss the pool queries run concurrently.
     """
-    base = "https://api.themoviedb.org/3"
-    read_token = settings.CONFIG['TMDB_READ_TOKEN']
-    headers = {
-        "accept": "application/json",
-        "Authorization": f"Bearer {read_token}"
-    }
-    url = f"{base}/movie/{tmdb_id}/images"
-    response = requests.get(url, headers=headers)
-    
-    if response.status_code != 200:
-        return Response(
-            {"error": f"TMDB request failed: {response.status_code}"},
+    return JsonResponse(await aget_frontpage())
+
+
+# Collections covered by the combined search endpoint
+SEARCH_VIEWSETS = {"films": FilmViewSet, "books": BookViewSet}
+SEARCH_LIMIT = 10
+SEARCH_MAX_LIMIT = 50
+
+
+def search_results(viewset, query, limit):
+    serializer_class = viewset.serializer_class
+    fields = serializer_class.Meta.summary_fields
+    queryset = search_queryset(viewset.queryset.only(*fields), query, viewset.search_fields)[:limit]
+    # Evaluated here, in the worker thread
+    return serializer_class(queryset, many=True, fields=fields).data
+
+
+@require_GET
+async def search(request):
+    """
+    Ranked search (see search.py) across films and books, returning the
+    summary fields of the best `limit` matches of each. The searches run
+    concurrently. ?collections=films narrows it to some collections.
+    """
+    query = request.GET.get("q", "").strip()
+    names = [name for name in request.GET.get("collections", ",".join(SEARCH_VIEWSETS)).split(",") if name]
+    unknown = [name for name in names if name not in SEARCH_VIEWSETS]
+    if unknown:
+        return JsonResponse(
+            {"error": f"Unknown collections: {', '.join(unknown)}"},
             status=status.HTTP_400_BAD_REQUEST
         )
-        
-    data = response.json()
+    try:
+        limit = max(1, min(int(request.GET.get("limit", SEARCH_LIMIT)), SEARCH_MAX_LIMIT))
+    except ValueError:
+        limit = SEARCH_LIMIT
+    if not query:
+        return JsonResponse({name: [] for name in names})
+
+    results = await gather_queries(*((search_results, SEARCH_VIEWSETS[name], query, limit) for name in names))
+    return JsonResponse(dict(zip(names, results)))
+
+
+@api_view(["GET"])
+def dashboard(request):
+    """
+    Counts, owned/wishlist splits and price sums for every collection.
+    """
+    return Response(get_dashboard())
+
+
+@api_view(["GET", "DELETE"])
+@permission_classes([IsAdminUser])
+def metrics(request):
+    """
+    Per-route percentiles of query count, database, serializer and total
+    time recorded by ServerTimingMiddleware in this process. DELETE resets
+    the samples.
+    """
+    if request.method == "DELETE":
+        reset_metrics()
+        return Response(status=status.HTTP_204_NO_CONTENT)
     return Response({
+        "enabled": bool(settings.CONFIG.get("SERVER_TIMING")),
+        "routes": route_metrics(),
+    })
+
+
+@require_GET
+def image_variant(request, variant, image_format):
+    """
+    Serves a resized copy of an artwork URL from the local image cache.
+    The source comes from the signed `s` parameter produced by
+    images.variant_url_template; if no variant can be made, redirects to it.
+    """
+    if variant not in VARIANTS or image_format not in FORMATS:
+        raise Http404
+    try:
+        url = source_from_token(request.GET.get("s", ""))
+    except signing.BadSignature:
+        return HttpResponseBadRequest("Invalid image token")
+
+    found = get_image_cache().get(url, variant, image_format)
+    if found is None:
+        return HttpResponseRedirect(url)
+    path, content_type = found
+    try:
+        response = FileResponse(open(path, "rb"), content_type=content_type)
+    except OSError:
+        # Evicted in the meantime
+        return HttpResponseRedirect(url)
+    # The URL embeds the source, so a given URL's bytes never change
+    response["Cache-Control"] = "public, max-age=31536000, immutable"
+    return response
+
+
+@api_view(["GET"])
+def job_detail(request, pk):
+    """
+    Reports the progress of a background job with the status of each item.
+    """
+    job = get_object_or_404(Job, pk=pk)
+    return Response(JobSerializer(job).data)
+
+
+@require_GET
+async def fetch_tmdb_images(request, tmdb_id):
+    """
+    Fetches posters and backdrops from TMDb for a given movie ID. Async, so
+    under ASGI a slow TMDb response doesn't hold a worker thread.
+    """
+    # Under ASGI the server's event loop outlives the request, so its pooled
+    # client can be reused
+    data = await get_client().aget_movie_images(tmdb_id, shared_client=isinstance(request, ASGIRequest))
+    if data is None:
+        return JsonResponse(
+            {"error": "TMDB request failed"},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+
+    return JsonResponse({
         "posters": data.get("posters", []),
         "backdrops": data.get("backdrops", []),
     })
-    
+
+
 @api_view(["PATCH"])
 def update_film_image(request, pk):
     """
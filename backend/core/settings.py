@@ -11,7 +11,7 @@ https://docs.djangoproject.com/en/5.2/ref/settings/
 """
 
 from pathlib import Path
-import os, dj_database_url
+import os, sys, dj_database_url
 from dotenv import load_dotenv
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
@@ -42,6 +42,7 @@ INSTALLED_APPS = [
     'django.contrib.sessions',
     'django.contrib.messages',
     'django.contrib.staticfiles',
+    'django.contrib.postgres',
     'rest_framework',
     'corsheaders',
     'collections_site',
@@ -49,11 +50,15 @@ INSTALLED_APPS = [
 
 MIDDLEWARE = [
     'corsheaders.middleware.CorsMiddleware',
+    # Inactive unless SERVER_TIMING is set (see collections_site/instrumentation.py)
+    'collections_site.instrumentation.ServerTimingMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
+    # Inactive unless DATABASE_REPLICA_URL is set (see collections_site/db_routers.py)
+    'collections_site.db_routers.ReplicaRoutingMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
 ]
@@ -85,8 +90,80 @@ WSGI_APPLICATION = 'core.wsgi.application'
 # Database
 # https://docs.djangoproject.com/en/5.2/ref/settings/#databases
 
+# Connections are kept open for DATABASE_CONN_MAX_AGE seconds instead of one
+# per request, and checked before reuse so a dropped connection is replaced
+# rather than failing the request. Set it to 0 behind an external pooler
+# (e.g. PgBouncer in transaction mode).
+# Under ASGI (core/asgi.py sets DJANGO_SERVER_INTERFACE) every request's sync
+# code runs in a new connection context, so persistent connections are never
+# reused and stay open until garbage collected (Django ticket #33497); the
+# same goes for the asyncdb worker threads. There connections are always
+# closed after use and pooling belongs outside Django (PgBouncer).
+SERVING_ASGI = os.getenv('DJANGO_SERVER_INTERFACE') == 'asgi'
+DATABASE_CONN_MAX_AGE = 0 if SERVING_ASGI else int(os.getenv('DATABASE_CONN_MAX_AGE', '600'))
+
 DATABASES = {
-    "default": dj_database_url.config(default=os.getenv("DATABASE_PUBLIC_URL"))
+    "default": dj_database_url.config(
+        default=os.getenv("DATABASE_PUBLIC_URL"),
+        conn_max_age=DATABASE_CONN_MAX_AGE,
+        conn_health_checks=True,
+    )
+}
+
+# Optional read replica: safe requests read from it, writes and anything
+# after a write go to the primary (see collections_site/db_routers.py)
+if os.getenv('DATABASE_REPLICA_URL'):
+    DATABASES["replica"] = dj_database_url.parse(
+        os.getenv('DATABASE_REPLICA_URL'),
+        conn_max_age=DATABASE_CONN_MAX_AGE,
+        conn_health_checks=True,
+        test_options={"MIRROR": "default"},
+    )
+    DATABASE_ROUTERS = ['collections_site.db_routers.ReplicaRouter']
+elif sys.argv[1:2] == ['test']:
+    # Test runs route through a replica alias that mirrors the default
+    # database, so the routing is exercised without a second server
+    DATABASES["replica"] = {**DATABASES["default"], "TEST": {"MIRROR": "default"}}
+    DATABASE_ROUTERS = ['collections_site.db_routers.ReplicaRouter']
+
+
+# Django REST Framework
+# List endpoints stay unpaginated unless the client sends ?limit= or ?cursor=
+
+REST_FRAMEWORK = {
+    'DEFAULT_PAGINATION_CLASS': 'collections_site.pagination.KeysetPagination',
+}
+
+
+# Cache
+# Database-backed so invalidation from signals is seen by every gunicorn worker.
+# Create the table with `manage.py createcachetable` after migrating (the
+# Procfile's web process does this on every deploy; it is a no-op once it exists).
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.db.DatabaseCache',
+        'LOCATION': 'collections_site_cache',
+    }
+}
+
+
+# Logging
+# Query diagnostics are logged at INFO, below the default WARNING threshold
+
+LOGGING = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'handlers': {
+        'console': {'class': 'logging.StreamHandler'},
+    },
+    'loggers': {
+        'collections_site.diagnostics': {
+            'handlers': ['console'],
+            'level': 'INFO',
+            'propagate': False,
+        },
+    },
 }
 
 
@@ -131,7 +208,28 @@ STATIC_ROOT = BASE_DIR / "staticfiles"
 # Config 
 CONFIG = {
     'TMDB_KEY': os.getenv('TMDB_KEY'),
-    'TMDB_READ_TOKEN': os.getenv('TMDB_READ_TOKEN')
+    'TMDB_READ_TOKEN': os.getenv('TMDB_READ_TOKEN'),
+    # Override to point the TMDb client at a local stub server
+    'TMDB_API_BASE': os.getenv('TMDB_API_BASE', 'https://api.themoviedb.org/3'),
+    # TMDb allows roughly 50 requests/second per IP; stay safely below it
+    'TMDB_RATE_LIMIT': float(os.getenv('TMDB_RATE_LIMIT', '40')),
+    'TMDB_MAX_WORKERS': int(os.getenv('TMDB_MAX_WORKERS', '8')),
+    # On-disk TMDb response cache; set TMDB_CACHE_DIR to an empty value to disable it
+    'TMDB_CACHE_DIR': os.getenv('TMDB_CACHE_DIR', str(BASE_DIR / '.tmdb_cache')),
+    'TMDB_CACHE_MAX_MB': int(os.getenv('TMDB_CACHE_MAX_MB', '256')),
+    # Serve TMDb data only from the cache (deterministic replays in tests/benchmarks)
+    'TMDB_OFFLINE': os.getenv('TMDB_OFFLINE', '').lower() in ('1', 'true', 'yes'),
+    # Seconds to keep rendered API responses (see collections_site/caching.py); 0 disables it
+    'RESPONSE_CACHE_TIMEOUT': int(os.getenv('RESPONSE_CACHE_TIMEOUT', str(24 * 60 * 60))),
+    # Per-request query/timing instrumentation: Server-Timing headers and /api/metrics/
+    'SERVER_TIMING': os.getenv('SERVER_TIMING', '').lower() in ('1', 'true', 'yes'),
+    # Log row counts, EXPLAIN plans and samples for every list query (see collections_site/diagnostics.py)
+    'QUERY_DIAGNOSTICS': os.getenv('QUERY_DIAGNOSTICS', '').lower() in ('1', 'true', 'yes'),
+    # Resized artwork variants (see collections_site/images.py); set IMAGE_CACHE_DIR empty to disable
+    'IMAGE_CACHE_DIR': os.getenv('IMAGE_CACHE_DIR', str(BASE_DIR / '.image_cache')),
+    'IMAGE_CACHE_MAX_MB': int(os.getenv('IMAGE_CACHE_MAX_MB', '512')),
+    # Seconds a client keeps reading from the primary after it writes, covering replica lag
+    'DATABASE_REPLICA_STICKY_SECONDS': int(os.getenv('DATABASE_REPLICA_STICKY_SECONDS', '10')),
 }
 
 # Default primary key field type
@@ -8,6 +8,8 @@ import { List } from "@/types/list";
 import BookCard from "@/components/book/BookCard";
 import BookListModal from "@/components/book/BookListModal";
 
+const PAGE_SIZE = 60;
+
 export default function ListDetailPage() {
   const { id } = useParams();
   const [list, setList] = useState<List | undefined>(undefined);
@@ -18,6 +20,10 @@ export default function ListDetailPage() {
     "" | "year_released_asc" | "year_released_desc" | "rating_asc" | "rating_desc"
   >("");
 
+  const [books, setBooks] = useState<Book[]>([]);
+  const [nextPage, setNextPage] = useState<string | null>(null);
+  const [loadingMore, setLoadingMore] = useState(false);
+
   const fetchList = () => {
     fetch(`${process.env.NEXT_PUBLIC_API_URL}/api/lists/${id}/`)
       .then((res) => res.json())
@@ -32,6 +38,32 @@ export default function ListDetailPage() {
       });
   };
 
+  // Members are paginated and sorted by the API
+  const fetchItems = (url?: string) => {
+    const ordering = sortOption
+      ? `${sortOption.endsWith("_desc") ? "-" : ""}${sortOption.replace(/_(asc|desc)$/, "")}`
+      : "";
+    const pageUrl =
+      url ??
+      `${process.env.NEXT_PUBLIC_API_URL}/api/lists/${id}/items/?limit=${PAGE_SIZE}${
+        ordering ? `&ordering=${ordering}` : ""
+      }`;
+    setLoadingMore(true);
+    fetch(pageUrl)
+      .then((res) => res.json())
+      .then((data) => {
+        setBooks((prev) => (url ? [...prev, ...data.results] : data.results));
+        setNextPage(data.next);
+      })
+      .catch((error) => console.error("Error fetching list items:", error))
+      .finally(() => setLoadingMore(false));
+  };
+
+  const refresh = () => {
+    fetchList();
+    fetchItems();
+  };
+
   useEffect(() => {
     if (!id) {
       setLoading(false);
@@ -40,30 +72,9 @@ export default function ListDetailPage() {
     fetchList();
   }, [id]);
 
-  const sortedBooks = list?.books
-    ? [...list.books].sort((a, b) => {
-        if (!sortOption) return 0; // No sorting if sortOption is empty
-
-        const [sortField, sortDirection] = sortOption.split("_") as [
-          "year_released" | "rating",
-          "asc" | "desc"
-        ];
-
-        if (sortField === "year_released") {
-          const yearA = Number(a.year_released) ?? 0;
-          const yearB = Number(b.year_released) ?? 0;
-          return sortDirection === "asc" ? yearA - yearB : yearB - yearA;
-        }
-
-        if (sortField === "rating") {
-          const ratingA = Number(a.rating) ?? 0;
-          const ratingB = Number(b.rating) ?? 0;
-          return sortDirection === "asc" ? ratingA - ratingB : ratingB - ratingA;
-        }
-
-        return 0;
-      })
-    : [];
+  useEffect(() => {
+    if (id) fetchItems();
+  }, [id, sortOption]);
 
   if (loading) return <p className="p-6 font-sans text-gray-400">Loading...</p>;
   if (!list) return <p className="p-6 font-sans text-gray-400">List not found</p>;
@@ -74,7 +85,7 @@ export default function ListDetailPage() {
         <div className="flex space-x-2 items-center">
           <h1 className="text-2xl sm:text-3xl font-bold font-serif">{list.name}</h1>
           <p className="font-sans text-xs sm:text-sm text-gray-400">
-            {list.books?.length ? `(${list.books.length} Books)` : ""}
+            {list.book_count ? `(${list.book_count} Books)` : ""}
           </p>
           <button
             onClick={() => {
@@ -93,7 +104,7 @@ export default function ListDetailPage() {
               setInitialListData(undefined);
             }}
             onCreated={() => {
-              fetchList();
+              refresh();
               setShowListModal(false);
               setInitialListData(undefined);
             }}
@@ -124,8 +135,8 @@ export default function ListDetailPage() {
       </div>
 
       <div className="grid grid-cols-2 md:grid-cols-4 lg:grid-cols-5 gap-2 sm:gap-4">
-        {sortedBooks.length > 0 ? (
-          sortedBooks.map((book, idx) => (
+        {books.length > 0 ? (
+          books.map((book, idx) => (
             <div
               key={idx}
               className={`transition-all duration-300 ${book.read ? "opacity-50 hover:opacity-100" : ""}`}
@@ -139,6 +150,18 @@ export default function ListDetailPage() {
           </p>
         )}
       </div>
+
+      {nextPage && (
+        <div className="flex justify-center">
+          <button
+            onClick={() => fetchItems(nextPage)}
+            disabled={loadingMore}
+            className="font-sans px-4 py-2 rounded bg-primary text-white hover:bg-neutral-mid hover:text-background cursor-pointer transition-all duration-300 disabled:opacity-50 text-sm sm:text-base"
+          >
+            {loadingMore ? "Loading..." : "Load more"}
+          </button>
+        </div>
+      )}
     </div>
   );
 }
\ No newline at end of file
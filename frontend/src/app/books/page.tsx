@@ -54,7 +54,7 @@ export default function BookPage() {
 
   const fetchBooks = () => {
     setLoading(true);
-    fetch(`${process.env.NEXT_PUBLIC_API_URL}/api/books/`)
+    fetch(`${process.env.NEXT_PUBLIC_API_URL}/api/books/?view=summary`)
       .then((response) => response.json())
       .then((data) => {
         setBooks(data);
@@ -48,7 +48,7 @@ export default function BookSearchPage() {
     const decodedQuery = decodeURIComponent(query as string);
 
     fetch(
-      `${process.env.NEXT_PUBLIC_API_URL}/api/books/?${param}=${encodeURIComponent(
+      `${process.env.NEXT_PUBLIC_API_URL}/api/books/?view=summary&${param}=${encodeURIComponent(
         decodedQuery
       )}`
     )
@@ -8,6 +8,8 @@ import { List } from "@/types/list";
 import FilmCard from "@/components/film/FilmCard";
 import FilmListModal from "@/components/film/FilmListModal";
 
+const PAGE_SIZE = 60;
+
 export default function ListDetailPage() {
   const { id } = useParams();
   const [list, setList] = useState<List | undefined>(undefined);
@@ -20,6 +22,10 @@ export default function ListDetailPage() {
     "" | "release_date_asc" | "release_date_desc" | "rating_asc" | "rating_desc"
   >("");
 
+  const [films, setFilms] = useState<Film[]>([]);
+  const [nextPage, setNextPage] = useState<string | null>(null);
+  const [loadingMore, setLoadingMore] = useState(false);
+
   const fetchList = () => {
     fetch(`${process.env.NEXT_PUBLIC_API_URL}/api/lists/${id}/`)
       .then((res) => res.json())
@@ -34,6 +40,32 @@ export default function ListDetailPage() {
       });
   };
 
+  // Members are paginated and sorted by the API
+  const fetchItems = (url?: string) => {
+    const ordering = sortOption
+      ? `${sortOption.endsWith("_desc") ? "-" : ""}${sortOption.replace(/_(asc|desc)$/, "")}`
+      : "";
+    const pageUrl =
+      url ??
+      `${process.env.NEXT_PUBLIC_API_URL}/api/lists/${id}/items/?limit=${PAGE_SIZE}${
+        ordering ? `&ordering=${ordering}` : ""
+      }`;
+    setLoadingMore(true);
+    fetch(pageUrl)
+      .then((res) => res.json())
+      .then((data) => {
+        setFilms((prev) => (url ? [...prev, ...data.results] : data.results));
+        setNextPage(data.next);
+      })
+      .catch((error) => console.error("Error fetching list items:", error))
+      .finally(() => setLoadingMore(false));
+  };
+
+  const refresh = () => {
+    fetchList();
+    fetchItems();
+  };
+
   useEffect(() => {
     if (!id) {
       setLoading(false);
@@ -42,35 +74,9 @@ export default function ListDetailPage() {
     fetchList();
   }, [id]);
 
-  // Sort films based on sortOption
-  const sortedFilms = list?.films
-    ? [...list.films].sort((a, b) => {
-        if (!sortOption) return 0; // No sorting if sortOption is empty
-
-        const [sortField, sortDirection] = sortOption.split("_") as [
-          "release_date" | "rating",
-          "asc" | "desc"
-        ];
-
-        if (sortField === "release_date") {
-          const dateA = a.release_date ? new Date(a.release_date) : new Date(0);
-          const dateB = b.release_date ? new Date(b.release_date) : new Date(0);
-          return sortDirection === "asc"
-            ? dateA.getTime() - dateB.getTime()
-            : dateB.getTime() - dateA.getTime();
-        }
-
-        if (sortField === "rating") {
-          const ratingA = Number(a.rating) ?? 0;
-          const ratingB = Number(b.rating) ?? 0;
-          return sortDirection === "asc"
-            ? ratingA - ratingB
-            : ratingB - ratingA;
-        }
-
-        return 0;
-      })
-    : [];
+  useEffect(() => {
+    if (id) fetchItems();
+  }, [id, sortOption]);
 
   if (loading) return <p className="p-6 font-sans text-gray-400">Loading...</p>;
   if (!list)
@@ -84,7 +90,7 @@ export default function ListDetailPage() {
             {list.name}
           </h1>
           <p className="font-sans text-xs sm:text-sm text-gray-400">
-            {list.films?.length ? `(${list.films.length} Films)` : ""}
+            {list.film_count ? `(${list.film_count} Films)` : ""}
           </p>
           <button
             onClick={() => {
@@ -103,7 +109,7 @@ export default function ListDetailPage() {
               setInitialListData(undefined);
             }}
             onCreated={() => {
-              fetchList();
+              refresh();
               setShowListModal(false);
               setInitialListData(undefined);
             }}
@@ -139,8 +145,8 @@ export default function ListDetailPage() {
       </div>
 
       <div className="grid grid-cols-2 md:grid-cols-4 lg:grid-cols-5 gap-2 sm:gap:4">
-        {sortedFilms.length > 0 ? (
-          sortedFilms.map((film) => (
+        {films.length > 0 ? (
+          films.map((film) => (
             <div
               key={film.id}
               className={`transition-all duration-300 ${
@@ -156,6 +162,18 @@ export default function ListDetailPage() {
           </p>
         )}
       </div>
+
+      {nextPage && (
+        <div className="flex justify-center">
+          <button
+            onClick={() => fetchItems(nextPage)}
+            disabled={loadingMore}
+            className="font-sans px-4 py-2 rounded bg-primary text-white hover:bg-neutral-mid hover:text-background cursor-pointer transition-all duration-300 disabled:opacity-50 text-sm sm:text-base"
+          >
+            {loadingMore ? "Loading..." : "Load more"}
+          </button>
+        </div>
+      )}
     </div>
   );
 }
@@ -8,7 +8,6 @@ import {
   getMostRecent,
   getRandomWatchlist,
   getRandomFavourites,
-  getTopDirectors,
 } from "../../utils/trackerHelper";
 import Link from "next/link";
 import { List } from "@/types/list";
@@ -20,6 +19,18 @@ type FrontpageData = {
   fallback?: Film[];
 };
 
+type PersonStats = { name: string; count: number; avg_rating: number | null };
+
+type FilmStats = {
+  totals: {
+    total: number;
+    seen: number;
+    avg_rating: number | null;
+    avg_difference: number | null;
+  };
+  directors: { most_films: PersonStats[]; highest_rated: PersonStats[] };
+};
+
 function useDebounce<T>(value: T, delay: number): T {
   const [debouncedValue, setDebouncedValue] = useState<T>(value);
 
@@ -37,6 +48,7 @@ export default function FilmPage() {
   /* ------------------------------------------------------------------ */
   const [frontpage, setFrontpage] = useState<FrontpageData>({});
   const [frontpageLoading, setFrontpageLoading] = useState(true);
+  const [stats, setStats] = useState<FilmStats | null>(null);
 
   /* --------------------------------------------------------------- */
   /* 2. Search results (triggered by debounced query)               */
@@ -77,6 +89,16 @@ export default function FilmPage() {
     fetchFrontpage();
   }, []);
 
+  /* ------------------------------------------------------------------ */
+  /* FETCH: library stats (computed server-side)                        */
+  /* ------------------------------------------------------------------ */
+  useEffect(() => {
+    fetch(`${process.env.NEXT_PUBLIC_API_URL}/api/films/stats/`)
+      .then((res) => res.json())
+      .then((data: FilmStats) => setStats(data))
+      .catch((e) => console.error("Failed to load stats", e));
+  }, []);
+
   /* ------------------------------------------------------------------ */
   /* FETCH: lists (once on mount)                                       */
   /* ------------------------------------------------------------------ */
@@ -143,22 +165,11 @@ export default function FilmPage() {
   const mostRecent = useMemo(() => getMostRecent(allFrontpageFilms), [allFrontpageFilms]);
   const randomWatchlist = useMemo(() => getRandomWatchlist(allFrontpageFilms), [allFrontpageFilms]);
   const randomFavourites = useMemo(() => getRandomFavourites(allFrontpageFilms), [allFrontpageFilms]);
-  const topDirectors = useMemo(() => getTopDirectors(allFrontpageFilms), [allFrontpageFilms]);
-
-  const seenFilms = useMemo(() => allFrontpageFilms.filter((f) => f.seen), [allFrontpageFilms]);
-  const totalWatched = seenFilms.length;
+  const topDirectors = (stats?.directors.highest_rated ?? []).slice(0, 4);
 
-  const ratedFilms = useMemo(() => allFrontpageFilms.filter((f) => f.rating), [allFrontpageFilms]);
-  const totalRating = ratedFilms.reduce((sum, f) => sum + Number(f.rating || 0), 0);
-  const avgRating = allFrontpageFilms.length > 0 ? (totalRating / allFrontpageFilms.length).toFixed(1) : "0";
-
-  const industryRatedFilms = ratedFilms.filter((b) => b.industry_rating);
-  const totalDifference = industryRatedFilms.reduce(
-    (sum, b) => sum + (Number(b.rating) - Number(b.industry_rating)),
-    0
-  );
-  const avgDifference =
-    industryRatedFilms.length > 0 ? (totalDifference / industryRatedFilms.length).toFixed(1) : "0";
+  const totalWatched = stats?.totals.seen ?? 0;
+  const avgRating = (stats?.totals.avg_rating ?? 0).toFixed(1);
+  const avgDifference = (stats?.totals.avg_difference ?? 0).toFixed(1);
 
   const mostRecentLimited = isSmallScreen ? mostRecent.slice(0, 4) : mostRecent;
   const randomWatchlistLimited = isSmallScreen ? randomWatchlist.slice(0, 4) : randomWatchlist;
@@ -292,22 +303,15 @@ export default function FilmPage() {
               <ul className="grid grid-cols-1 sm:grid-cols-2 md:grid-cols-4 gap-4">
                 {topDirectors.map((d) => (
                   <li
-                    key={d.director}
+                    key={d.name}
                     className="relative group bg-neutral p-3 rounded shadow"
                   >
                     <span className="font-semibold font-sans text-sm sm:text-base">
-                      {d.director}
+                      {d.name}
                     </span>
                     <span className="block text-xs sm:text-sm text-gray-400 font-sans">
-                      Avg {d.avg.toFixed(1)}
+                      Avg {(d.avg_rating ?? 0).toFixed(1)} · {d.count} films
                     </span>
-                    <div className="absolute left-1/2 -translate-x-1/2 bottom-full mb-2 hidden group-active:block md:group-hover:block bg-background text-foreground text-xs sm:text-sm rounded shadow p-2 whitespace-nowrap max-w-[90vw] sm:max-w-[300px] truncate">
-                      {d.films
-                        .filter((f) => f.rating)
-                        .sort((a, b) => Number(b.rating) - Number(a.rating))
-                        .map((f) => f.title)
-                        .join(", ")}
-                    </div>
                   </li>
                 ))}
               </ul>
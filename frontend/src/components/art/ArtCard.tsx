@@ -5,6 +5,7 @@ import { Art } from "@/types/art";
 import Link from "next/link";
 import { formatYear } from "@/utils/formatters";
 import ZoomableImageModal from "../ZoomableImageModal";
+import { variantSrc } from "@/utils/images";
 
 type ArtCardProps = {
   art: Art;
@@ -24,7 +25,7 @@ export default function ArtCard({ art, onDelete }: ArtCardProps) {
       {art.photo && (
         <div onClick={() => setShowModal(true)} className="cursor-pointer">
           <img
-            src={art.photo}
+            src={variantSrc(art.photo_variants, art.photo)}
             alt={art.title}
             className="h-48 sm:h-64 object-contain mb-3"
           />
@@ -33,7 +34,7 @@ export default function ArtCard({ art, onDelete }: ArtCardProps) {
 
       {showModal && (
         <ZoomableImageModal
-          src={art.photo || "/placeholder.jpg"}
+          src={variantSrc(art.photo_variants, art.photo, "full") || "/placeholder.jpg"}
           alt={art.title}
           onClose={() => setShowModal(false)}
         />
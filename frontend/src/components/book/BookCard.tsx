@@ -3,6 +3,7 @@
 import Link from "next/link";
 import { Book } from "@/types/book";
 import { formatYear } from "@/utils/formatters";
+import { variantSrc } from "@/utils/images";
 
 type BookProps = {
     book: Book;
@@ -14,7 +15,7 @@ export default function BookCard({ book }: BookProps) {
             <div className="relative group w-full aspect-[2/3] rounded overflow-hidden shadow cursor-pointer">
                 {book.cover ? (
                     <img 
-                        src={book.cover}
+                        src={variantSrc(book.cover_variants, book.cover)}
                         alt={book.title}
                         className="w-full h-full object-cover transition-transform duration-300 group-hover:scale-105"
                         loading="lazy"
@@ -5,6 +5,7 @@ import { BookCopy } from "@/types/bookCopy";
 import Link from "next/link";
 import ZoomableImageModal from "../ZoomableImageModal";
 import { formatDate, formatPhrase } from "@/utils/formatters";
+import { variantSrc } from "@/utils/images";
 
 type BookCopyCardProps = {
   bookCopy: BookCopy;
@@ -27,7 +28,7 @@ export default function BookCopyCard({
       {bookCopy.cover_image && (
         <div onClick={() => setShowModal(true)} className="cursor-pointer">
           <img
-            src={bookCopy.cover_image}
+            src={variantSrc(bookCopy.cover_image_variants, bookCopy.cover_image)}
             alt={bookCopy.title}
             className="h-48 sm:h-64 object-contain mb-3"
           />
@@ -36,7 +37,7 @@ export default function BookCopyCard({
 
       {showModal && (
         <ZoomableImageModal
-          src={bookCopy.cover_image || "/placeholder.jpg"}
+          src={variantSrc(bookCopy.cover_image_variants, bookCopy.cover_image, "full") || "/placeholder.jpg"}
           alt={bookCopy.title}
           onClose={() => setShowModal(false)}
         />
@@ -1,6 +1,6 @@
 "use client";
 
-import { useState } from "react";
+import { useEffect, useState } from "react";
 import { useRouter } from "next/navigation";
 import { Book } from "@/types/book";
 import { List } from "@/types/list";
@@ -20,6 +20,15 @@ export default function BookListModal({ onClose, onCreated, initialList }: Props
   const [loading, setLoading] = useState(false);
   const router = useRouter();
 
+  // The list endpoints only return counts, so load the current members to edit
+  useEffect(() => {
+    if (!initialList?.id || initialList.books) return;
+    fetch(`${process.env.NEXT_PUBLIC_API_URL}/api/lists/${initialList.id}/items/`)
+      .then((res) => res.json())
+      .then((data: Book[]) => setSelected(data))
+      .catch((error) => console.error("Error fetching list items:", error));
+  }, [initialList]);
+
   const handleSearch = async () => {
     if (!search.trim()) {
       setResults([]);
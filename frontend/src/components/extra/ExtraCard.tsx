@@ -5,6 +5,7 @@ import { Extra } from "@/types/extra";
 import Link from "next/link";
 import ZoomableImageModal from "../ZoomableImageModal";
 import { formatYear } from "@/utils/formatters";
+import { variantSrc } from "@/utils/images";
 
 type ExtraCardProps = {
   extra: Extra;
@@ -24,7 +25,7 @@ export default function ExtraCard({ extra, onDelete }: ExtraCardProps) {
       {extra.photo && (
         <div onClick={() => setShowModal(true)} className="cursor-pointer">
           <img
-            src={extra.photo}
+            src={variantSrc(extra.photo_variants, extra.photo)}
             alt={extra.model}
             className="h-48 sm:h-64 object-contain mb-3"
           />
@@ -33,7 +34,7 @@ export default function ExtraCard({ extra, onDelete }: ExtraCardProps) {
 
       {showModal && (
         <ZoomableImageModal
-          src={extra.photo || "/placeholder.jpg"}
+          src={variantSrc(extra.photo_variants, extra.photo, "full") || "/placeholder.jpg"}
           alt={extra.model}
           onClose={() => setShowModal(false)}
         />
@@ -8,26 +8,65 @@ interface ImportResult {
     status: string;
 }
 
+interface ImportJob {
+    id: number;
+    status: "queued" | "running" | "done" | "failed";
+    total: number;
+    processed: number;
+    error: string | null;
+    items: ImportResult[];
+}
+
+const POLL_INTERVAL = 1500;
+
 export default function BatchImportModal({ isOpen, onClose }: { isOpen: boolean; onClose: () => void }) {
     const [input, setInput] = useState("");
     const [loading, setLoading] = useState(false);
+    const [progress, setProgress] = useState<{ processed: number; total: number } | null>(null);
+    const [error, setError] = useState<string | null>(null);
     const [results, setResults] = useState<ImportResult[]>([]);
 
+    const pollJob = async (jobId: number) => {
+        while (true) {
+            const response = await fetch(`${process.env.NEXT_PUBLIC_API_URL}/api/jobs/${jobId}/`);
+            const job: ImportJob = await response.json();
+            setProgress({ processed: job.processed, total: job.total });
+            setResults(job.items.filter((r) => r.status !== "pending"));
+            if (job.status === "done" || job.status === "failed") {
+                if (job.status === "failed") setError("Import failed, some films may not have been imported.");
+                return;
+            }
+            await new Promise((resolve) => setTimeout(resolve, POLL_INTERVAL));
+        }
+    };
+
     const handleImport = async () => {
         setLoading(true);
         setResults([]);
+        setError(null);
+        setProgress(null);
 
         const items = input.split("\n").map((line) => line.trim()).filter((line) => line);
 
-        const response = await fetch(`${process.env.NEXT_PUBLIC_API_URL}/api/batch-import-films/`, {
-            method: "POST",
-            headers: { "Content-Type": "application/json" },
-            body: JSON.stringify({ items }),
-        });
-
-        const data = await response.json();
-        setResults(data.results);
-        setLoading(false);
+        try {
+            const response = await fetch(`${process.env.NEXT_PUBLIC_API_URL}/api/batch-import-films/`, {
+                method: "POST",
+                headers: { "Content-Type": "application/json" },
+                body: JSON.stringify({ items }),
+            });
+            const data = await response.json();
+            if (!response.ok) {
+                setError(data.error || "Import failed.");
+                return;
+            }
+            setProgress({ processed: 0, total: data.total });
+            await pollJob(data.job);
+        } catch (err) {
+            console.error("Batch import failed", err);
+            setError("Import failed.");
+        } finally {
+            setLoading(false);
+        }
     };
 
     if (!isOpen) return null;
@@ -54,10 +93,16 @@ export default function BatchImportModal({ isOpen, onClose }: { isOpen: boolean;
                         disabled={loading}
                         className="px-3 sm:px-4 py-1.5 sm:py-2 rounded bg-primary text-white hover:text-background hover:bg-neutral-mid cursor-pointer transition-all duration-300 disabled:opacity-50 text-sm sm:text-base"
                     >
-                        {loading ? "Importing..." : "Import"}
+                        {loading
+                            ? progress
+                                ? `Importing ${progress.processed}/${progress.total}...`
+                                : "Importing..."
+                            : "Import"}
                     </button>
                 </div>
 
+                {error && <p className="mt-4 text-sm text-danger">{error}</p>}
+
                 {results.length > 0 && (
                     <div className="mt-4 space-y-2 flex-1 overflow-y-auto">
                         <h3 className="font-semibold text-sm sm:text-base font-sans">Results:</h3>
@@ -2,6 +2,7 @@
 
 import Link from "next/link";
 import { Film } from "../../types/film";
+import { variantSrc } from "@/utils/images";
 
 type FilmProps = {
     film: Film;
@@ -13,7 +14,7 @@ export default function FilmCard({ film }: FilmProps) {
             <div className="relative group w-full aspect-[2/3] rounded overflow-hidden shadow cursor-pointer">
                 {film.poster ? (
                     <img 
-                        src={film.poster}
+                        src={variantSrc(film.poster_variants, film.poster)}
                         alt={film.title}
                         className="w-full h-full object-cover transition-transform duration-300 group-hover:scale-105"
                         loading="lazy"
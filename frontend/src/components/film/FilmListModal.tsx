@@ -1,6 +1,6 @@
 "use client";
 
-import { useState } from "react";
+import { useEffect, useState } from "react";
 import { useRouter } from "next/navigation";
 import { Film } from "@/types/film";
 import { List } from "@/types/list";
@@ -20,6 +20,15 @@ export default function FilmListModal({ onClose, onCreated, initialList }: Props
   const [loading, setLoading] = useState(false);
   const router = useRouter();
 
+  // The list endpoints only return counts, so load the current members to edit
+  useEffect(() => {
+    if (!initialList?.id || initialList.films) return;
+    fetch(`${process.env.NEXT_PUBLIC_API_URL}/api/lists/${initialList.id}/items/`)
+      .then((res) => res.json())
+      .then((data: Film[]) => setSelected(data))
+      .catch((error) => console.error("Error fetching list items:", error));
+  }, [initialList]);
+
   const handleSearch = async () => {
     if (!search.trim()) {
       setResults([]);
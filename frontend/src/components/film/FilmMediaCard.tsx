@@ -4,6 +4,7 @@ import { useState } from "react";
 import { FilmPhysical } from "@/types/filmMedia";
 import Link from "next/link";
 import ZoomableImageModal from "../ZoomableImageModal";
+import { variantSrc } from "@/utils/images";
 
 type FilmMediaCardProps = {
   filmMedia: FilmPhysical;
@@ -26,7 +27,7 @@ export default function FilmMediaCard({
       {filmMedia.cover_art && (
         <div onClick={() => setShowModal(true)} className="cursor-pointer">
           <img
-            src={filmMedia.cover_art}
+            src={variantSrc(filmMedia.cover_art_variants, filmMedia.cover_art)}
             alt={filmMedia.title}
             className="h-48 sm:h-64 object-contain mb-3"
           />
@@ -35,7 +36,7 @@ export default function FilmMediaCard({
 
       {showModal && (
         <ZoomableImageModal
-          src={filmMedia.cover_art || "/placeholder.jpg"}
+          src={variantSrc(filmMedia.cover_art_variants, filmMedia.cover_art, "full") || "/placeholder.jpg"}
           alt={filmMedia.title}
           onClose={() => setShowModal(false)}
         />
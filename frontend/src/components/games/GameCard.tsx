@@ -5,6 +5,7 @@ import { Game } from "@/types/game";
 import Link from "next/link";
 import ZoomableImageModal from "../ZoomableImageModal";
 import { formatDate } from "@/utils/formatters";
+import { variantSrc } from "@/utils/images";
 
 type GameCardProps = {
   game: Game;
@@ -24,7 +25,7 @@ export default function GameCard({ game, onDelete }: GameCardProps) {
       {game.cover_art && (
         <div onClick={() => setShowModal(true)} className="cursor-pointer">
           <img
-            src={game.cover_art}
+            src={variantSrc(game.cover_art_variants, game.cover_art)}
             alt={game.title}
             className="h-48 sm:h-64 object-contain mb-3"
           />
@@ -33,7 +34,7 @@ export default function GameCard({ game, onDelete }: GameCardProps) {
 
       {showModal && (
         <ZoomableImageModal
-          src={game.cover_art || "/placeholder.jpg"}
+          src={variantSrc(game.cover_art_variants, game.cover_art, "full") || "/placeholder.jpg"}
           alt={game.title}
           onClose={() => setShowModal(false)}
         />
@@ -5,6 +5,7 @@ import { Instrument } from "@/types/instrument";
 import Link from "next/link";
 import ZoomableImageModal from "../ZoomableImageModal";
 import { formatPhrase } from "@/utils/formatters";
+import { variantSrc } from "@/utils/images";
 
 type InstrumentCardProps = {
   instrument: Instrument;
@@ -27,7 +28,7 @@ export default function InstrumentCard({
       {instrument.photo && (
         <div onClick={() => setShowModal(true)} className="cursor-pointer">
           <img
-            src={instrument.photo}
+            src={variantSrc(instrument.photo_variants, instrument.photo)}
             alt={instrument.name}
             className="h-48 sm:h-64 object-contain mb-3"
           />
@@ -36,7 +37,7 @@ export default function InstrumentCard({
 
       {showModal && (
         <ZoomableImageModal
-          src={instrument.photo || "/placeholder.jpg"}
+          src={variantSrc(instrument.photo_variants, instrument.photo, "full") || "/placeholder.jpg"}
           alt={instrument.name}
           onClose={() => setShowModal(false)}
         />
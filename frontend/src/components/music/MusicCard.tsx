@@ -5,6 +5,7 @@ import { Music } from "../../types/music";
 import Link from "next/link";
 import ZoomableImageModal from "../ZoomableImageModal";
 import { getLanguageName, getCountryName } from "@/utils/iso";
+import { variantSrc } from "@/utils/images";
 
 type MusicCardProps = {
   music: Music;
@@ -25,7 +26,7 @@ export default function MusicCard({ music, onDelete }: MusicCardProps) {
       {music.cover_art && (
         <div onClick={() => setShowModal(true)} className="cursor-pointer">
           <img
-            src={music.cover_art}
+            src={variantSrc(music.cover_art_variants, music.cover_art)}
             alt={`${music.title} - ${music.artist}`}
             className="h-48 sm:h-64 object-contain mb-3"
           />
@@ -34,7 +35,7 @@ export default function MusicCard({ music, onDelete }: MusicCardProps) {
 
       {showModal && (
         <ZoomableImageModal
-          src={music.cover_art || "/placeholder.jpg"}
+          src={variantSrc(music.cover_art_variants, music.cover_art, "full") || "/placeholder.jpg"}
           alt={`${music.title} - ${music.artist}`}
           onClose={() => setShowModal(false)}
         />
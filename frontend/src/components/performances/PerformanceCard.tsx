@@ -5,6 +5,7 @@ import { Performance } from "@/types/performance";
 import Link from "next/link";
 import { formatYear, formatDate, formatNumeral } from "@/utils/formatters";
 import ZoomableImageModal from "../ZoomableImageModal";
+import { variantSrc } from "@/utils/images";
 
 type PerformanceCardProps = {
   performance: Performance;
@@ -29,7 +30,7 @@ export default function PerformanceCard({
       {performance.images && (
         <div onClick={() => setShowModal(true)} className="cursor-pointer">
           <img
-            src={performance.images}
+            src={variantSrc(performance.images_variants, performance.images)}
             alt={performance.title}
             className="h-48 sm:h-64 object-contain mb-3"
           />
@@ -38,7 +39,7 @@ export default function PerformanceCard({
 
       {showModal && (
         <ZoomableImageModal
-          src={performance.images || "/placeholder.jpg"}
+          src={variantSrc(performance.images_variants, performance.images, "full") || "/placeholder.jpg"}
           alt={performance.title}
           onClose={() => setShowModal(false)}
         />
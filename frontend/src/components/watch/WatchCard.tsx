@@ -4,6 +4,7 @@ import { useState } from "react";
 import { Watch } from "../../types/watch";
 import Link from "next/link";
 import ZoomableImageModal from "../ZoomableImageModal";
+import { variantSrc } from "@/utils/images";
 
 type WatchCardProps = {
   watch: Watch;
@@ -23,7 +24,7 @@ export default function WatchCard({ watch, onDelete }: WatchCardProps) {
       {watch.photo && (
         <div onClick={() => setShowModal(true)} className="cursor-pointer">
           <img
-            src={watch.photo}
+            src={variantSrc(watch.photo_variants, watch.photo)}
             alt={watch.model}
             className="h-48 sm:h-64 object-contain mb-2 sm:mb-3"
           />
@@ -32,7 +33,7 @@ export default function WatchCard({ watch, onDelete }: WatchCardProps) {
 
       {showModal && (
         <ZoomableImageModal
-          src={watch.photo || "/placeholder.jpg"}
+          src={variantSrc(watch.photo_variants, watch.photo, "full") || "/placeholder.jpg"}
           alt={watch.model}
           onClose={() => setShowModal(false)}
         />
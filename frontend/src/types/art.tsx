@@ -1,3 +1,5 @@
+import { ImageVariants } from "@/utils/images";
+
 export type YearSpecificity = "exact" | "year" | "decade" | "century" | "millennium" | "unknown";
 
 export type Art = {
@@ -16,6 +18,7 @@ export type Art = {
     tags?: string[];
     price?: string;
     photo?: string;
+    photo_variants?: ImageVariants | null;
     link?: string;
     notes?: string;
     date_bought?: string;
@@ -1,3 +1,5 @@
+import { ImageVariants } from "@/utils/images";
+
 export type YearSpecificityChoices = "exact" | "year" | "decade" | "century" | "millenium" | "unknown"
 
 export type Book = {
@@ -19,6 +21,7 @@ export type Book = {
     page_count?: string;
     format?: string;
     cover?: string;
+    cover_variants?: ImageVariants | null;
     external_links?: string;
     ISBN?: string;
     synopsis?: string;
@@ -1,3 +1,5 @@
+import { ImageVariants } from "@/utils/images";
+
 export type FormatChoices = "hardcover" | "paperback" | "ebook" | "audiobook" | "other"
 
 export type BookCopy = {
@@ -11,6 +13,7 @@ export type BookCopy = {
     genre?: string[];
     page_count?: string;
     cover_image?: string;
+    cover_image_variants?: ImageVariants | null;
     price?: string;
     language?: string;
     country?: string;
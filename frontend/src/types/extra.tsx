@@ -1,3 +1,5 @@
+import { ImageVariants } from "@/utils/images";
+
 export type YearSpecificity = "exact" | "year" | "decade" | "century" | "millennium" | "unknown"
 
 export type Extra = {
@@ -13,4 +15,5 @@ export type Extra = {
     notes?: string;
     date_bought?: string;
     photo?: string;
+    photo_variants?: ImageVariants | null;
 }
\ No newline at end of file
@@ -1,3 +1,5 @@
+import { ImageVariants } from "@/utils/images";
+
 export type Cast = {
     actor: string;
     role: string;
@@ -34,7 +36,9 @@ export type Film = {
     country?: string;
     festival?: string;
     poster?: string;
+    poster_variants?: ImageVariants | null;
     background_pic?: string;
+    background_pic_variants?: ImageVariants | null;
     medium?: string;
     sound: boolean;
     colour: boolean;
@@ -1,3 +1,5 @@
+import { ImageVariants } from "@/utils/images";
+
 export type FilmPhysicalFormat = "dvd" | "blu-ray" | "4k" | "vhs" | "laserdisc" | "betamax" | "film" | "digital" | "other";
 export type FilmPhysicalType = "movie" | "series" | "documentary" | "short" | "other";
 
@@ -11,6 +13,7 @@ export type FilmPhysical = {
     genre?: string[];
     type: FilmPhysicalType;
     cover_art?: string;
+    cover_art_variants?: ImageVariants | null;
     price?: string;
     language?: string;
     country?: string;
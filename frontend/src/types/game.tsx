@@ -1,3 +1,5 @@
+import { ImageVariants } from "@/utils/images";
+
 export type PlatformChoices = "pc" | "playstation" | "xbox" | "nintendo" | "mobile" | "other"
 
 export type Game = {
@@ -12,6 +14,7 @@ export type Game = {
     release_date?: string;
     genre?: string[];
     cover_art?: string;
+    cover_art_variants?: ImageVariants | null;
     price?: string;
     language?: string;
     country?: string;
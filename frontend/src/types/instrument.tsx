@@ -1,3 +1,5 @@
+import { ImageVariants } from "@/utils/images";
+
 export type CategoryChoices = "string" | "keyboard" | "percussion" | "wind" | "brass" | "electronic" | "other"
 
 export type Instrument = {
@@ -13,6 +15,7 @@ export type Instrument = {
     owned: boolean;
     price?: string;
     photo?: string;
+    photo_variants?: ImageVariants | null;
     link?: string;
     notes?: string;
     date_bought?: string;
@@ -8,5 +8,8 @@ export type List = {
   category: string;
   films?: Film[];
   books?: Book[];
+  film_count?: number;
+  book_count?: number;
+  covers?: string[];
   created_at: string;
 }
\ No newline at end of file
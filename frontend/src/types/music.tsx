@@ -1,3 +1,5 @@
+import { ImageVariants } from "@/utils/images";
+
 export type MusicFormat = "vinyl" | "cd" | "cassette" | "8cm" | "digital" | "other";
 export type MusicType = "album" | "single" | "ep" | "live" | "compilation";
 
@@ -19,6 +21,7 @@ export type Music = {
     genre?: string[];
     length?: string;
     cover_art?: string;
+    cover_art_variants?: ImageVariants | null;
     price?: string;
     language?: string;
     country?: string;
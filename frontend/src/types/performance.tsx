@@ -1,3 +1,5 @@
+import { ImageVariants } from "@/utils/images";
+
 export type YearSpecificity = "exact" | "year" | "decade" | "century" | "millennium" | "unknown";
 
 export type Movement = {
@@ -44,6 +46,7 @@ export type Performance = {
     rating?: string;
     review?: string;
     images?: string;
+    images_variants?: ImageVariants | null;
     external_links?: string;
     year?: string;
     year_specificity?: YearSpecificity;
@@ -1,3 +1,5 @@
+import { ImageVariants } from "@/utils/images";
+
 export type Watch = {
     id?: number;
     brand: string;
@@ -9,6 +11,7 @@ export type Watch = {
     diameter?: string;
     price?: string;
     photo?: string;
+    photo_variants?: ImageVariants | null;
     link?: string;
     year?: number;
     movement?: string;
@@ -0,0 +1,14 @@
+// URL of an image's resized copies with a {variant} placeholder, e.g. "/api/images/{variant}.webp?s=..."
+export type ImageVariants = string;
+
+export type ImageVariant = "thumb" | "card" | "full";
+
+// Resized copy served by the API's image cache, falling back to the original URL
+export function variantSrc(
+    variants: ImageVariants | null | undefined,
+    fallback?: string | null,
+    size: ImageVariant = "card"
+): string | undefined {
+    if (variants) return `${process.env.NEXT_PUBLIC_API_URL}${variants.replace("{variant}", size)}`;
+    return fallback || undefined;
+}